@@ -10,25 +10,63 @@ Usage examples:
   python scripts/build_release.py              # auto-detect OS and build
   python scripts/build_release.py --dmg        # on macOS, also create a dmg if create-dmg is available
   python scripts/build_release.py --appimage   # on Linux, attempt AppImage packaging if appimagetool is available
+  python scripts/build_release.py --full-clean # drop dist/ and the build cache first
+
+Normal runs reuse PyInstaller's analysis cache in build/.pyinstaller-cache, so
+rebuilds after small code changes skip re-scanning the whole import graph.
 """
 
 from __future__ import annotations
 
 import argparse
+import os
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parent.parent
 ENTRYPOINT = ROOT / "scrubmeta" / "gui" / "app.py"
 DIST_DIR = ROOT / "dist"
 BUILD_DIR = ROOT / "build"
+# Stable PyInstaller work dir so the analysis cache survives across runs and CWDs
+WORK_DIR = BUILD_DIR / ".pyinstaller-cache"
 
 
-def run(cmd: list[str]) -> None:
+def run_async(cmd: list[str]) -> subprocess.Popen:
     print("$", " ".join(cmd))
-    subprocess.run(cmd, check=True)
+    return subprocess.Popen(cmd)
+
+
+def wait_all(procs: list[subprocess.Popen]) -> None:
+    """Wait for every process, then raise for the first one that failed."""
+    for proc in procs:
+        proc.wait()
+    for proc in procs:
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, proc.args)
+
+
+def run(cmd: list[str]) -> None:
+    wait_all([run_async(cmd)])
+
+
+# Env vars that point straight at an optional packaging tool, skipping the PATH search
+TOOL_ENV_OVERRIDES = {
+    "create-dmg": "METASCRUB_CREATE_DMG",
+    "appimagetool": "METASCRUB_APPIMAGETOOL",
+}
+
+
+@lru_cache(maxsize=None)
+def _which(tool: str) -> str | None:
+    """Resolve an optional tool once per process, honouring env overrides."""
+    override = os.environ.get(TOOL_ENV_OVERRIDES.get(tool, ""))
+    if override:
+        return override
+    return shutil.which(tool)
 
 
 def ensure_pyinstaller() -> None:
@@ -56,6 +94,8 @@ def build_mac(dmg: bool) -> None:
         "PyInstaller",
         "--windowed",
         "--noconfirm",
+        "--workpath",
+        str(WORK_DIR),
         "--name",
         "MetaScrub",
         *icon_arg(icns),
@@ -63,12 +103,13 @@ def build_mac(dmg: bool) -> None:
     ]
     run(cmd)
 
-    if dmg and shutil.which("create-dmg"):
+    create_dmg = _which("create-dmg") if dmg else None
+    if create_dmg:
         app_path = DIST_DIR / "MetaScrub.app"
         dmg_path = ROOT / "MetaScrub-macOS.dmg"
         if app_path.exists():
             run([
-                "create-dmg",
+                create_dmg,
                 "--overwrite",
                 "--volname",
                 "MetaScrub",
@@ -91,6 +132,8 @@ def build_windows() -> None:
         "-m",
         "PyInstaller",
         "--noconfirm",
+        "--workpath",
+        str(WORK_DIR),
         "--noconsole",
         "--name",
         "MetaScrub",
@@ -108,6 +151,8 @@ def build_linux(appimage: bool) -> None:
         "-m",
         "PyInstaller",
         "--noconfirm",
+        "--workpath",
+        str(WORK_DIR),
         "--name",
         "MetaScrub",
         *icon_arg(png),
@@ -115,23 +160,32 @@ def build_linux(appimage: bool) -> None:
     ]
     run(cmd)
 
-    if appimage and shutil.which("appimagetool"):
+    appimagetool = _which("appimagetool") if appimage else None
+    if appimagetool:
         appdir = DIST_DIR / "MetaScrub.AppDir"
         # Minimal AppDir setup using PyInstaller output; assumes dist/MetaScrub exists
         src = DIST_DIR / "MetaScrub"
         if src.exists():
             if appdir.exists():
                 shutil.rmtree(appdir)
-            shutil.copytree(src, appdir)
+            appdir.mkdir(parents=True)
             desktop = appdir / "MetaScrub.desktop"
-            desktop.write_text(
-                """[Desktop Entry]\nType=Application\nName=MetaScrub\nExec=MetaScrub\nIcon=icon\nTerminal=false\nCategories=Utility;""",
-                encoding="utf-8",
-            )
-            # copy icon if present
-            if png.exists():
-                shutil.copy(png, appdir / "icon.png")
-            run(["appimagetool", str(appdir), str(ROOT / "MetaScrub-Linux.AppImage")])
+            # Copy the bundle while the small AppDir files are written alongside it
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                futures = [
+                    pool.submit(shutil.copytree, src, appdir, dirs_exist_ok=True),
+                    pool.submit(
+                        desktop.write_text,
+                        """[Desktop Entry]\nType=Application\nName=MetaScrub\nExec=MetaScrub\nIcon=icon\nTerminal=false\nCategories=Utility;""",
+                        encoding="utf-8",
+                    ),
+                ]
+                # copy icon if present
+                if png.exists():
+                    futures.append(pool.submit(shutil.copy, png, appdir / "icon.png"))
+                for future in as_completed(futures):
+                    future.result()
+            run([appimagetool, str(appdir), str(ROOT / "MetaScrub-Linux.AppImage")])
         else:
             print("[warn] dist/MetaScrub not found; skipping AppImage")
     elif appimage:
@@ -147,12 +201,18 @@ def clean() -> None:
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Build MetaScrub GUI for current platform")
-    parser.add_argument("--clean", action="store_true", help="Remove previous dist/build before building")
+    parser.add_argument(
+        "--full-clean",
+        "--clean",
+        dest="full_clean",
+        action="store_true",
+        help="Remove previous dist/build (including the PyInstaller cache) before building",
+    )
     parser.add_argument("--dmg", action="store_true", help="(macOS) Also create a dmg if create-dmg is available")
     parser.add_argument("--appimage", action="store_true", help="(Linux) Attempt AppImage packaging if appimagetool is available")
     args = parser.parse_args()
 
-    if args.clean:
+    if args.full_clean:
         clean()
 
     ensure_pyinstaller()
@@ -2,13 +2,18 @@
 
 import argparse
 import sys
+from collections import Counter
 from pathlib import Path
-from typing import List
+from typing import List, Mapping
 
 from .core import CancelToken, ScrubCallbacks, scrub_path
 from .utils.result import ScrubResult, ResultType, ErrorCategory
 
 
+# Buffered per-file result lines written to stdout at once when not on a TTY
+OUTPUT_FLUSH_LINES = 4096
+
+
 def print_summary(results: List[ScrubResult]) -> None:
     """
     Print summary of scrubbing results.
@@ -16,10 +21,31 @@ def print_summary(results: List[ScrubResult]) -> None:
     Args:
         results: List of ScrubResults
     """
-    total = len(results)
-    success = sum(1 for r in results if r.result_type == ResultType.SUCCESS)
-    skipped = sum(1 for r in results if r.result_type == ResultType.SKIP)
-    errors = sum(1 for r in results if r.result_type == ResultType.ERROR)
+    counts: Counter = Counter()
+    category_counts: Counter = Counter()
+    for result in results:
+        counts[result.result_type] += 1
+        if result.result_type is ResultType.ERROR:
+            category_counts[result.error_category or ErrorCategory.PROCESSING_ERROR] += 1
+
+    print_summary_counts(counts, category_counts)
+
+
+def print_summary_counts(
+    counts: Mapping[ResultType, int],
+    category_counts: Mapping[ErrorCategory, int],
+) -> None:
+    """
+    Print summary from pre-aggregated tallies.
+
+    Args:
+        counts: Number of results per ResultType
+        category_counts: Number of errors per ErrorCategory
+    """
+    success = counts.get(ResultType.SUCCESS, 0)
+    skipped = counts.get(ResultType.SKIP, 0)
+    errors = counts.get(ResultType.ERROR, 0)
+    total = success + skipped + errors
 
     print("\n" + "=" * 60)
     print("SUMMARY")
@@ -31,12 +57,6 @@ def print_summary(results: List[ScrubResult]) -> None:
 
     # Break down errors by category
     if errors > 0:
-        error_results = [r for r in results if r.result_type == ResultType.ERROR]
-        category_counts = {}
-        for result in error_results:
-            cat = result.error_category or ErrorCategory.PROCESSING_ERROR
-            category_counts[cat] = category_counts.get(cat, 0) + 1
-
         print("\nError breakdown by category:")
         for category, count in sorted(category_counts.items(), key=lambda x: x[1], reverse=True):
             print(f"  {category.value}: {count}")
@@ -69,33 +89,60 @@ def scrub_command(args: argparse.Namespace) -> int:
         print(f"ERROR: Failed to create output directory: {e}")
         return 1
 
-    # Run scrubber through shared core
-    results: List[ScrubResult] = []
+    # Run scrubber through shared core. The summary already counts results
+    # by type, so only errors are tallied here, by category, as they stream in
+    category_counts: Counter = Counter()
+    error = ResultType.ERROR
+
+    # Per-file lines are written in blocks rather than one print() each;
+    # an interactive terminal still gets every line as it happens
+    lines: List[str] = []
+    flush_every = 1 if sys.stdout.isatty() else OUTPUT_FLUSH_LINES
+
+    def flush_lines() -> None:
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+            lines.clear()
 
     def handle_result(res: ScrubResult) -> None:
-        results.append(res)
-        print(res.format_line())
+        if res.result_type is error:
+            category_counts[res.error_category or ErrorCategory.PROCESSING_ERROR] += 1
+        if not args.summary_only:
+            lines.append(res.format_line())
+            if len(lines) >= flush_every:
+                flush_lines()
 
     callbacks = ScrubCallbacks(on_file_result=handle_result)
     cancel_token = CancelToken()
 
-    _, summary = scrub_path(
-        input_path=input_path,
-        output_dir=output_dir,
-        recursive=args.recursive,
-        keep_structure=args.keep_structure,
-        overwrite=args.overwrite,
-        dry_run=args.dry_run,
-        ffmpeg_cmd=args.ffmpeg_path,
-        callbacks=callbacks,
-        cancel_token=cancel_token,
-    )
+    try:
+        _, summary = scrub_path(
+            input_path=input_path,
+            output_dir=output_dir,
+            recursive=args.recursive,
+            keep_structure=args.keep_structure,
+            overwrite=args.overwrite,
+            dry_run=args.dry_run,
+            ffmpeg_cmd=args.ffmpeg_path,
+            callbacks=callbacks,
+            cancel_token=cancel_token,
+            workers=args.jobs,
+            collect_results=False,
+            allow_reflink=args.allow_reflink,
+        )
+    finally:
+        flush_lines()
 
     if summary.total == 0:
         print(f"No supported files found in: {input_path}")
         return 0
 
-    print_summary(results)
+    counts = {
+        ResultType.SUCCESS: summary.success,
+        ResultType.SKIP: summary.skipped,
+        ResultType.ERROR: summary.errors,
+    }
+    print_summary_counts(counts, category_counts)
 
     if summary.errors:
         return 1
@@ -148,6 +195,24 @@ def main() -> None:
         default="ffmpeg",
         help="Path or command name for ffmpeg (used for audio/video scrubbing; default: ffmpeg in PATH)",
     )
+    scrub_parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Scrub N files in parallel worker processes (0 = serial, -1 = one per CPU; dry runs are always serial)",
+    )
+    scrub_parser.add_argument(
+        "--allow-reflink",
+        action="store_true",
+        help="Clone files that need no changes via copy-on-write (APFS, Btrfs, XFS) instead of copying",
+    )
+    scrub_parser.add_argument(
+        "--summary-only",
+        action="store_true",
+        help="Only print the final summary instead of one line per file",
+    )
 
     args = parser.parse_args()
 
@@ -0,0 +1,26 @@
+"""File extensions handled by each scrubber, shared by discovery and dispatch."""
+
+from typing import FrozenSet
+
+# Lowercase, dot-prefixed suffixes as returned by os.path.splitext()
+
+JPEG_EXTENSIONS: FrozenSet[str] = frozenset({'.jpg', '.jpeg'})
+PNG_EXTENSIONS: FrozenSet[str] = frozenset({'.png'})
+WEBP_EXTENSIONS: FrozenSet[str] = frozenset({'.webp'})
+IMAGE_EXTENSIONS: FrozenSet[str] = JPEG_EXTENSIONS | PNG_EXTENSIONS | WEBP_EXTENSIONS
+
+PDF_EXTENSIONS: FrozenSet[str] = frozenset({'.pdf'})
+
+OOXML_EXTENSIONS: FrozenSet[str] = frozenset({'.docx', '.xlsx', '.pptx'})
+
+VIDEO_EXTENSIONS: FrozenSet[str] = frozenset({
+    '.mp4', '.mov', '.mkv', '.avi', '.m4v', '.webm', '.mpg', '.mpeg',
+})
+AUDIO_EXTENSIONS: FrozenSet[str] = frozenset({
+    '.mp3', '.wav', '.flac', '.m4a', '.aac', '.ogg', '.opus',
+})
+MEDIA_EXTENSIONS: FrozenSet[str] = VIDEO_EXTENSIONS | AUDIO_EXTENSIONS
+# ISO base media / QuickTime containers the media scrubber edits in place
+MP4_EXTENSIONS: FrozenSet[str] = frozenset({'.mp4', '.m4a', '.m4v', '.mov'})
+
+SUPPORTED_EXTENSIONS: FrozenSet[str] = IMAGE_EXTENSIONS | PDF_EXTENSIONS | OOXML_EXTENSIONS | MEDIA_EXTENSIONS
@@ -2,17 +2,28 @@
 
 from __future__ import annotations
 
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from dataclasses import dataclass
+from functools import lru_cache, partial
+from multiprocessing.context import BaseContext
 import os
 from pathlib import Path
-from typing import Callable, List, Optional, Tuple
+import stat
+import sys
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from .scrubbers import ImageScrubber, PDFScrubber, OOXMLScrubber, MediaScrubber
 from .utils.file_utils import FileDiscovery, OutputManager
 from .utils.result import ResultType, ScrubResult, ErrorCategory
 
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# Most files handed to a pool worker in one task; bounds how long a
+# cancelled run keeps going and how bursty results are
+PARALLEL_CHUNK_MAX = 16
+
+
+@dataclass(**_SLOTS)
 class ScrubCallbacks:
     """Optional callbacks invoked during scrubbing."""
 
@@ -24,22 +35,33 @@ class ScrubCallbacks:
 
 
 class CancelToken:
-    """Cooperative cancellation token checked between file operations."""
+    """Cooperative cancellation token checked between file operations.
+
+    A plain flag: nothing ever waits on it, so there's no need for a
+    threading.Event and the lock its set() takes. Assigning and reading one
+    attribute is atomic, so cancel() can still be called from any thread.
+    """
+
+    __slots__ = ("_cancelled",)
 
     def __init__(self) -> None:
         self._cancelled = False
 
     def cancel(self) -> None:
-        """Request cancellation."""
+        """Request cancellation (safe to call from any thread)."""
         self._cancelled = True
 
+    def is_set(self) -> bool:
+        """Return whether cancellation was requested; bind it for polling loops."""
+        return self._cancelled
+
     @property
     def cancelled(self) -> bool:
         """Return whether cancellation was requested."""
         return self._cancelled
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ScrubSummary:
     """Aggregate summary for a scrubbing run."""
 
@@ -53,7 +75,12 @@ class ScrubSummary:
 class CoreScrubber:
     """Main scrubbing orchestrator for reusable core logic."""
 
-    def __init__(self, ffmpeg_cmd: str = "ffmpeg") -> None:
+    def __init__(
+        self,
+        ffmpeg_cmd: str = "ffmpeg",
+        allow_reflink: bool = False,
+        scrubber_override: Optional[Callable[[Path, Path], ScrubResult]] = None,
+    ) -> None:
         self.scrubbers = [
             ImageScrubber,
             PDFScrubber,
@@ -61,17 +88,46 @@ class CoreScrubber:
             MediaScrubber,
         ]
         self.ffmpeg_cmd = ffmpeg_cmd
+        self.allow_reflink = allow_reflink
+        self.scrubber_override = scrubber_override
+        # Media files go to ffmpeg in batches unless an override scrubs every file
+        self._batch_media = scrubber_override is None
+        # Extra keyword arguments each scrubber's scrub() accepts
+        self._scrub_kwargs: Dict[type, dict] = {
+            MediaScrubber: {"ffmpeg_cmd": ffmpeg_cmd, "allow_reflink": allow_reflink},
+            ImageScrubber: {"allow_reflink": allow_reflink},
+            PDFScrubber: {"allow_reflink": allow_reflink},
+            OOXMLScrubber: {"allow_reflink": allow_reflink},
+        }
+        # Suffix -> scrubber, so dispatch is one dict lookup per file
+        self._dispatch: Dict[str, type] = {
+            suffix: scrubber_class
+            for scrubber_class in self.scrubbers
+            for suffix in scrubber_class.SUPPORTED_FORMATS
+        }
+        # Each scrubber's scrub() with this run's options already bound, so a
+        # file costs one lookup and a call, not a kwargs fetch and unpack
+        scrub_by_class: Dict[type, Callable[..., ScrubResult]] = {
+            scrubber_class: partial(_call_override, scrubber_override)
+            if scrubber_override
+            else partial(scrubber_class.scrub, **self._scrub_kwargs.get(scrubber_class, {}))
+            for scrubber_class in self.scrubbers
+        }
+        self._scrub_by_suffix = {
+            suffix: scrub_by_class[scrubber_class] for suffix, scrubber_class in self._dispatch.items()
+        }
+
+    def scrub_file(self, input_path: Path, output_path: Path, exclusive: bool = False) -> ScrubResult:
+        """
+        Find the appropriate scrubber for a single file and run it.
 
-    def scrub_file(self, input_path: Path, output_path: Path) -> ScrubResult:
-        """Find the appropriate scrubber for a single file and run it."""
-        # Handle MediaScrubber separately since it needs the ffmpeg_cmd argument
-        if MediaScrubber.can_handle(input_path):
-            return MediaScrubber.scrub(input_path, output_path, ffmpeg_cmd=self.ffmpeg_cmd)
-
-        # Try other scrubbers (they don't need special arguments)
-        for scrubber_class in [ImageScrubber, PDFScrubber, OOXMLScrubber]:
-            if scrubber_class.can_handle(input_path):
-                return scrubber_class.scrub(input_path, output_path)
+        With exclusive, an existing file at output_path is never replaced;
+        the output goes to the next free "_clean_N" name instead.
+        """
+        # Path.suffix, like discovery, gives dotfiles such as ".jpg" no suffix
+        scrub = self._scrub_by_suffix.get(input_path.suffix.lower())
+        if scrub is not None:
+            return scrub(input_path, output_path, exclusive=exclusive)
 
         return ScrubResult(
             result_type=ResultType.SKIP,
@@ -79,6 +135,31 @@ class CoreScrubber:
             reason=f"Unsupported file type: {input_path.suffix}",
         )
 
+    def scrub_files(self, jobs: List[Tuple[Path, Path]], exclusive: bool = False) -> List[ScrubResult]:
+        """
+        Scrub (input, output) pairs, returning results in the same order.
+
+        Media files among them share one ffmpeg process via
+        MediaScrubber.scrub_batch(); everything else goes through scrub_file().
+        """
+        results: List[Optional[ScrubResult]] = [None] * len(jobs)
+        media: List[int] = []
+        for index, (input_path, output_path) in enumerate(jobs):
+            if self._batch_media and self._dispatch.get(input_path.suffix.lower()) is MediaScrubber:
+                media.append(index)
+            else:
+                results[index] = self.scrub_file(input_path, output_path, exclusive)
+
+        if media:
+            media_jobs = [jobs[index] for index in media]
+            media_results = MediaScrubber.scrub_batch(
+                media_jobs, ffmpeg_cmd=self.ffmpeg_cmd, allow_reflink=self.allow_reflink,
+                exclusive=exclusive,
+            )
+            for index, result in zip(media, media_results):
+                results[index] = result
+        return results  # type: ignore[return-value]
+
     def _make_error_response(
         self,
         input_path: Path,
@@ -102,59 +183,337 @@ class CoreScrubber:
             callbacks.on_done(summary)
         return [error_result], summary
 
-    def _process_files(
+    def _output_namer(self, output_manager: OutputManager) -> Callable[[str, Optional[str]], str]:
+        """
+        Pick how output paths are assigned for this run.
+
+        The built-in scrubbers publish exclusively, claiming the name when
+        the file is linked into place, so reserve_output() needn't touch the
+        disk. A scrubber_override writes its own output and can't do that, so
+        its names are checked on disk up front instead.
+        """
+        if self.scrubber_override:
+            return output_manager.get_output_path_str
+        return output_manager.reserve_output
+
+    def _iter_serial(
         self,
-        files: List[Path],
+        files: Iterable[Path],
+        total: int,
         output_manager: OutputManager,
         base_input_dir: Path,
-        dry_run: bool,
         callbacks: ScrubCallbacks,
         cancel_token: CancelToken,
-    ) -> Tuple[List[ScrubResult], ScrubSummary]:
-        """Process all discovered files and return results with summary."""
-        results: List[ScrubResult] = []
-        success = skipped = errors = 0
-        cancelled = False
-        total = len(files)
+    ) -> Iterator[ScrubResult]:
+        """Scrub files one at a time in the calling thread."""
+        on_file_start = callbacks.on_file_start
+        base_str = os.fspath(base_input_dir)
+
+        reserve_output = self._output_namer(output_manager)
+        # Outputs are claimed when published, so nothing is left behind if
+        # a scrub raises or the run is interrupted
+        exclusive = not output_manager.overwrite
+        is_cancelled = cancel_token.is_set
+        dispatch = self._dispatch
+        batch_media = self._batch_media
+        # Consecutive media files are queued and handed to ffmpeg in
+        # batches, one process each. The queue is flushed before any other
+        # file is scrubbed, so results still come out in discovery order,
+        # and on_file_start fires for queued files only when their batch runs.
+        media_batch: List[Tuple[int, Path, Path]] = []
 
         for index, file_path in enumerate(files, start=1):
-            if cancel_token.cancelled:
-                cancelled = True
+            # Checked every file: a real scrub costs far more than the poll
+            if is_cancelled():
                 break
 
-            if callbacks.on_file_start:
-                callbacks.on_file_start(index, total, file_path)
+            output_path = Path(reserve_output(os.fspath(file_path), base_str))
 
-            output_path = output_manager.get_output_path(file_path, base_input_dir)
+            if batch_media and dispatch.get(file_path.suffix.lower()) is MediaScrubber:
+                media_batch.append((index, file_path, output_path))
+                if len(media_batch) >= MediaScrubber.BATCH_SIZE:
+                    yield from self._flush_media(media_batch, total, on_file_start, exclusive)
+                continue
 
-            if dry_run:
-                result = ScrubResult(
-                    result_type=ResultType.SKIP,
-                    input_path=file_path,
-                    output_path=output_path,
-                    reason="dry-run (no changes written)",
-                )
-            else:
-                result = self.scrub_file(file_path, output_path)
+            if media_batch:
+                yield from self._flush_media(media_batch, total, on_file_start, exclusive)
+                # A result callback may have cancelled the run
+                if is_cancelled():
+                    break
+
+            if on_file_start:
+                on_file_start(index, total, file_path)
+            yield self.scrub_file(file_path, output_path, exclusive)
+
+        # Queued media files haven't started yet, so a cancel drops them
+        if not is_cancelled():
+            yield from self._flush_media(media_batch, total, on_file_start, exclusive)
+
+    def _flush_media(
+        self,
+        media_batch: List[Tuple[int, Path, Path]],
+        total: int,
+        on_file_start: Optional[Callable[[int, int, Path], None]],
+        exclusive: bool,
+    ) -> Iterator[ScrubResult]:
+        """Scrub queued (index, input, output) media files with one ffmpeg process and empty the queue."""
+        if not media_batch:
+            return
+        if on_file_start:
+            for index, file_path, _ in media_batch:
+                on_file_start(index, total, file_path)
+        results = MediaScrubber.scrub_batch(
+            [(file_path, output_path) for _, file_path, output_path in media_batch],
+            ffmpeg_cmd=self.ffmpeg_cmd, allow_reflink=self.allow_reflink, exclusive=exclusive,
+        )
+        media_batch.clear()
+        yield from results
+
+    def _iter_parallel(
+        self,
+        files: Iterable[Path],
+        total: int,
+        output_manager: OutputManager,
+        base_input_dir: Path,
+        workers: int,
+        callbacks: ScrubCallbacks,
+        cancel_token: CancelToken,
+        mp_context: Optional[BaseContext] = None,
+    ) -> Iterator[ScrubResult]:
+        """
+        Scrub files across a process pool, yielding results as they complete.
+
+        Files are sent to the pool in chunks (about four per worker over the
+        run, at most PARALLEL_CHUNK_MAX files each) so a batch of small files
+        doesn't pay one round-trip to a worker process per file, and the
+        media files in a chunk share one ffmpeg process. At most
+        ``2 * workers`` chunks are in flight so cancellation takes effect
+        quickly and ``on_file_start`` still reflects real submissions.
+        Output paths are assigned here, in the parent, so collision handling
+        stays consistent with serial runs.
+        """
+        pending: Dict[Future, List[Path]] = {}
+        queue = enumerate(files, start=1)
+        on_file_start = callbacks.on_file_start
+        reserve_output = self._output_namer(output_manager)
+        exclusive = not output_manager.overwrite
+        is_cancelled = cancel_token.is_set
+        base_str = os.fspath(base_input_dir)
+        # Unknown totals (lazy discovery) go one file per task
+        chunk_size = max(1, min(PARALLEL_CHUNK_MAX, total // (workers * 4))) if total > 0 else 1
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+
+            def submit_next() -> None:
+                chunk: List[Tuple[Path, Path]] = []
+                for index, file_path in queue:
+                    if on_file_start:
+                        on_file_start(index, total, file_path)
+                    chunk.append((file_path, Path(reserve_output(os.fspath(file_path), base_str))))
+                    if len(chunk) >= chunk_size:
+                        break
+                if chunk:
+                    future = executor.submit(
+                        _scrub_chunk, self.ffmpeg_cmd, self.allow_reflink, self.scrubber_override,
+                        exclusive, chunk,
+                    )
+                    pending[future] = [file_path for file_path, _ in chunk]
+
+            for _ in range(workers * 2):
+                submit_next()
+
+            def finish(future: Future) -> Iterator[ScrubResult]:
+                chunk = pending.pop(future)
+                try:
+                    results = future.result()
+                except Exception as e:  # pylint: disable=broad-except
+                    results = [
+                        ScrubResult(
+                            result_type=ResultType.ERROR,
+                            input_path=file_path,
+                            error=f"Worker failed: {type(e).__name__}: {e}",
+                            error_category=ErrorCategory.PROCESSING_ERROR,
+                            fix_hint="Retry without parallel workers",
+                        )
+                        for file_path in chunk
+                    ]
+                yield from results
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if is_cancelled():
+                        # Drop queued chunks; ones already running still finish,
+                        # and their results are reported like any other
+                        for queued in list(pending):
+                            if queued.cancel():
+                                del pending[queued]
+                        for running in list(pending):
+                            yield from finish(running)
+                        return
+
+                    yield from finish(future)
+                    submit_next()
+
+    def _process_files(
+        self,
+        files: Iterable[Path],
+        output_manager: OutputManager,
+        base_input_dir: Path,
+        dry_run: bool,
+        callbacks: ScrubCallbacks,
+        cancel_token: CancelToken,
+        workers: int = 1,
+        collect_results: bool = True,
+        total: Optional[int] = None,
+        mp_context: Optional[BaseContext] = None,
+    ) -> Tuple[List[ScrubResult], ScrubSummary]:
+        """
+        Process all discovered files and return results with summary.
 
-            results.append(result)
+        ``files`` may be a lazy iterable; pass ``total=-1`` when its length is
+        unknown, in which case callbacks receive -1 as the total and the
+        summary total is the number of files actually processed.
+        """
+        results: List[ScrubResult] = []
+        success = skipped = errors = processed = 0
+        if total is None:
+            total = len(files)
+
+        if dry_run:
+            return self._process_files_dry_run(
+                files, total, output_manager, base_input_dir, callbacks, cancel_token,
+                collect_results,
+            )
+
+        if workers > 1 and total != 0 and total != 1:
+            result_iter = self._iter_parallel(
+                files, total, output_manager, base_input_dir, workers, callbacks, cancel_token,
+                mp_context,
+            )
+        else:
+            result_iter = self._iter_serial(
+                files, total, output_manager, base_input_dir, callbacks, cancel_token
+            )
 
-            if result.result_type == ResultType.SUCCESS:
+        on_file_result = callbacks.on_file_result
+        on_progress = callbacks.on_progress
+        # Emit at most ~200 progress updates per run (plus the final one);
+        # each may cross a thread boundary in the GUI
+        progress_stride = max(1, total // 200) if total > 0 else 1
+        success_type = ResultType.SUCCESS
+        skip_type = ResultType.SKIP
+
+        for processed, result in enumerate(result_iter, start=1):
+            if collect_results:
+                results.append(result)
+
+            result_type = result.result_type
+            if result_type is success_type:
                 success += 1
-            elif result.result_type == ResultType.SKIP:
+            elif result_type is skip_type:
                 skipped += 1
             else:
                 errors += 1
 
-            if callbacks.on_file_result:
-                callbacks.on_file_result(result)
+            if on_file_result:
+                on_file_result(result)
+
+            if on_progress and (processed % progress_stride == 0 or processed == total):
+                on_progress(processed, total)
+
+        summary = self._finish(
+            total, processed, success, skipped, errors, callbacks, cancel_token
+        )
+        return results, summary
+
+    def _process_files_dry_run(
+        self,
+        files: Iterable[Path],
+        total: int,
+        output_manager: OutputManager,
+        base_input_dir: Path,
+        callbacks: ScrubCallbacks,
+        cancel_token: CancelToken,
+        collect_results: bool,
+    ) -> Tuple[List[ScrubResult], ScrubSummary]:
+        """
+        Enumerate files for a dry run.
+
+        Nothing is scrubbed, so this only pays for what a caller can observe:
+        output paths and SKIP results are built only when they are collected
+        or delivered through on_file_result.
+        """
+        results: List[ScrubResult] = []
+        processed = 0
+        on_file_start = callbacks.on_file_start
+        on_file_result = callbacks.on_file_result
+        on_progress = callbacks.on_progress
+        progress_stride = max(1, total // 200) if total > 0 else 1
+        want_results = collect_results or on_file_result is not None
+
+        get_output_path = output_manager.get_output_path_str
+        base_str = os.fspath(base_input_dir)
+        skip = ResultType.SKIP
+        reason = "dry-run (no changes written)"
+        append = results.append
+
+        # Per-file callbacks may cancel synchronously, so poll every file
+        # when any are bound; otherwise only a background thread can cancel,
+        # and polling every 64 files (plus after each progress callback) is
+        # plenty responsive
+        is_cancelled = cancel_token.is_set
+        poll_every_file = on_file_start is not None or on_file_result is not None
+        poll_next = True
 
-            if callbacks.on_progress:
-                callbacks.on_progress(index, total)
+        for index, file_path in enumerate(files, start=1):
+            if (poll_every_file or poll_next or not index & 63) and is_cancelled():
+                break
+            poll_next = False
+            processed = index
 
-        # Mark remaining as skipped if cancelled mid-run
-        if cancelled and len(results) < total:
-            skipped += total - len(results)
+            if on_file_start:
+                on_file_start(index, total, file_path)
+
+            if want_results:
+                result = ScrubResult(
+                    result_type=skip,
+                    input_path=file_path,
+                    output_path=Path(get_output_path(os.fspath(file_path), base_str)),
+                    reason=reason,
+                )
+                if collect_results:
+                    append(result)
+                if on_file_result:
+                    on_file_result(result)
+
+            if on_progress and (processed % progress_stride == 0 or processed == total):
+                on_progress(processed, total)
+                poll_next = True
+
+        summary = self._finish(total, processed, 0, processed, 0, callbacks, cancel_token)
+        return results, summary
+
+    @staticmethod
+    def _finish(
+        total: int,
+        processed: int,
+        success: int,
+        skipped: int,
+        errors: int,
+        callbacks: ScrubCallbacks,
+        cancel_token: CancelToken,
+    ) -> ScrubSummary:
+        """Build the run summary and fire on_done."""
+        if total < 0:
+            # Lazily discovered: the real total is whatever was reached
+            total = processed
+            cancelled = cancel_token.cancelled
+        else:
+            # Mark remaining as skipped if cancelled mid-run
+            cancelled = processed < total
+            if cancelled:
+                skipped += total - processed
 
         summary = ScrubSummary(
             total=total,
@@ -167,7 +526,7 @@ class CoreScrubber:
         if callbacks.on_done:
             callbacks.on_done(summary)
 
-        return results, summary
+        return summary
 
     def scrub_path(
         self,
@@ -179,6 +538,10 @@ class CoreScrubber:
         dry_run: bool = False,
         callbacks: Optional[ScrubCallbacks] = None,
         cancel_token: Optional[CancelToken] = None,
+        workers: int = 1,
+        collect_results: bool = True,
+        progress_total_required: bool = True,
+        mp_context: Optional[BaseContext] = None,
     ) -> Tuple[List[ScrubResult], ScrubSummary]:
         """
         Scrub metadata from a path (file or directory).
@@ -192,6 +555,18 @@ class CoreScrubber:
             dry_run: Simulate run without writing files
             callbacks: Optional callbacks for progress and results
             cancel_token: Cancellation token, checked between files
+            workers: Number of worker processes; 1 runs serially in the
+                calling thread, -1 uses os.cpu_count()
+            collect_results: Keep every ScrubResult in the returned list; when
+                False results are only delivered through on_file_result and
+                the list is empty, keeping memory flat for large runs
+            progress_total_required: Discover every file up front so callbacks
+                get the real total; when False files are scrubbed while the
+                tree is still being walked and totals are reported as -1
+            mp_context: multiprocessing context for the worker pool; pass a
+                "spawn" (or "forkserver") context when calling from a
+                multi-threaded process such as the GUI, where forking the
+                default way can deadlock the workers
 
         Returns:
             (list of results, summary)
@@ -199,24 +574,34 @@ class CoreScrubber:
         callbacks = callbacks or ScrubCallbacks()
         cancel_token = cancel_token or CancelToken()
 
-        # Validate input path exists
-        if not input_path.exists():
+        # Validate input path exists; one stat answers existence, type and mode
+        try:
+            st = os.stat(input_path)
+        except (FileNotFoundError, NotADirectoryError):
             return self._make_error_response(
                 input_path, "Input path does not exist",
                 ErrorCategory.INPUT_ERROR, "Verify the path is correct", callbacks
             )
+        except OSError:
+            st = None
 
         # Validate read permissions
-        if not os.access(input_path, os.R_OK):
+        if st is None or not (_owner_can_read(st) or os.access(input_path, os.R_OK)):
             return self._make_error_response(
                 input_path, "Cannot read input path (permission denied)",
                 ErrorCategory.PERMISSION_ERROR,
                 "Check permissions or run with appropriate privileges", callbacks
             )
+        is_dir = stat.S_ISDIR(st.st_mode)
 
         # Discover files
         try:
-            files = FileDiscovery.discover_files(input_path, recursive)
+            if progress_total_required:
+                files = FileDiscovery.discover_files(input_path, recursive, is_dir=is_dir)
+                total = len(files)
+            else:
+                files = FileDiscovery.iter_files(input_path, recursive, is_dir=is_dir)
+                total = -1
         except OSError as e:
             return self._make_error_response(
                 input_path, f"Failed to scan directory: {type(e).__name__}: {e}",
@@ -225,16 +610,59 @@ class CoreScrubber:
             )
 
         if callbacks.on_scan_start:
-            callbacks.on_scan_start(len(files))
+            callbacks.on_scan_start(total)
 
         output_manager = OutputManager(output_dir, overwrite, keep_structure)
-        base_input_dir = input_path if input_path.is_dir() else input_path.parent
+        base_input_dir = input_path if is_dir else input_path.parent
+
+        if workers < 0:
+            workers = os.cpu_count() or 1
 
         return self._process_files(
-            files, output_manager, base_input_dir, dry_run, callbacks, cancel_token
+            files, output_manager, base_input_dir, dry_run, callbacks, cancel_token,
+            workers, collect_results, total, mp_context,
         )
 
 
+def _owner_can_read(st: os.stat_result) -> bool:
+    """Cheap readability check from mode bits, avoiding an access() syscall."""
+    getuid = getattr(os, "getuid", None)
+    return getuid is not None and st.st_uid == getuid() and bool(st.st_mode & stat.S_IRUSR)
+
+
+@lru_cache(maxsize=None)
+def _get_scrubber(
+    ffmpeg_cmd: str,
+    allow_reflink: bool,
+    scrubber_override: Optional[Callable[[Path, Path], ScrubResult]] = None,
+) -> CoreScrubber:
+    """Return a CoreScrubber reused for every task handled by this process."""
+    return CoreScrubber(
+        ffmpeg_cmd=ffmpeg_cmd, allow_reflink=allow_reflink, scrubber_override=scrubber_override
+    )
+
+
+def _scrub_chunk(
+    ffmpeg_cmd: str,
+    allow_reflink: bool,
+    scrubber_override: Optional[Callable[[Path, Path], ScrubResult]],
+    exclusive: bool,
+    jobs: List[Tuple[Path, Path]],
+) -> List[ScrubResult]:
+    """Scrub (input, output) pairs in order; module-level so it can be pickled into pool workers."""
+    return _get_scrubber(ffmpeg_cmd, allow_reflink, scrubber_override).scrub_files(jobs, exclusive)
+
+
+def _call_override(
+    scrubber_override: Callable[[Path, Path], ScrubResult],
+    input_path: Path,
+    output_path: Path,
+    exclusive: bool = False,
+) -> ScrubResult:
+    """Run a scrubber_override; its output name was checked on disk, so exclusive isn't passed on."""
+    return scrubber_override(input_path, output_path)
+
+
 def scrub_path(
     input_path: Path,
     output_dir: Path,
@@ -245,9 +673,23 @@ def scrub_path(
     ffmpeg_cmd: str = "ffmpeg",
     callbacks: Optional[ScrubCallbacks] = None,
     cancel_token: Optional[CancelToken] = None,
+    workers: int = 1,
+    collect_results: bool = True,
+    allow_reflink: bool = False,
+    progress_total_required: bool = True,
+    scrubber_override: Optional[Callable[[Path, Path], ScrubResult]] = None,
+    mp_context: Optional[BaseContext] = None,
 ) -> Tuple[List[ScrubResult], ScrubSummary]:
-    """Convenience function to run scrubbing with the core orchestrator."""
-    scrubber = CoreScrubber(ffmpeg_cmd=ffmpeg_cmd)
+    """
+    Convenience function to run scrubbing with the core orchestrator.
+
+    ``scrubber_override``, if given, is called as ``(input_path, output_path)``
+    for every supported file in place of the built-in scrubbers (for tests
+    and embedding); it must be picklable when ``workers > 1``.
+    """
+    scrubber = CoreScrubber(
+        ffmpeg_cmd=ffmpeg_cmd, allow_reflink=allow_reflink, scrubber_override=scrubber_override
+    )
     return scrubber.scrub_path(
         input_path=input_path,
         output_dir=output_dir,
@@ -257,4 +699,8 @@ def scrub_path(
         dry_run=dry_run,
         callbacks=callbacks,
         cancel_token=cancel_token,
+        workers=workers,
+        collect_results=collect_results,
+        progress_total_required=progress_total_required,
+        mp_context=mp_context,
     )
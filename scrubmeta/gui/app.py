@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import multiprocessing
 import sys
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QIcon, QPixmap, QPainter, QFont
 from PySide6.QtWidgets import QApplication
 
@@ -11,13 +12,8 @@ from .main_window import MainWindow
 from .theme import apply_theme
 
 
-def main() -> None:
-    """Run the GUI application with synthwave theme."""
-    # Note: High DPI scaling is enabled by default in Qt 6
-
-    app = QApplication(sys.argv)
-
-    # Set application icon for dock/taskbar
+def _install_icon(app: QApplication) -> None:
+    """Render the emoji app icon and set it for dock/taskbar."""
     pixmap = QPixmap(128, 128)
     pixmap.fill(Qt.transparent)
     painter = QPainter(pixmap)
@@ -26,11 +22,24 @@ def main() -> None:
     painter.end()
     app.setWindowIcon(QIcon(pixmap))
 
+
+def main() -> None:
+    """Run the GUI application with synthwave theme."""
+    # Note: High DPI scaling is enabled by default in Qt 6
+
+    # Scrubs run in a process pool; frozen builds must handle worker start-up here
+    multiprocessing.freeze_support()
+
+    app = QApplication(sys.argv)
+
     # Apply synthwave theme
     apply_theme(app)
 
     window = MainWindow()
     window.show()
+
+    # Font-engine init for the icon is slow on cold start; keep it off the first paint
+    QTimer.singleShot(0, lambda: _install_icon(app))
     sys.exit(app.exec())
 
 
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import json
-import csv
+import stat
 from pathlib import Path
+from typing import Callable
 
-from PySide6.QtCore import QCoreApplication, QSettings, Qt, QThread, QUrl, QPropertyAnimation, QSequentialAnimationGroup, QEasingCurve, QTimer
-from PySide6.QtGui import QDesktopServices, QColor, QPainter, QRadialGradient, QIcon, QPixmap, QFont, QDragEnterEvent, QDropEvent
+import numpy as np
+from PySide6.QtCore import QAbstractAnimation, QCoreApplication, QEvent, QObject, QSettings, Qt, QThread, QThreadPool, QUrl, Signal, QTimer, QRect, QRectF, QSize
+from PySide6.QtGui import QDesktopServices, QColor, QPainter, QRadialGradient, QRegion, QIcon, QImage, QPixmap, QFont, QFontMetrics, QDragEnterEvent, QDropEvent
 from PySide6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -15,6 +16,7 @@ from PySide6.QtWidgets import (
     QFileDialog,
     QFormLayout,
     QGraphicsDropShadowEffect,
+    QGraphicsScene,
     QGroupBox,
     QHBoxLayout,
     QHeaderView,
@@ -29,13 +31,14 @@ from PySide6.QtWidgets import (
     QWidget,
     QSplitter,
     QScrollArea,
+    QStackedWidget,
 )
 
 from .models import ResultFilterProxy, ResultsTableModel
-from .worker import ScrubWorker
-from .theme import Colors
-from .stars_background import Star
-import random
+from .worker import ReportExporter, ScrubWorker
+from .theme import Colors, get_window_qss
+from .stars_background import StarField
+from .stars_gl import GLStarsCentralWidget, gl_stars_enabled
 
 
 class DragDropLineEdit(QLineEdit):
@@ -73,51 +76,199 @@ class DragDropLineEdit(QLineEdit):
             event.ignore()
 
 
+# Blur radii for one in-and-out pulse of the logo glow
+LOGO_GLOW_RADII = (5, 10, 15, 20, 25, 30, 25, 20, 15, 10)
+
+
+def _render_logo_frame(text: str, font: QFont, size: QSize, dpr: float, blur_radius: float) -> QPixmap:
+    """Render the logo glyph with a magenta glow of the given blur radius."""
+    glyph = QPixmap(size * dpr)
+    glyph.setDevicePixelRatio(dpr)
+    glyph.fill(Qt.transparent)
+    painter = QPainter(glyph)
+    painter.setFont(font)
+    painter.setPen(QColor(Colors.PRIMARY))
+    painter.drawText(QRect(0, 0, size.width(), size.height()), Qt.AlignCenter, text)
+    painter.end()
+
+    # Let Qt's drop shadow do the blur offscreen, once per frame
+    scene = QGraphicsScene()
+    item = scene.addPixmap(glyph)
+    effect = QGraphicsDropShadowEffect()
+    effect.setBlurRadius(blur_radius)
+    effect.setOffset(0, 0)
+    effect.setColor(QColor("#ff006e"))  # Magenta glow
+    item.setGraphicsEffect(effect)
+
+    frame = QPixmap(size * dpr)
+    frame.setDevicePixelRatio(dpr)
+    frame.fill(Qt.transparent)
+    bounds = QRectF(0, 0, size.width(), size.height())
+    painter = QPainter(frame)
+    painter.setRenderHint(QPainter.Antialiasing)
+    scene.render(painter, bounds, bounds)
+    painter.end()
+    return frame
+
+
+def _render_title_pixmap(base_font: QFont, dpr: float) -> QPixmap:
+    """Render the header title and subtitle into one transparent pixmap."""
+    title, subtitle = "ScrubMeta", "Remove metadata safely — single or batch"
+    title_font = QFont(base_font)
+    title_font.setPixelSize(36)
+    title_font.setBold(True)
+    subtitle_font = QFont(base_font)
+    subtitle_font.setPixelSize(11)
+
+    title_metrics = QFontMetrics(title_font)
+    subtitle_metrics = QFontMetrics(subtitle_font)
+    spacing = 2  # Tight spacing between title and subtitle
+    # Crop the title to its ink so both lines fit the fixed-height header
+    title_box = title_metrics.tightBoundingRect(title)
+    width = max(title_metrics.horizontalAdvance(title), subtitle_metrics.horizontalAdvance(subtitle))
+    height = title_box.height() + spacing + subtitle_metrics.height()
+
+    pixmap = QPixmap(QSize(width, height) * dpr)
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.TextAntialiasing)
+    painter.setFont(title_font)
+    painter.setPen(QColor(Colors.PRIMARY))
+    painter.drawText(0, -title_box.top(), title)
+    painter.setFont(subtitle_font)
+    painter.setPen(QColor(Colors.TEXT_SECONDARY))
+    painter.drawText(0, title_box.height() + spacing + subtitle_metrics.ascent(), subtitle)
+    painter.end()
+    return pixmap
+
+
+class StarAnimation(QAbstractAnimation):
+    """Endless animation that steps the star field from Qt's animation clock.
+
+    Frames arrive at the animation driver's rate, but the star field only
+    advances once at least STEP_MS has elapsed, with the real elapsed time
+    expressed in TICK_MS units (the unit star speeds are defined in).
+    """
+
+    STEP_MS = 100  # 10 updates/s is plenty for slow drift and pulsing
+    TICK_MS = 50  # Star speeds are per 50ms
+    MAX_TICKS = 4.0  # Don't jump stars across the window after a stall
+
+    def __init__(self, step: Callable[[float], None], parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._step = step
+        self._last_ms = 0
+
+    def duration(self) -> int:  # type: ignore[override]
+        return -1
+
+    def updateState(self, new_state, old_state) -> None:  # type: ignore[no-untyped-def, override]
+        if old_state == QAbstractAnimation.Stopped:
+            self._last_ms = 0
+
+    def updateCurrentTime(self, current_ms: int) -> None:  # type: ignore[override]
+        elapsed = current_ms - self._last_ms
+        if elapsed < self.STEP_MS:
+            return
+        self._last_ms = current_ms
+        self._step(min(elapsed / self.TICK_MS, self.MAX_TICKS))
+
+
 class StarsCentralWidget(QWidget):
     """Central widget that paints stars in background before rendering UI."""
 
-    def __init__(self, stars: list[Star], parent: QWidget | None = None) -> None:
+    def __init__(self, stars: StarField, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self.stars = stars
+        # Pre-rendered glow per integer glow radius; only opacity varies per frame
+        self._glow_cache: dict[int, QPixmap] = {}
+        # Current frame of the star field, composited by refresh_stars()
+        self._star_layer = QImage(1, 1, QImage.Format_ARGB32_Premultiplied)
+        self._star_layer.fill(Qt.transparent)
+        # paintEvent fills every pixel it is asked for, so skip Qt's background erase
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+
+    def _glow_pixmap(self, glow_radius: int) -> QPixmap:
+        """Render (once) the radial star glow at full opacity for a glow radius."""
+        pixmap = self._glow_cache.get(glow_radius)
+        if pixmap is not None:
+            return pixmap
+
+        size = glow_radius * 2
+        image = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+
+        gradient = QRadialGradient(glow_radius, glow_radius, glow_radius)
+
+        # Bright magenta core and purple glow
+        core_color = QColor("#ff006e")  # Bright magenta like logo
+        core_color.setAlphaF(0.8)
+
+        glow_color = QColor("#bb00dd")  # Purple glow
+        glow_color.setAlphaF(0.4)
+
+        edge_color = QColor("#8800bb")
+        edge_color.setAlphaF(0.1)
+
+        gradient.setColorAt(0.0, core_color)
+        gradient.setColorAt(0.4, glow_color)
+        gradient.setColorAt(1.0, edge_color)
+
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setBrush(gradient)
+        painter.setPen(Qt.NoPen)
+        painter.drawEllipse(0, 0, size, size)
+        painter.end()
+
+        pixmap = QPixmap.fromImage(image)
+        self._glow_cache[glow_radius] = pixmap
+        return pixmap
+
+    def refresh_stars(self) -> None:
+        """Redraw the star layer from the current star state (once per animation tick)."""
+        dpr = self.devicePixelRatioF()
+        width = max(1, round(self.width() * dpr))
+        height = max(1, round(self.height() * dpr))
+        if self._star_layer.width() != width or self._star_layer.height() != height:
+            self._star_layer = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+            self._star_layer.setDevicePixelRatio(dpr)
+        self._star_layer.fill(Qt.transparent)
+
+        stars = self.stars
+        glow_radii = stars.glow_radius
+        # Integer top-left corners for the whole field in one vectorized step
+        left = (stars.x - glow_radii).astype(np.int32)
+        top = (stars.y - glow_radii).astype(np.int32)
+
+        painter = QPainter(self._star_layer)
+        # Additive blend: overlapping glows brighten rather than occlude, so
+        # draw order is free and stars can be drawn grouped by glow size
+        painter.setCompositionMode(QPainter.CompositionMode_Plus)
+        for glow_radius, indices in stars.glow_groups:
+            # Blit the group's cached glow; the pixmap is already antialiased
+            pixmap = self._glow_pixmap(glow_radius)
+            for x, y, opacity in zip(
+                left[indices].tolist(), top[indices].tolist(), stars.current_opacity[indices].tolist()
+            ):
+                painter.setOpacity(opacity)
+                painter.drawPixmap(x, y, pixmap)
+        painter.end()
+
+    def resizeEvent(self, event) -> None:  # type: ignore[no-untyped-def]
+        """Reallocate the star layer to the new size."""
+        super().resizeEvent(event)
+        self.refresh_stars()
 
     def paintEvent(self, event) -> None:  # type: ignore[no-untyped-def]
         """Paint stars background, then let UI render."""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing, True)
-
-        # Paint the background color first
-        painter.fillRect(self.rect(), QColor(Colors.BACKGROUND))
-
-        # Draw stars with prominent glow
-        for star in self.stars:
-            # Create radial gradient glow for each star
-            glow_radius = star.radius * 8  # Larger glow area
-            gradient = QRadialGradient(star.x, star.y, glow_radius)
-
-            # Bright magenta core and purple glow
-            core_color = QColor("#ff006e")  # Bright magenta like logo
-            core_color.setAlphaF(star.current_opacity * 0.8)
-
-            glow_color = QColor("#bb00dd")  # Purple glow
-            glow_color.setAlphaF(star.current_opacity * 0.4)
-
-            edge_color = QColor("#8800bb")
-            edge_color.setAlphaF(star.current_opacity * 0.1)
-
-            gradient.setColorAt(0.0, core_color)
-            gradient.setColorAt(0.4, glow_color)
-            gradient.setColorAt(1.0, edge_color)
-
-            painter.setBrush(gradient)
-            painter.setPen(Qt.NoPen)
-            # Draw larger star
-            painter.drawEllipse(
-                int(star.x - glow_radius),
-                int(star.y - glow_radius),
-                int(glow_radius * 2),
-                int(glow_radius * 2),
-            )
 
+        # Paint the background color first, then the pre-rendered star layer;
+        # Qt clips both to the region being repainted
+        painter.fillRect(event.rect(), QColor(Colors.BACKGROUND))
+        painter.drawImage(0, 0, self._star_layer)
         painter.end()
 
         # Let parent class render UI widgets on top
@@ -127,6 +278,9 @@ class StarsCentralWidget(QWidget):
 class MainWindow(QMainWindow):
     """Primary application window with modern synthwave layout."""
 
+    # Queued to the worker thread to start a configured scrub
+    _run_requested = Signal()
+
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle("ScrubMeta")
@@ -141,24 +295,45 @@ class MainWindow(QMainWindow):
         self.setWindowIcon(QIcon(pixmap))
 
         self.setMinimumSize(1200, 700)
+        # One object-name-scoped stylesheet for the whole window, set before any child exists
+        self.setStyleSheet(get_window_qss())
         QCoreApplication.setOrganizationName("scrubmeta")
         QCoreApplication.setApplicationName("ScrubMeta")
 
         self.settings = QSettings()
-        self.thread: QThread | None = None
+        # One worker thread, started on the first scrub and reused after that
+        self._worker_thread: QThread | None = None
         self.worker: ScrubWorker | None = None
+        self._scrub_running = False
+
+        # Parsed paths, refreshed only when the path fields change
+        self._input_path_cache: Path | None = None
+        self._input_ok = False
+        self._input_is_dir = False
+        self._output_path_cache: Path | None = None
 
         # Initialize stars with deterministic seed only once
-        random.seed(42)
-        self.stars: list[Star] = []
         self._generate_stars_internal()
-        # Now let random be truly random for drift
-        random.seed()
 
         # Animation timer for stars - faster update for smooth motion
-        self.stars_timer = QTimer()
-        self.stars_timer.timeout.connect(self._update_stars)
-        self.stars_timer.start(50)  # 50ms = 20 FPS for smooth animation
+        self.stars_animation = StarAnimation(self._update_stars, self)
+
+        # Filter combo changes are coalesced before re-filtering the proxy
+        self._pending_filter = "All"
+        self._filter_debounce = QTimer(self)
+        self._filter_debounce.setSingleShot(True)
+        self._filter_debounce.setInterval(150)
+        self._filter_debounce.timeout.connect(self._apply_filter)
+
+        # Progress and status updates are applied at most ~30 times a second
+        self._pending_progress: tuple[int, int] | None = None
+        self._pending_status: str | None = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
+        # Report export running on the thread pool, if any
+        self._export_job: ReportExporter | None = None
 
         self._build_ui()
         self._load_settings()
@@ -169,7 +344,10 @@ class MainWindow(QMainWindow):
         """Build the main UI with header, two-column layout, and status bar."""
 
         # Create central widget with stars background painting
-        central = StarsCentralWidget(self.stars)
+        if gl_stars_enabled():
+            central = GLStarsCentralWidget(self.stars)
+        else:
+            central = StarsCentralWidget(self.stars)
         main_layout = QVBoxLayout()
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
@@ -202,46 +380,26 @@ class MainWindow(QMainWindow):
         # Animated logo section
         logo_label = QLabel("🔮")
         logo_label.setObjectName("animatedLogo")
-        logo_label.setStyleSheet(f"""
-            QLabel#animatedLogo {{
-                font-size: 48px;
-                color: {Colors.PRIMARY};
-            }}
-        """)
         logo_label.setMinimumSize(60, 60)
         logo_label.setAlignment(Qt.AlignCenter)
 
         # Apply pulsing animation
         self._animate_logo(logo_label)
 
-        # Title section
-        title_layout = QVBoxLayout()
-        title_layout.setSpacing(2)  # Tight spacing between title and subtitle
-        title_layout.setContentsMargins(0, 0, 0, 0)
-
-        title_label = QLabel("ScrubMeta")
-        title_label.setStyleSheet(f"font-size: 36px; font-weight: bold; color: {Colors.PRIMARY}; line-height: 1.0;")
-        subtitle_label = QLabel("Remove metadata safely — single or batch")
-        subtitle_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY}; font-size: 11px;")
-        title_layout.addWidget(title_label)
-        title_layout.addWidget(subtitle_label)
+        # Title section: static text, rendered once and shown as a pixmap
+        title_label = QLabel()
+        title_label.setAccessibleName("ScrubMeta")
+        title_label.setPixmap(_render_title_pixmap(title_label.font(), self.devicePixelRatioF()))
+        title_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
 
         layout.addWidget(logo_label, 0)
-        layout.addLayout(title_layout, 1)
+        layout.addWidget(title_label, 1)
 
         # Status pill
         self.status_pill = QLabel("Ready")
         self.status_pill.setObjectName("statusPill")
-        self.status_pill.setObjectName("statusPill idle")
-        self.status_pill.setStyleSheet(f"""
-            background-color: rgba(61, 0, 102, 0.6);
-            border: 1px solid {Colors.TEXT_SECONDARY};
-            border-radius: 16px;
-            padding: 6px 14px;
-            color: {Colors.TEXT_SECONDARY};
-            font-weight: bold;
-            font-size: 10px;
-        """)
+        self.status_pill.setProperty("state", "idle")
+        self._pill_status = "idle"
 
         layout.addWidget(self.status_pill, 0, Qt.AlignRight | Qt.AlignCenter)
 
@@ -250,33 +408,25 @@ class MainWindow(QMainWindow):
 
     def _animate_logo(self, logo: QLabel) -> None:
         """Apply pulsing purple glow effect to the logo."""
-        # Create a glowing shadow effect and store as instance variable
-        self.glow_effect = QGraphicsDropShadowEffect()
-        self.glow_effect.setBlurRadius(5)
-        self.glow_effect.setXOffset(0)
-        self.glow_effect.setYOffset(0)
-        self.glow_effect.setColor(QColor("#ff006e"))  # Magenta glow
-        logo.setGraphicsEffect(self.glow_effect)
-
-        # Animate the blur radius to create pulsing glow
-        self.glow_animation_in = QPropertyAnimation(self.glow_effect, b"blurRadius")
-        self.glow_animation_in.setDuration(1500)
-        self.glow_animation_in.setStartValue(5)
-        self.glow_animation_in.setEndValue(30)
-        self.glow_animation_in.setEasingCurve(QEasingCurve.InOutQuad)
-
-        self.glow_animation_out = QPropertyAnimation(self.glow_effect, b"blurRadius")
-        self.glow_animation_out.setDuration(1500)
-        self.glow_animation_out.setStartValue(30)
-        self.glow_animation_out.setEndValue(5)
-        self.glow_animation_out.setEasingCurve(QEasingCurve.InOutQuad)
-
-        # Create looping sequence
-        self.animation_group = QSequentialAnimationGroup()
-        self.animation_group.addAnimation(self.glow_animation_in)
-        self.animation_group.addAnimation(self.glow_animation_out)
-        self.animation_group.setLoopCount(-1)
-        self.animation_group.start()
+        # Blur each glow level once up front; the animation only swaps pixmaps
+        font = QFont(logo.font())
+        font.setPixelSize(48)
+        size = logo.minimumSize()
+        dpr = logo.devicePixelRatioF()
+        self._logo_frames = [
+            _render_logo_frame(logo.text(), font, size, dpr, radius)
+            for radius in LOGO_GLOW_RADII
+        ]
+        self._logo_frame_index = 0
+        logo.setPixmap(self._logo_frames[0])
+
+        self.logo_timer = QTimer(self)
+        self.logo_timer.timeout.connect(lambda: self._next_logo_frame(logo))
+        self.logo_timer.start(300)  # 10 frames x 300ms = one 3s pulse
+
+    def _next_logo_frame(self, logo: QLabel) -> None:
+        self._logo_frame_index = (self._logo_frame_index + 1) % len(self._logo_frames)
+        logo.setPixmap(self._logo_frames[self._logo_frame_index])
 
     def _build_content_area(self) -> QWidget:
         """Build the two-column main content area."""
@@ -297,6 +447,8 @@ class MainWindow(QMainWindow):
         splitter.addWidget(right_column)
         splitter.setStretchFactor(0, 1)
         splitter.setStretchFactor(1, 1)
+        self._splitter = splitter
+        self._splitter_sized = False
 
         layout.addWidget(splitter)
         container.setLayout(layout)
@@ -306,6 +458,7 @@ class MainWindow(QMainWindow):
         """Build the left configuration panel."""
         container = QWidget()
         scroll = QScrollArea()
+        scroll.setObjectName("controlsScroll")
         scroll.setWidget(container)
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
@@ -321,7 +474,6 @@ class MainWindow(QMainWindow):
         layout.addStretch()
 
         container.setLayout(layout)
-        scroll.setStyleSheet("QScrollArea { border: none; background-color: transparent; }")
         return scroll
 
     def _build_right_column(self) -> QWidget:
@@ -331,11 +483,33 @@ class MainWindow(QMainWindow):
         layout.setSpacing(12)
 
         layout.addLayout(self._build_progress_row())
-        layout.addWidget(self._build_results_panel(), 1)
+
+        # Models are cheap and always present; the table and its controls are
+        # built the first time a scrub starts (see _show_results_panel)
+        self.results_model = ResultsTableModel()
+        self.results_proxy = ResultFilterProxy()
+        self.results_proxy.setSourceModel(self.results_model)
+        # Rows are filtered as they're inserted; skip re-filtering on every source change
+        self.results_proxy.setDynamicSortFilter(False)
+
+        placeholder = QLabel("No results yet")
+        placeholder.setObjectName("resultsPlaceholder")
+        placeholder.setAlignment(Qt.AlignCenter)
+        self.results_stack = QStackedWidget()
+        self.results_stack.addWidget(placeholder)
+        self._results_panel: QWidget | None = None
+        layout.addWidget(self.results_stack, 1)
 
         container.setLayout(layout)
         return container
 
+    def _show_results_panel(self) -> None:
+        """Build the results panel on first use and bring it to the front."""
+        if self._results_panel is None:
+            self._results_panel = self._build_results_panel()
+            self.results_stack.addWidget(self._results_panel)
+        self.results_stack.setCurrentWidget(self._results_panel)
+
     def _build_status_bar(self) -> QWidget:
         """Build the bottom status bar."""
         bar = QWidget()
@@ -347,7 +521,7 @@ class MainWindow(QMainWindow):
         layout.setSpacing(12)
 
         self.summary_label = QLabel("Ready")
-        self.summary_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY}; font-size: 11px;")
+        self.summary_label.setObjectName("summaryLabel")
 
         layout.addWidget(self.summary_label, 1)
 
@@ -377,6 +551,7 @@ class MainWindow(QMainWindow):
 
         # Connection
         self.pick_input_btn.clicked.connect(self._pick_input)
+        self.input_path_edit.textChanged.connect(self._on_input_text_changed)
 
         return group
 
@@ -400,6 +575,7 @@ class MainWindow(QMainWindow):
         group.setLayout(form)
 
         self.pick_output_btn.clicked.connect(self._pick_output_folder)
+        self.output_path_edit.textChanged.connect(self._on_output_text_changed)
 
         return group
 
@@ -433,7 +609,7 @@ class MainWindow(QMainWindow):
         ffmpeg_row.addWidget(self.ffmpeg_path_edit, 1)
 
         ffmpeg_label = QLabel("Audio/Video")
-        ffmpeg_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY}; font-size: 10px;")
+        ffmpeg_label.setObjectName("ffmpegLabel")
 
         layout.addWidget(ffmpeg_label)
         layout.addLayout(ffmpeg_row)
@@ -482,7 +658,7 @@ class MainWindow(QMainWindow):
         # Current file and status
         info_layout = QVBoxLayout()
         self.current_file_label = QLabel("Idle")
-        self.current_file_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY}; font-size: 10px;")
+        self.current_file_label.setObjectName("currentFileLabel")
         self.progress = QProgressBar()
         self.progress.setMinimum(0)
         self.progress.setMaximum(1)
@@ -505,7 +681,7 @@ class MainWindow(QMainWindow):
         controls_row = QHBoxLayout()
 
         filter_label = QLabel("Filter:")
-        filter_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY}; font-size: 11px;")
+        filter_label.setObjectName("filterLabel")
         controls_row.addWidget(filter_label)
 
         self.filter_combo = QComboBox()
@@ -529,10 +705,6 @@ class MainWindow(QMainWindow):
         layout.addLayout(controls_row)
 
         # Results table
-        self.results_model = ResultsTableModel()
-        self.results_proxy = ResultFilterProxy()
-        self.results_proxy.setSourceModel(self.results_model)
-
         self.results_view = QTableView()
         self.results_view.setModel(self.results_proxy)
         self.results_view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
@@ -574,8 +746,7 @@ class MainWindow(QMainWindow):
 
     def _update_input_options(self) -> None:
         """Update recursive/structure options based on input type."""
-        input_path = self._input_path()
-        is_folder = input_path and input_path.is_dir()
+        is_folder = self._input_is_dir
 
         self.recursive_cb.setEnabled(is_folder)
         self.keep_structure_cb.setEnabled(is_folder)
@@ -596,29 +767,41 @@ class MainWindow(QMainWindow):
             self.ffmpeg_path_edit.setText(path)
 
     # Validation helpers
+    def _on_input_text_changed(self, text: str) -> None:
+        """Parse and stat the input path once per edit, not once per toggle."""
+        text = text.strip()
+        self._input_path_cache = Path(text) if text else None
+        self._input_ok = False
+        self._input_is_dir = False
+        if self._input_path_cache is not None:
+            try:
+                st = self._input_path_cache.stat()
+            except OSError:
+                return
+            self._input_ok = True
+            self._input_is_dir = stat.S_ISDIR(st.st_mode)
+
+    def _on_output_text_changed(self, text: str) -> None:
+        text = text.strip()
+        self._output_path_cache = Path(text) if text else None
+
     def _input_path(self) -> Path | None:
-        text = self.input_path_edit.text().strip()
-        return Path(text) if text else None
+        return self._input_path_cache
 
     def _output_path(self) -> Path | None:
-        text = self.output_path_edit.text().strip()
-        return Path(text) if text else None
+        return self._output_path_cache
 
     def _is_valid(self) -> bool:
-        input_path = self._input_path()
-        output_path = self._output_path()
-        if not input_path or not input_path.exists():
-            return False
-        if not output_path:
-            return False
-        return True
+        return self._input_ok and self._output_path_cache is not None
 
     def _update_action_state(self) -> None:
         self.scrub_btn.setEnabled(self._is_valid())
-        self.open_output_btn.setEnabled(bool(self.output_path_edit.text().strip()))
+        self.open_output_btn.setEnabled(self._output_path_cache is not None)
 
     # Scrubbing lifecycle
     def _start_scrub(self) -> None:
+        # The input may have moved since it was picked; check it again before running
+        self._on_input_text_changed(self.input_path_edit.text())
         if not self._is_valid():
             QMessageBox.warning(self, "Invalid selection", "Please select a valid input and output")
             return
@@ -647,9 +830,11 @@ class MainWindow(QMainWindow):
         dry_run = self.dry_run_cb.isChecked()
         ffmpeg_cmd = self.ffmpeg_path_edit.text().strip() or "ffmpeg"
 
-        # Set up worker thread
-        self.thread = QThread()
-        self.worker = ScrubWorker(
+        # Streaming appends are filtered on insert; dynamic re-filtering resumes when done
+        self.results_proxy.setDynamicSortFilter(False)
+
+        worker = self._ensure_worker()
+        worker.configure(
             input_path=input_path,
             output_dir=output_path,
             recursive=recursive,
@@ -658,58 +843,96 @@ class MainWindow(QMainWindow):
             dry_run=dry_run,
             ffmpeg_cmd=ffmpeg_cmd,
         )
-        self.worker.moveToThread(self.thread)
 
-        # Wire signals
-        self.thread.started.connect(self.worker.run)
+        # Start: queued onto the worker thread
+        self._scrub_running = True
+        self.scrub_btn.setEnabled(False)
+        self._run_requested.emit()
+
+    def _ensure_worker(self) -> ScrubWorker:
+        """Create the worker and its thread on first use; signals are wired once."""
+        if self.worker is not None:
+            return self.worker
+        self._worker_thread = QThread(self)
+        self.worker = ScrubWorker()
+        self.worker.moveToThread(self._worker_thread)
+
+        self._run_requested.connect(self.worker.run)
         self.worker.progress.connect(self._on_progress)
         self.worker.status.connect(self._on_status)
-        self.worker.result.connect(self._on_result)
+        self.worker.results.connect(self._on_results)
         self.worker.finished.connect(self._on_finished)
         self.worker.error.connect(self._on_error)
         self.worker.started.connect(self._on_worker_started)
-        self.thread.finished.connect(self.thread.deleteLater)
+        self._worker_thread.finished.connect(self.worker.deleteLater)
+        QCoreApplication.instance().aboutToQuit.connect(self._stop_worker_thread)
 
-        # Start
-        self.thread.start()
+        self._worker_thread.start()
+        return self.worker
+
+    def _stop_worker_thread(self) -> None:
+        """Cancel any running scrub and shut the worker thread down."""
+        if self._worker_thread is None:
+            return
+        if self._scrub_running:
+            self._request_cancel()
+        self._worker_thread.quit()
+        self._worker_thread.wait(2000)
+        self._worker_thread = None
+        self.worker = None
 
     def _on_worker_started(self) -> None:
+        self._show_results_panel()
         self._update_status_pill("Processing…", "processing")
         self.current_file_label.setText("Scanning files…")
         self.progress.setMaximum(0)  # indeterminate until scan emits
         self.progress.setValue(0)
         self.scrub_btn.setEnabled(False)
         self.cancel_btn.setEnabled(True)
+        self._progress_timer.start()
 
     def _request_cancel(self) -> None:
-        if self.worker:
+        if self.worker and self._scrub_running:
             self.worker.request_cancel()
             self.current_file_label.setText("Cancelling…")
             self.cancel_btn.setEnabled(False)
 
     def _on_progress(self, current: int, total: int) -> None:
-        self.progress.setMaximum(total)
-        self.progress.setValue(current)
-        percent = int((current / total * 100)) if total > 0 else 0
-        self.current_file_label.setText(f"Progress: {current}/{total} ({percent}%)")
+        self._pending_progress = (current, total)
+        # The progress text replaces any status received before it
+        self._pending_status = None
 
     def _on_status(self, text: str) -> None:
-        self.current_file_label.setText(text)
-
-    def _on_result(self, row: dict) -> None:
-        self.results_model.append_row(row)
+        self._pending_status = text
+
+    def _flush_progress(self) -> None:
+        """Apply only the latest progress and status received since the last tick."""
+        if self._pending_progress is not None:
+            current, total = self._pending_progress
+            self._pending_progress = None
+            self.progress.setMaximum(total)
+            self.progress.setValue(current)
+            percent = int((current / total * 100)) if total > 0 else 0
+            self.current_file_label.setText(f"Progress: {current}/{total} ({percent}%)")
+        if self._pending_status is not None:
+            self.current_file_label.setText(self._pending_status)
+            self._pending_status = None
+
+    def _on_results(self, rows: list) -> None:
+        # The worker already batches rows, so each batch is one model insert
+        self.results_model.append_rows(rows)
 
     def _on_finished(self, summary: dict) -> None:
+        self._progress_timer.stop()
+        self._pending_progress = None
+        self._pending_status = None
+        self.results_proxy.setDynamicSortFilter(True)
         self.scrub_btn.setEnabled(True)
         self.cancel_btn.setEnabled(False)
         self.progress.setMaximum(1)
         self.progress.setValue(0)
 
-        if self.thread:
-            self.thread.quit()
-            self.thread.wait()
-            self.thread = None
-            self.worker = None
+        self._scrub_running = False
 
         # Update status pill and summary
         if summary.get("cancelled"):
@@ -748,28 +971,21 @@ class MainWindow(QMainWindow):
     def _update_status_pill(self, text: str, status: str) -> None:
         """Update the status pill with text and style class."""
         self.status_pill.setText(text)
-        style = """
-            background-color: rgba(61, 0, 102, 0.6);
-            border-radius: 16px;
-            padding: 6px 14px;
-            font-weight: bold;
-            font-size: 10px;
-        """
-
-        if status == "idle":
-            style += f"border: 1px solid {Colors.TEXT_SECONDARY}; color: {Colors.TEXT_SECONDARY};"
-        elif status == "processing":
-            style += f"border: 1px solid {Colors.PRIMARY}; color: {Colors.PRIMARY};"
-        elif status == "success":
-            style += f"border: 1px solid {Colors.SUCCESS}; color: {Colors.SUCCESS};"
-        elif status == "error":
-            style += f"border: 1px solid {Colors.ERROR}; color: {Colors.ERROR};"
-
-        self.status_pill.setStyleSheet(style)
+        # The app stylesheet keys on the "state" property; repolish only on a real change
+        if status != self._pill_status:
+            self.status_pill.setProperty("state", status)
+            style = self.status_pill.style()
+            style.unpolish(self.status_pill)
+            style.polish(self.status_pill)
+            self._pill_status = status
 
     # Results helpers
     def _on_filter_changed(self, status: str) -> None:
-        self.results_proxy.set_status_filter(status)
+        self._pending_filter = status
+        self._filter_debounce.start()
+
+    def _apply_filter(self) -> None:
+        self.results_proxy.set_status_filter(self._pending_filter)
 
     def _copy_log(self) -> None:
         rows = self.results_model.rows()
@@ -781,7 +997,8 @@ class MainWindow(QMainWindow):
         QApplication.clipboard().setText("\n".join(lines))
 
     def _export_report(self) -> None:
-        if not self.results_model.rows():
+        rows = self.results_model.rows()
+        if not rows or self._export_job is not None:
             return
         path, _ = QFileDialog.getSaveFileName(
             self,
@@ -791,15 +1008,24 @@ class MainWindow(QMainWindow):
         )
         if not path:
             return
-        rows = self.results_model.rows()
-        if path.lower().endswith(".json"):
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(rows, f, indent=2)
-        else:
-            with open(path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=["status", "input", "output", "message"])
-                writer.writeheader()
-                writer.writerows(rows)
+        # Write on the global pool so large reports don't block the UI
+        self._export_job = ReportExporter(rows, path)
+        self._export_job.signals.finished.connect(self._on_export_finished)
+        self._export_job.signals.error.connect(self._on_export_error)
+        self.export_btn.setEnabled(False)
+        self.summary_label.setText(f"Exporting {len(rows)} rows…")
+        QThreadPool.globalInstance().start(self._export_job)
+
+    def _on_export_finished(self, path: str, count: int) -> None:
+        self._export_job = None
+        self.export_btn.setEnabled(True)
+        self.summary_label.setText(f"Exported {count} rows to {Path(path).name}")
+
+    def _on_export_error(self, message: str) -> None:
+        self._export_job = None
+        self.export_btn.setEnabled(True)
+        self.summary_label.setText("Export failed")
+        QMessageBox.critical(self, "Export failed", message)
 
     def _clear_results(self) -> None:
         self.results_model.clear()
@@ -810,36 +1036,87 @@ class MainWindow(QMainWindow):
             QDesktopServices.openUrl(QUrl.fromLocalFile(str(output_path)))
 
     # Settings persistence
+    #
+    # Settings are read once at startup and written only from closeEvent;
+    # toggling options never touches the settings backend.
     def _load_settings(self) -> None:
-        output = self.settings.value("output_path", "")
-        if output:
-            self.output_path_edit.setText(output)
-
-        self.recursive_cb.setChecked(self.settings.value("recursive", False, bool))
-        self.keep_structure_cb.setChecked(self.settings.value("keep_structure", False, bool))
-        self.overwrite_cb.setChecked(self.settings.value("overwrite", False, bool))
-        self.dry_run_cb.setChecked(self.settings.value("dry_run", False, bool))
-        self.ffmpeg_path_edit.setText(self.settings.value("ffmpeg_path", ""))
+        self._saved_settings = {
+            "output_path": self.settings.value("output_path", "", str),
+            "recursive": self.settings.value("recursive", False, bool),
+            "keep_structure": self.settings.value("keep_structure", False, bool),
+            "overwrite": self.settings.value("overwrite", False, bool),
+            "dry_run": self.settings.value("dry_run", False, bool),
+            "ffmpeg_path": self.settings.value("ffmpeg_path", "", str),
+        }
+        saved = self._saved_settings
+        if saved["output_path"]:
+            self.output_path_edit.setText(saved["output_path"])
+
+        self.recursive_cb.setChecked(saved["recursive"])
+        self.keep_structure_cb.setChecked(saved["keep_structure"])
+        self.overwrite_cb.setChecked(saved["overwrite"])
+        self.dry_run_cb.setChecked(saved["dry_run"])
+        self.ffmpeg_path_edit.setText(saved["ffmpeg_path"])
 
     def _save_settings(self) -> None:
-        self.settings.setValue("output_path", self.output_path_edit.text())
-        self.settings.setValue("recursive", self.recursive_cb.isChecked())
-        self.settings.setValue("keep_structure", self.keep_structure_cb.isChecked())
-        self.settings.setValue("overwrite", self.overwrite_cb.isChecked())
-        self.settings.setValue("dry_run", self.dry_run_cb.isChecked())
-        self.settings.setValue("ffmpeg_path", self.ffmpeg_path_edit.text())
+        current = {
+            "output_path": self.output_path_edit.text(),
+            "recursive": self.recursive_cb.isChecked(),
+            "keep_structure": self.keep_structure_cb.isChecked(),
+            "overwrite": self.overwrite_cb.isChecked(),
+            "dry_run": self.dry_run_cb.isChecked(),
+            "ffmpeg_path": self.ffmpeg_path_edit.text(),
+        }
+        changed = {key: value for key, value in current.items() if self._saved_settings.get(key) != value}
+        if not changed:
+            return
+        for key, value in changed.items():
+            self.settings.setValue(key, value)
+        self.settings.sync()
+        self._saved_settings = current
 
     def showEvent(self, event) -> None:  # type: ignore[override]
         """Regenerate stars after window is shown with proper size."""
         super().showEvent(event)
         self._generate_stars()
+        if not self._splitter_sized:
+            # Split evenly; the right column's size hint is small until results exist
+            half = self._splitter.width() // 2
+            self._splitter.setSizes([half, half])
+            self._splitter_sized = True
+        self._resume_stars()
+
+    def hideEvent(self, event) -> None:  # type: ignore[override]
+        """Pause the star animation while the window isn't shown."""
+        super().hideEvent(event)
+        self._pause_stars()
+
+    def changeEvent(self, event) -> None:  # type: ignore[override]
+        """Pause the star animation while minimized.
+
+        Not every platform sends a hide event on minimize, so the window
+        state change is handled as well.
+        """
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            if self.isMinimized():
+                self._pause_stars()
+            elif self.isVisible():
+                self._resume_stars()
+
+    def _pause_stars(self) -> None:
+        if self.stars_animation.state() == QAbstractAnimation.Running:
+            self.stars_animation.pause()
+
+    def _resume_stars(self) -> None:
+        if self.stars_animation.state() == QAbstractAnimation.Paused:
+            self.stars_animation.resume()
+        elif self.stars_animation.state() == QAbstractAnimation.Stopped:
+            self.stars_animation.start()
 
     def closeEvent(self, event) -> None:  # type: ignore[override]
         self._save_settings()
-        if self.thread and self.thread.isRunning():
-            self._request_cancel()
-            self.thread.quit()
-            self.thread.wait(2000)
+        self._stop_worker_thread()
         super().closeEvent(event)
 
     def resizeEvent(self, event) -> None:  # type: ignore[override]
@@ -847,49 +1124,50 @@ class MainWindow(QMainWindow):
         super().resizeEvent(event)
         self._generate_stars()
 
-    def _generate_stars_internal(self) -> None:
-        """Generate initial star field (called during init with seed)."""
+    def _star_area(self) -> tuple[int, int]:
+        """Size of the area stars wrap within; never smaller than 1200x700."""
         # Use actual window dimensions when available
         if self.geometry().isValid():
-            width = max(self.width(), 1200)
-            height = max(self.height(), 700)
-        else:
-            width = 1200
-            height = 700
+            return max(self.width(), 1200), max(self.height(), 700)
+        return 1200, 700
+
+    def _generate_stars_internal(self) -> None:
+        """Generate initial star field (called during init with seed)."""
+        width, height = self._star_area()
 
         # More stars, more visible
         star_count = max(60, min(150, (width * height) // 10000))
 
-        self.stars = [
-            Star(
-                x=random.uniform(0, width),
-                y=random.uniform(0, height),
-                radius=random.uniform(2.5, 5.0),
-                base_opacity=random.uniform(0.15, 0.35),
-                width=float(width),
-                height=float(height),
-            )
-            for _ in range(star_count)
-        ]
+        self.stars = StarField(star_count, width=width, height=height, seed=42)
 
     def _generate_stars(self) -> None:
-        """Regenerate star field on resize (no seed - allows drift)."""
-        # Use actual window dimensions when available
-        if self.geometry().isValid():
-            width = max(self.width(), 1200)
-            height = max(self.height(), 700)
-        else:
-            width = 1200
-            height = 700
-
-        # Update existing stars' boundaries
-        for star in self.stars:
-            star.width = float(width)
-            star.height = float(height)
-
-    def _update_stars(self) -> None:
-        """Update star opacity and request repaint."""
-        for star in self.stars:
-            star.update()
-        # Force repaint of central widget
-        self.update()
+        """Update the star field bounds on resize; the stars themselves are kept."""
+        # Bounds are two scalars on the field, so this is O(1) in the star count
+        self.stars.resize(*self._star_area())
+
+    def _update_stars(self, ticks: float = 1.0) -> None:
+        """Update star opacity and repaint only where stars were or now are."""
+        # Nothing to animate while hidden or minimized
+        if not self.isVisible() or self.isMinimized():
+            return
+
+        dirty = QRegion()
+        for rect in self._star_rects():
+            dirty += rect
+        self.stars.update(ticks)
+        for rect in self._star_rects():
+            dirty += rect
+        self.central_widget.refresh_stars()
+        self.central_widget.update(dirty)
+
+    def _star_rects(self) -> list[QRect]:
+        """Bounding boxes of every star's glow, padded by a pixel for rounding."""
+        stars = self.stars
+        glow_radii = stars.glow_radius + 1
+        left = (stars.x - glow_radii).astype(np.int32)
+        top = (stars.y - glow_radii).astype(np.int32)
+        sizes = glow_radii * 2 + 1
+        return [
+            QRect(x, y, size, size)
+            for x, y, size in zip(left.tolist(), top.tolist(), sizes.tolist())
+        ]
@@ -2,23 +2,29 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import List, Tuple
 
 from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
 from PySide6.QtCore import QSortFilterProxyModel
 
 
 class ResultsTableModel(QAbstractTableModel):
-    """Table model holding scrub results."""
+    """Table model holding scrub results.
+
+    Rows are stored column-wise, one list per field, so a cell lookup is
+    two list indexes rather than a dict lookup per (row, column, role).
+    """
 
     headers = ["Status", "Input", "Output", "Message"]
+    # Row dict key backing each column, in header order
+    fields = ("status", "input", "output", "message")
 
     def __init__(self) -> None:
         super().__init__()
-        self._rows: List[dict] = []
+        self._cols: Tuple[List[str], ...] = tuple([] for _ in self.fields)
 
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
-        return 0 if parent.isValid() else len(self._rows)
+        return 0 if parent.isValid() else len(self._cols[0])
 
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
         return 0 if parent.isValid() else len(self.headers)
@@ -27,17 +33,9 @@ class ResultsTableModel(QAbstractTableModel):
         if not index.isValid() or role not in (Qt.DisplayRole, Qt.ToolTipRole):
             return None
 
-        row = self._rows[index.row()]
         column = index.column()
-
-        if column == 0:
-            return row.get("status", "")
-        if column == 1:
-            return row.get("input", "")
-        if column == 2:
-            return row.get("output", "")
-        if column == 3:
-            return row.get("message", "")
+        if 0 <= column < len(self._cols):
+            return self._cols[column][index.row()]
         return None
 
     def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):  # type: ignore[override]
@@ -49,31 +47,35 @@ class ResultsTableModel(QAbstractTableModel):
 
     def append_row(self, row: dict) -> None:
         """Append a single result row."""
-        self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows))
-        self._rows.append(row)
-        self.endInsertRows()
+        self.append_rows([row])
 
     def append_rows(self, rows: List[dict]) -> None:
         """Append multiple rows in one batch."""
         if not rows:
             return
-        start = len(self._rows)
+        start = self.rowCount()
         end = start + len(rows) - 1
         self.beginInsertRows(QModelIndex(), start, end)
-        self._rows.extend(rows)
+        for col, field in zip(self._cols, self.fields):
+            col.extend([row.get(field, "") for row in rows])
         self.endInsertRows()
 
     def clear(self) -> None:
         """Clear all rows."""
-        if not self._rows:
+        if not self.rowCount():
             return
         self.beginResetModel()
-        self._rows.clear()
+        for col in self._cols:
+            col.clear()
         self.endResetModel()
 
+    def status_at(self, row: int) -> str:
+        """Return the status of a row without building a QModelIndex."""
+        return self._cols[0][row]
+
     def rows(self) -> List[dict]:
-        """Return a shallow copy of rows for exporting/logging."""
-        return list(self._rows)
+        """Return the rows as dicts for exporting/logging."""
+        return [dict(zip(self.fields, values)) for values in zip(*self._cols)]
 
 
 class ResultFilterProxy(QSortFilterProxyModel):
@@ -90,6 +92,10 @@ class ResultFilterProxy(QSortFilterProxyModel):
     def filterAcceptsRow(self, source_row: int, source_parent) -> bool:  # type: ignore[override]
         if self.status_filter == "All":
             return True
-        index = self.sourceModel().index(source_row, 0, source_parent)  # type: ignore[arg-type]
-        value = self.sourceModel().data(index, Qt.DisplayRole)  # type: ignore[arg-type]
+        source = self.sourceModel()
+        if isinstance(source, ResultsTableModel):
+            # Skip the per-row index()/data() round-trip through Qt
+            return source.status_at(source_row) == self.status_filter
+        index = source.index(source_row, 0, source_parent)  # type: ignore[arg-type]
+        value = source.data(index, Qt.DisplayRole)  # type: ignore[arg-type]
         return value == self.status_filter
@@ -2,50 +2,80 @@
 
 from __future__ import annotations
 
-import random
+import numpy as np
 
 
-class Star:
-    """A single glowing star with position, radius, and opacity."""
+class StarField:
+    """Glowing stars with position, radius, and opacity, stored as parallel arrays.
 
-    def __init__(self, x: float, y: float, radius: float, base_opacity: float, width: float = 1200, height: float = 700) -> None:
-        self.x = x
-        self.y = y
-        self.radius = radius
-        self.base_opacity = base_opacity
-        self.current_opacity = base_opacity
-        self.width = width
-        self.height = height
+    Each attribute is a float32 array with one entry per star (int32 glow
+    radii, int8 drift directions), so a whole animation tick is a handful
+    of vectorized single-precision operations instead of a Python loop
+    over star objects.
+    """
 
-        # Opacity drift
-        self.opacity_direction = 1 if random.random() > 0.5 else -1
-        self.opacity_speed = random.uniform(0.008, 0.015)
+    def __init__(self, count: int, width: float = 1200, height: float = 700, seed: int | None = None) -> None:
+        rng = np.random.default_rng(seed)
+        self.width = float(width)
+        self.height = float(height)
 
-        # Position drift - visible, gentle movement (updated every 50ms)
-        self.vx = random.uniform(-1.5, 1.5)  # Pixels per 50ms
-        self.vy = random.uniform(-1.5, 1.5)  # Pixels per 50ms
+        # Every uniformly drawn attribute comes from one RNG call into one
+        # float32 block; each attribute is a contiguous row of that block
+        low, high = zip(
+            (0.0, width),  # x
+            (0.0, height),  # y
+            (2.5, 5.0),  # radius
+            (0.15, 0.35),  # base opacity
+            (0.008, 0.015),  # opacity speed
+            (-1.5, 1.5),  # vx, pixels per 50ms
+            (-1.5, 1.5),  # vy, pixels per 50ms
+        )
+        block = rng.uniform(np.array(low)[:, None], np.array(high)[:, None], (len(low), count)).astype(np.float32)
+        self.x, self.y, self.radius, self.base_opacity, self.opacity_speed, self.vx, self.vy = block
 
-    def update(self) -> None:
-        """Update opacity with pulsing and position with gentle drift."""
-        # Update opacity
-        self.current_opacity += self.opacity_direction * self.opacity_speed
-        if self.current_opacity >= self.base_opacity + 0.15:
-            self.opacity_direction = -1
-        elif self.current_opacity <= self.base_opacity - 0.08:
-            self.opacity_direction = 1
+        # Radius of the painted glow in whole pixels; fixed for a star's lifetime
+        self.glow_radius = (self.radius * 8).astype(np.int32)
+        # Star indices grouped by glow radius, so painting fetches each glow once
+        self.glow_groups = [
+            (int(glow), np.flatnonzero(self.glow_radius == glow)) for glow in np.unique(self.glow_radius)
+        ]
+        self.current_opacity = self.base_opacity.copy()
+        # Pulse turning points, fixed per star
+        self.opacity_upper = self.base_opacity + np.float32(0.15)
+        self.opacity_lower = self.base_opacity - np.float32(0.08)
 
-        # Update position with wrapping at edges
-        self.x += self.vx
-        self.y += self.vy
+        # Opacity drift direction, +1 brightening or -1 dimming
+        self.opacity_direction = np.where(rng.random(count) > 0.5, 1, -1).astype(np.int8)
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def resize(self, width: float, height: float) -> None:
+        """Change the area stars drift and wrap within."""
+        self.width = float(width)
+        self.height = float(height)
 
-        # Wrap around screen edges
-        if self.x < -50:
-            self.x = self.width + 50
-        elif self.x > self.width + 50:
-            self.x = -50
+    def update(self, ticks: float = 1.0) -> None:
+        """Update opacity with pulsing and position with gentle drift.
 
-        if self.y < -50:
-            self.y = self.height + 50
-        elif self.y > self.height + 50:
-            self.y = -50
+        Integration is time based: callers pass the real time since the
+        previous update, so a late or skipped frame moves stars further
+        instead of stalling them.
+
+        Args:
+            ticks: Elapsed time in 50ms units (speeds are per 50ms); may be fractional
+        """
+        # Update opacity
+        self.current_opacity += self.opacity_direction * (self.opacity_speed * ticks)
+        self.opacity_direction[self.current_opacity >= self.opacity_upper] = -1
+        self.opacity_direction[self.current_opacity <= self.opacity_lower] = 1
+
+        # Update position with wrapping at edges
+        self.x += self.vx * ticks
+        self.y += self.vy * ticks
 
+        # Wrap around screen edges: keep each axis in [-50, size + 50) in place
+        for pos, size in ((self.x, self.width), (self.y, self.height)):
+            pos += 50
+            np.mod(pos, size + 100, out=pos)
+            pos -= 50
@@ -0,0 +1,148 @@
+"""GPU-rendered star field background using point sprites."""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+from PySide6.QtGui import QColor, QSurfaceFormat
+from PySide6.QtOpenGL import QOpenGLBuffer, QOpenGLShader, QOpenGLShaderProgram, QOpenGLVertexArrayObject
+from PySide6.QtOpenGLWidgets import QOpenGLWidget
+from PySide6.QtWidgets import QWidget
+
+from .stars_background import StarField
+from .theme import Colors
+
+# Raw GL enums (not exposed as Python constants by PySide6)
+GL_COLOR_BUFFER_BIT = 0x4000
+GL_BLEND = 0x0BE2
+GL_SRC_ALPHA = 0x0302
+GL_ONE_MINUS_SRC_ALPHA = 0x0303
+GL_POINTS = 0x0000
+GL_FLOAT = 0x1406
+GL_PROGRAM_POINT_SIZE = 0x8642
+GL_POINT_SPRITE = 0x8861
+
+# Floats per star in the vertex buffer: x, y, glow radius, opacity
+STAR_STRIDE = 4
+
+VERTEX_SHADER = """
+#version 120
+attribute vec4 star;  // x, y, glow radius (widget pixels), opacity
+uniform vec2 viewport;
+uniform float dpr;
+varying float opacity;
+
+void main() {
+    vec2 ndc = vec2(star.x / viewport.x * 2.0 - 1.0, 1.0 - star.y / viewport.y * 2.0);
+    gl_Position = vec4(ndc, 0.0, 1.0);
+    gl_PointSize = star.z * 2.0 * dpr;
+    opacity = star.w;
+}
+"""
+
+# Same three stops as the raster glow: magenta core, purple glow, faint edge
+FRAGMENT_SHADER = """
+#version 120
+varying float opacity;
+const vec4 core = vec4(1.0, 0.0, 0.431, 0.8);    // #ff006e
+const vec4 glow = vec4(0.733, 0.0, 0.867, 0.4);  // #bb00dd
+const vec4 edge = vec4(0.533, 0.0, 0.733, 0.1);  // #8800bb
+
+void main() {
+    float d = length(gl_PointCoord - vec2(0.5)) * 2.0;
+    if (d > 1.0) {
+        discard;
+    }
+    vec4 c = d < 0.4 ? mix(core, glow, d / 0.4) : mix(glow, edge, (d - 0.4) / 0.6);
+    gl_FragColor = vec4(c.rgb, c.a * opacity);
+}
+"""
+
+
+def gl_stars_enabled() -> bool:
+    """Whether to use the OpenGL star field (opt in with SCRUBMETA_GL_STARS=1)."""
+    return os.environ.get("SCRUBMETA_GL_STARS", "") == "1"
+
+
+class GLStarsCentralWidget(QOpenGLWidget):
+    """Central widget drawing the star field on the GPU before rendering UI.
+
+    Each star is one point sprite; the radial glow is evaluated in the
+    fragment shader, so per-frame CPU work is a single buffer upload.
+    """
+
+    def __init__(self, stars: StarField, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.stars = stars
+        self._program: QOpenGLShaderProgram | None = None
+        self._vbo = QOpenGLBuffer(QOpenGLBuffer.VertexBuffer)
+        self._vao = QOpenGLVertexArrayObject()
+        self._star_location = -1
+
+    def refresh_stars(self) -> None:
+        """Nothing to pre-render; paintGL uploads the current star state."""
+
+    def initializeGL(self) -> None:
+        """Compile the sprite shaders and allocate the star buffer."""
+        gl = self.context().functions()
+        background = QColor(Colors.BACKGROUND)
+        gl.glClearColor(background.redF(), background.greenF(), background.blueF(), 1.0)
+
+        program = QOpenGLShaderProgram(self)
+        program.addShaderFromSourceCode(QOpenGLShader.Vertex, VERTEX_SHADER)
+        program.addShaderFromSourceCode(QOpenGLShader.Fragment, FRAGMENT_SHADER)
+        if not program.link():
+            # Leave _program unset: paintGL then draws just the background
+            return
+        self._program = program
+        self._star_location = program.attributeLocation("star")
+
+        self._vao.create()
+        self._vbo.create()
+        self._vbo.setUsagePattern(QOpenGLBuffer.DynamicDraw)
+
+        gl.glEnable(GL_BLEND)
+        gl.glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        gl.glEnable(GL_PROGRAM_POINT_SIZE)
+        if self.context().format().profile() != QSurfaceFormat.CoreProfile:
+            # Legacy contexts only fill gl_PointCoord with sprites enabled
+            gl.glEnable(GL_POINT_SPRITE)
+
+    def paintGL(self) -> None:
+        """Upload current star state and draw every star in one call."""
+        gl = self.context().functions()
+        gl.glClear(GL_COLOR_BUFFER_BIT)
+        stars = self.stars
+        if self._program is None or not len(stars):
+            return
+
+        # Interleave straight into float32; column_stack would upcast via int32 to float64
+        data = np.empty((len(stars), STAR_STRIDE), dtype=np.float32)
+        data[:, 0] = stars.x
+        data[:, 1] = stars.y
+        data[:, 2] = stars.glow_radius
+        data[:, 3] = stars.current_opacity
+        raw = data.tobytes()
+
+        self._program.bind()
+        self._program.setUniformValue("viewport", float(self.width()), float(self.height()))
+        self._program.setUniformValue("dpr", float(self.devicePixelRatioF()))
+
+        self._vao.bind()
+        self._vbo.bind()
+        if self._vbo.size() < len(raw):
+            self._vbo.allocate(raw, len(raw))
+        else:
+            self._vbo.write(0, raw, len(raw))
+        self._program.enableAttributeArray(self._star_location)
+        self._program.setAttributeBuffer(
+            self._star_location, GL_FLOAT, 0, STAR_STRIDE, STAR_STRIDE * np.dtype(np.float32).itemsize
+        )
+
+        gl.glDrawArrays(GL_POINTS, 0, len(stars))
+
+        self._program.disableAttributeArray(self._star_location)
+        self._vbo.release()
+        self._vao.release()
+        self._program.release()
@@ -53,7 +53,7 @@ class Radius:
     MEDIUM = 12 # Cards, standard buttons, groups
     LARGE = 16  # Main containers, panels
 
-def get_qss() -> str:
+def _build_qss() -> str:
     """Generate Qt Style Sheet (QSS) for the synthwave theme."""
 
     qss = f"""
@@ -456,6 +456,76 @@ def get_qss() -> str:
     return qss
 
 
+def _build_window_qss() -> str:
+    """Generate the main window stylesheet, scoped by object name.
+
+    Set once on the MainWindow so its widgets need no inline stylesheets;
+    the status pill variant is selected by its "state" property.
+    """
+
+    return f"""
+    #statusPill {{
+        background-color: rgba(61, 0, 102, 0.6);
+        border: 1px solid {Colors.TEXT_SECONDARY};
+        border-radius: 16px;
+        padding: 6px 14px;
+        color: {Colors.TEXT_SECONDARY};
+        font-weight: bold;
+        font-size: 10px;
+    }}
+
+    #statusPill[state="processing"] {{
+        border-color: {Colors.PRIMARY};
+        color: {Colors.PRIMARY};
+    }}
+
+    #statusPill[state="success"] {{
+        border-color: {Colors.SUCCESS};
+        color: {Colors.SUCCESS};
+    }}
+
+    #statusPill[state="error"] {{
+        border-color: {Colors.ERROR};
+        color: {Colors.ERROR};
+    }}
+
+    QScrollArea#controlsScroll {{
+        border: none;
+        background-color: transparent;
+    }}
+
+    QLabel#summaryLabel, QLabel#filterLabel {{
+        color: {Colors.TEXT_SECONDARY};
+        font-size: 11px;
+    }}
+
+    QLabel#resultsPlaceholder {{
+        color: {Colors.TEXT_SECONDARY};
+        font-size: 11px;
+    }}
+
+    QLabel#ffmpegLabel, QLabel#currentFileLabel {{
+        color: {Colors.TEXT_SECONDARY};
+        font-size: 10px;
+    }}
+    """
+
+
+# Colors are static, so both stylesheets are built once at import
+_QSS = _build_qss()
+_WINDOW_QSS = _build_window_qss()
+
+
+def get_qss() -> str:
+    """Return the application stylesheet for the synthwave theme."""
+    return _QSS
+
+
+def get_window_qss() -> str:
+    """Return the main window stylesheet (see _build_window_qss)."""
+    return _WINDOW_QSS
+
+
 def apply_theme(app: QApplication) -> None:
     """Apply the synthwave theme to the application."""
 
@@ -2,26 +2,54 @@
 
 from __future__ import annotations
 
+import csv
+import json
+import multiprocessing
+import time
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QRunnable, Signal, Slot
 
 from ..core import CancelToken, ScrubCallbacks, scrub_path
 from ..utils.result import ScrubResult
 
+REPORT_FIELDS = ["status", "input", "output", "message"]
+
+# Result rows are sent to the UI in batches of up to this many rows...
+RESULT_BATCH_SIZE = 64
+# ...or after this many seconds, whichever comes first
+RESULT_BATCH_INTERVAL = 0.1
+
 
 class ScrubWorker(QObject):
-    """Runs scrub operations in a background thread and emits UI-friendly signals."""
+    """Runs scrub operations in a background thread and emits UI-friendly signals.
+
+    One worker lives on a persistent thread for the whole session: call
+    configure() from the UI thread, then invoke run() through a queued
+    connection for each scrub.
+    """
 
     progress = Signal(int, int)  # current, total
     status = Signal(str)
-    result = Signal(dict)  # row data for the table
+    results = Signal(list)  # batch of row dicts for the table
     finished = Signal(dict)  # summary dict
     error = Signal(str)
     started = Signal()
 
-    def __init__(
+    def __init__(self) -> None:
+        super().__init__()
+        self.input_path = Path()
+        self.output_dir = Path()
+        self.recursive = False
+        self.keep_structure = False
+        self.overwrite = False
+        self.dry_run = False
+        self.ffmpeg_cmd = "ffmpeg"
+        self.workers = -1
+        self.cancel_token = CancelToken()
+
+    def configure(
         self,
         input_path: Path,
         output_dir: Path,
@@ -30,8 +58,12 @@ class ScrubWorker(QObject):
         overwrite: bool,
         dry_run: bool,
         ffmpeg_cmd: str,
+        workers: int = -1,
     ) -> None:
-        super().__init__()
+        """Set the parameters for the next run, with a fresh cancel token.
+
+        workers is passed to scrub_path: -1 scrubs with one process per CPU.
+        """
         self.input_path = input_path
         self.output_dir = output_dir
         self.recursive = recursive
@@ -39,6 +71,7 @@ class ScrubWorker(QObject):
         self.overwrite = overwrite
         self.dry_run = dry_run
         self.ffmpeg_cmd = ffmpeg_cmd
+        self.workers = workers
         self.cancel_token = CancelToken()
 
     def request_cancel(self) -> None:
@@ -56,8 +89,20 @@ class ScrubWorker(QObject):
             "message": message,
         }
 
+    @Slot()
     def run(self) -> None:
         """Execute scrubbing and emit signals for UI consumption."""
+        # Rows for the results table, sent in batches rather than one signal per file
+        pending: List[Dict[str, str]] = []
+        last_flush = time.monotonic()
+
+        def flush_results() -> None:
+            nonlocal pending, last_flush
+            if pending:
+                self.results.emit(pending)
+                pending = []
+            last_flush = time.monotonic()
+
         try:
             self.started.emit()
             self.status.emit("Scanning…")
@@ -68,9 +113,14 @@ class ScrubWorker(QObject):
 
             def on_file_start(index: int, total: int, file_path: Path) -> None:
                 self.status.emit(f"Scrubbing {index}/{total}: {file_path.name}")
+                # A slow file can hold back the next result; don't let queued rows wait on it
+                if pending and time.monotonic() - last_flush > RESULT_BATCH_INTERVAL:
+                    flush_results()
 
             def on_file_result(res: ScrubResult) -> None:
-                self.result.emit(self._to_row(res))
+                pending.append(self._to_row(res))
+                if len(pending) >= RESULT_BATCH_SIZE or time.monotonic() - last_flush > RESULT_BATCH_INTERVAL:
+                    flush_results()
 
             def on_progress(current: int, total: int) -> None:
                 self.progress.emit(current, total)
@@ -93,6 +143,11 @@ class ScrubWorker(QObject):
                 ffmpeg_cmd=self.ffmpeg_cmd,
                 callbacks=callbacks,
                 cancel_token=self.cancel_token,
+                workers=self.workers,
+                # Rows reach the table through on_file_result; no need to keep them
+                collect_results=False,
+                # Never fork this process: Qt's threads may hold locks the child would inherit
+                mp_context=multiprocessing.get_context("spawn"),
             )
 
             summary_dict = {
@@ -103,11 +158,13 @@ class ScrubWorker(QObject):
                 "cancelled": summary.cancelled,
             }
 
+            flush_results()
             status_text = "Cancelled" if summary.cancelled else "Done"
             self.status.emit(status_text)
             self.finished.emit(summary_dict)
 
         except Exception as exc:  # pylint: disable=broad-except
+            flush_results()
             self.error.emit(str(exc))
             self.status.emit("Error")
             self.finished.emit(
@@ -119,3 +176,51 @@ class ScrubWorker(QObject):
                     "cancelled": False,
                 }
             )
+
+
+class ExportSignals(QObject):
+    """Signals emitted by ReportExporter (QRunnable can't define its own)."""
+
+    finished = Signal(str, int)  # path, row count
+    error = Signal(str)
+
+
+class ReportExporter(QRunnable):
+    """Writes result rows to a CSV or JSON report on a thread-pool thread."""
+
+    def __init__(self, rows: List[dict], path: str) -> None:
+        super().__init__()
+        self.rows = rows
+        self.path = path
+        self.signals = ExportSignals()
+
+    def run(self) -> None:
+        """Write the report and emit finished or error."""
+        try:
+            if self.path.lower().endswith(".json"):
+                self._write_json()
+            else:
+                self._write_csv()
+        except Exception as exc:  # pylint: disable=broad-except
+            # Always answer with a signal so the window can clear its export job
+            self.signals.error.emit(str(exc))
+            return
+        self.signals.finished.emit(self.path, len(self.rows))
+
+    def _write_csv(self) -> None:
+        # Undecodable file names come through as surrogate escapes; write their original bytes
+        with open(self.path, "w", newline="", encoding="utf-8", errors="surrogateescape") as f:
+            writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS)
+            writer.writeheader()
+            writer.writerows(iter(self.rows))
+
+    def _write_json(self) -> None:
+        # A JSON array written one compact row per line, without building the whole string
+        with open(self.path, "w", encoding="utf-8", errors="surrogateescape") as f:
+            f.write("[")
+            separator = "\n"
+            for row in self.rows:
+                f.write(separator)
+                f.write(json.dumps(row, ensure_ascii=False, separators=(",", ":")))
+                separator = ",\n"
+            f.write("\n]\n")
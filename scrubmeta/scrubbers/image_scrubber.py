@@ -1,158 +1,309 @@
 """Image metadata scrubber for JPG, PNG, WebP files."""
 
 from pathlib import Path
-import tempfile
-import shutil
 import os
 import errno
+import mmap
+from typing import BinaryIO, List, Optional
 
-from PIL import Image, UnidentifiedImageError
+from PIL import Image, PngImagePlugin, UnidentifiedImageError
 
-from ..utils.result import ScrubResult, ResultType, ErrorCategory
+from ..constants import IMAGE_EXTENSIONS, JPEG_EXTENSIONS, PNG_EXTENSIONS, WEBP_EXTENSIONS
+from ..utils.result import ScrubResult, ResultType, ErrorCategory, input_error_result, output_permission_result
+from ..utils.reflink import reflink_fd
+from ..utils.tmpfile import AtomicOutputFile
 
 
 class ImageScrubber:
     """Scrubs metadata from image files."""
 
-    SUPPORTED_FORMATS = {'.jpg', '.jpeg', '.png', '.webp'}
+    SUPPORTED_FORMATS = IMAGE_EXTENSIONS
+    JPEG_FORMATS = JPEG_EXTENSIONS
+    PNG_FORMATS = PNG_EXTENSIONS
+    WEBP_FORMATS = WEBP_EXTENSIONS
 
     @classmethod
     def can_handle(cls, file_path: Path) -> bool:
         """Check if this scrubber can handle the file."""
-        return file_path.suffix.lower() in cls.SUPPORTED_FORMATS
+        return os.path.splitext(file_path.name)[1].lower() in cls.SUPPORTED_FORMATS
 
     @classmethod
-    def scrub(cls, input_path: Path, output_path: Path) -> ScrubResult:
+    def scrub(
+        cls, input_path: Path, output_path: Path, allow_reflink: bool = False, exclusive: bool = False
+    ) -> ScrubResult:
         """
         Scrub metadata from an image file.
 
         Args:
             input_path: Source image file
             output_path: Destination for cleaned image
+            allow_reflink: Clone instead of copying when there is nothing to strip
+            exclusive: Never replace an existing file at output_path; publish
+                under the next free "_clean_N" name (reported in the result)
 
         Returns:
             ScrubResult with operation outcome
         """
-        # Validate input exists and is readable
-        if not input_path.exists():
+        # Stringify once; os would otherwise fspath() the Paths on every call
+        src = os.fspath(input_path)
+        dst = os.fspath(output_path)
+        suffix = input_path.suffix.lower()
+
+        # Opening is the existence and permission check; the same handle is
+        # then read by the segment walker or Pillow
+        try:
+            src_file = open(src, 'rb')
+        except OSError as e:
+            return input_error_result(input_path, e)
+
+        try:
+            # Write to an unnamed (or temporary) file and publish it only once complete
+            with src_file, AtomicOutputFile(dst, suffix=output_path.suffix, exclusive=exclusive) as tmp:
+                # JPEGs and PNGs just have their metadata segments dropped and
+                # WebPs without metadata are copied; anything else goes through
+                # a Pillow re-encode
+                stripped = cls._scrub_fast(src_file, suffix, tmp.file, allow_reflink)
+                if stripped is None:
+                    stripped = True
+                    # Open and validate image
+                    with Image.open(src_file) as img:
+                        img_format = img.format
+
+                        if not img_format:
+                            raise ValueError("Could not determine image format")
+
+                        # Re-encode straight from the decoded buffer; drop every
+                        # metadata container and pass empty ones explicitly so
+                        # the encoders can't fall back to the source's
+                        img.load()
+                        img.info = {}
+
+                        # Determine save format
+                        if img_format == 'JPEG':
+                            img.save(tmp.file, 'JPEG', quality=95, optimize=True, exif=b'', icc_profile=None)
+                        elif img_format == 'PNG':
+                            img.save(tmp.file, 'PNG', optimize=True, pnginfo=PngImagePlugin.PngInfo())
+                        elif img_format == 'WEBP':
+                            img.save(tmp.file, 'WEBP', quality=95, exif=b'', xmp=b'', icc_profile=None)
+                        else:
+                            img.save(tmp.file, img_format)
+
+                # Atomic publish at the final destination
+                output_path = Path(tmp.commit())
+
+            return ScrubResult(
+                result_type=ResultType.SUCCESS,
+                input_path=input_path,
+                output_path=output_path,
+                metadata_removed="EXIF/IPTC/XMP metadata" if stripped else "no metadata found"
+            )
+
+        except UnidentifiedImageError:
             return ScrubResult(
                 result_type=ResultType.ERROR,
                 input_path=input_path,
-                error="File not found",
+                error="Not a valid image file or unsupported format",
                 error_category=ErrorCategory.INPUT_ERROR,
-                fix_hint="Verify the file path is correct"
+                fix_hint="Verify file is a valid JPG, PNG, or WebP image"
             )
 
-        if not os.access(input_path, os.R_OK):
+        except PermissionError:
+            # The input is already open, so this is the output side
+            return output_permission_result(input_path, output_path)
+
+        except OSError as e:
+            if e.errno == errno.ENOSPC:
+                error_msg = "No space left on device"
+                hint = "Free up disk space on the output drive"
+            elif e.errno == errno.EROFS:
+                error_msg = "Output filesystem is read-only"
+                hint = "Choose a writable output location"
+            else:
+                error_msg = f"I/O error: {e}"
+                hint = "Check filesystem and disk health"
+
             return ScrubResult(
                 result_type=ResultType.ERROR,
                 input_path=input_path,
-                error="Cannot read file (permission denied)",
-                error_category=ErrorCategory.PERMISSION_ERROR,
-                fix_hint="Check file permissions with chmod or run with appropriate privileges"
+                error=error_msg,
+                error_category=ErrorCategory.OUTPUT_ERROR,
+                fix_hint=hint
             )
 
-        tmp_path = None
-        try:
-            # Validate output directory
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            if not os.access(output_path.parent, os.W_OK):
-                return ScrubResult(
-                    result_type=ResultType.ERROR,
-                    input_path=input_path,
-                    error="Cannot write to output directory (permission denied)",
-                    error_category=ErrorCategory.PERMISSION_ERROR,
-                    fix_hint=f"Check write permissions for: {output_path.parent}"
-                )
-
-            # Use a temporary file to ensure atomic writes
-            with tempfile.NamedTemporaryFile(delete=False, suffix=output_path.suffix, dir=output_path.parent) as tmp:
-                tmp_path = Path(tmp.name)
-
-            try:
-                # Open and validate image
-                with Image.open(input_path) as img:
-                    img_format = img.format
-
-                    if not img_format:
-                        raise ValueError("Could not determine image format")
-
-                    # Create a new image without metadata
-                    data = list(img.getdata())
-                    clean_img = Image.new(img.mode, img.size)
-                    clean_img.putdata(data)
-
-                    # Determine save format
-                    if img_format == 'JPEG':
-                        clean_img.save(tmp_path, 'JPEG', quality=95, optimize=True)
-                    elif img_format == 'PNG':
-                        clean_img.save(tmp_path, 'PNG', optimize=True)
-                    elif img_format == 'WEBP':
-                        clean_img.save(tmp_path, 'WEBP', quality=95)
-                    else:
-                        clean_img.save(tmp_path, img_format)
-
-                # Atomic move to final destination
-                shutil.move(str(tmp_path), str(output_path))
-                tmp_path = None  # Successfully moved
-
-                return ScrubResult(
-                    result_type=ResultType.SUCCESS,
-                    input_path=input_path,
-                    output_path=output_path,
-                    metadata_removed="EXIF/IPTC/XMP metadata"
-                )
-
-            except UnidentifiedImageError:
-                return ScrubResult(
-                    result_type=ResultType.ERROR,
-                    input_path=input_path,
-                    error="Not a valid image file or unsupported format",
-                    error_category=ErrorCategory.INPUT_ERROR,
-                    fix_hint="Verify file is a valid JPG, PNG, or WebP image"
-                )
-
-            except OSError as e:
-                if e.errno == errno.ENOSPC:
-                    error_msg = "No space left on device"
-                    hint = "Free up disk space on the output drive"
-                elif e.errno == errno.EROFS:
-                    error_msg = "Output filesystem is read-only"
-                    hint = "Choose a writable output location"
-                else:
-                    error_msg = f"I/O error: {e}"
-                    hint = "Check filesystem and disk health"
-
-                return ScrubResult(
-                    result_type=ResultType.ERROR,
-                    input_path=input_path,
-                    error=error_msg,
-                    error_category=ErrorCategory.OUTPUT_ERROR,
-                    fix_hint=hint
-                )
-
-            except (ValueError, RuntimeError) as e:
-                return ScrubResult(
-                    result_type=ResultType.ERROR,
-                    input_path=input_path,
-                    error=f"Processing failed: {e}",
-                    error_category=ErrorCategory.PROCESSING_ERROR,
-                    fix_hint="File may be corrupted or use an unusual image variant"
-                )
-
-            except Exception as e:
-                return ScrubResult(
-                    result_type=ResultType.ERROR,
-                    input_path=input_path,
-                    error=f"Unexpected error: {type(e).__name__}: {e}",
-                    error_category=ErrorCategory.PROCESSING_ERROR,
-                    fix_hint="Report this error if it persists"
-                )
+        except (ValueError, RuntimeError) as e:
+            return ScrubResult(
+                result_type=ResultType.ERROR,
+                input_path=input_path,
+                error=f"Processing failed: {e}",
+                error_category=ErrorCategory.PROCESSING_ERROR,
+                fix_hint="File may be corrupted or use an unusual image variant"
+            )
 
+        except Exception as e:
+            return ScrubResult(
+                result_type=ResultType.ERROR,
+                input_path=input_path,
+                error=f"Unexpected error: {type(e).__name__}: {e}",
+                error_category=ErrorCategory.PROCESSING_ERROR,
+                fix_hint="Report this error if it persists"
+            )
+
+    @classmethod
+    def _scrub_fast(cls, f: BinaryIO, suffix: str, out: BinaryIO, allow_reflink: bool = False) -> Optional[bool]:
+        """
+        Copy an image without its metadata, leaving the image data untouched.
+
+        JPEG: drops APP0-APP15 (EXIF, XMP, ICC, IPTC, thumbnails, ...) and COM
+        segments, keeping a bare JFIF APP0 header (no thumbnail) and the
+        Adobe APP14 segment that decoders need for CMYK/YCCK color.
+        PNG: keeps only the chunks listed in PNG_KEEP_CHUNKS.
+        Anything after the end marker (appended images or videos) is dropped.
+        WebP: only files without metadata chunks are handled, by copying them.
+
+        Args:
+            f: Source image file, open for reading; its position is left unchanged
+            suffix: Lowercased suffix of the source file
+            out: Binary file the stripped copy is written to
+            allow_reflink: Clone instead of copying when there is nothing to strip
+
+        Returns:
+            True if metadata was stripped, False if there was none and the
+            file was copied unchanged, None if this isn't a stream the walker
+            can handle (nothing is written then)
+        """
+        if suffix in cls.JPEG_FORMATS:
+            strip = _strip_jpeg_segments
+        elif suffix in cls.PNG_FORMATS:
+            strip = _strip_png_chunks
+        elif suffix in cls.WEBP_FORMATS:
+            strip = _probe_webp_chunks
+        else:
+            return None
+
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return None  # Empty file
+        try:
+            pieces = strip(data)
+            if pieces is None:
+                return None
+            if sum(map(len, pieces)) == len(data):
+                # Nothing to drop: copy (or clone) the original untouched
+                if not (allow_reflink and reflink_fd(f.fileno(), out.fileno())):
+                    out.write(data)
+                return False
         finally:
-            # Ensure temp file cleanup
-            if tmp_path and tmp_path.exists():
-                try:
-                    tmp_path.unlink()
-                except Exception:
-                    pass  # Best effort cleanup
+            data.close()
+        out.writelines(pieces)
+        return True
+
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Chunks describing the image itself (incl. APNG animation); everything else
+# - tEXt/zTXt/iTXt, eXIf, tIME, iCCP, private chunks - is metadata
+PNG_KEEP_CHUNKS = {
+    b'IHDR', b'PLTE', b'IDAT', b'IEND', b'tRNS', b'gAMA', b'cHRM', b'sRGB',
+    b'sBIT', b'bKGD', b'pHYs', b'acTL', b'fcTL', b'fdAT',
+}
+
+
+def _strip_png_chunks(data: mmap.mmap) -> Optional[List[bytes]]:
+    """Return the chunks of a PNG to keep, or None if it can't be parsed."""
+    size = len(data)
+    if data[:8] != PNG_SIGNATURE:
+        return None
+    pieces = [PNG_SIGNATURE]
+    pos = 8
+    while pos + 12 <= size:
+        length = int.from_bytes(data[pos:pos + 4], 'big')
+        chunk_type = data[pos + 4:pos + 8]
+        end = pos + 12 + length  # length, type, data, CRC
+        if end > size:
+            return None
+        if chunk_type in PNG_KEEP_CHUNKS:
+            # Copied with its CRC unchanged
+            pieces.append(data[pos:end])
+        pos = end
+        if chunk_type == b'IEND':
+            return pieces
+    return None
+
+
+# RIFF chunks holding WebP metadata; VP8X flags them, so they can't just be dropped
+WEBP_METADATA_CHUNKS = {b'EXIF', b'XMP ', b'ICCP'}
+
+
+def _probe_webp_chunks(data: mmap.mmap) -> Optional[List[bytes]]:
+    """Return the whole WebP if it has no metadata chunks, else None."""
+    size = len(data)
+    if size < 12 or data[:4] != b'RIFF' or data[8:12] != b'WEBP':
+        return None
+    pos = 12
+    while pos + 8 <= size:
+        if data[pos:pos + 4] in WEBP_METADATA_CHUNKS:
+            return None
+        length = int.from_bytes(data[pos + 4:pos + 8], 'little')
+        # Chunk payloads are padded to an even length
+        pos += 8 + length + (length & 1)
+    if pos != size:
+        return None  # Truncated, or trailing bytes after the last chunk
+    return [data[:]]
+
+
+def _strip_jpeg_segments(data: mmap.mmap) -> Optional[List[bytes]]:
+    """Return the byte runs of a JPEG to keep, or None if it can't be parsed."""
+    size = len(data)
+    if data[:2] != b'\xff\xd8':
+        return None
+    pieces = [data[:2]]
+    pos = 2
+    while pos < size:
+        if data[pos] != 0xFF:
+            return None
+        # Markers may be preceded by any number of 0xFF fill bytes
+        while pos < size and data[pos] == 0xFF:
+            pos += 1
+        if pos >= size:
+            return None
+        marker = data[pos]
+        start = pos - 1
+        pos += 1
+        if marker == 0xD9:  # EOI
+            pieces.append(b'\xff\xd9')
+            return pieces
+        if marker == 0x01 or 0xD0 <= marker <= 0xD7:  # Standalone markers
+            pieces.append(data[start:pos])
+            continue
+        if pos + 2 > size:
+            return None
+        length = (data[pos] << 8) | data[pos + 1]
+        end = pos + length
+        if length < 2 or end > size:
+            return None
+        is_metadata = marker == 0xFE or (0xE0 <= marker <= 0xEF and not (
+            marker == 0xEE and data[pos + 2:pos + 7] == b'Adobe'
+            # A 16-byte JFIF header carries only version and density, no thumbnail
+            or marker == 0xE0 and length == 16 and data[pos + 2:pos + 7] == b'JFIF\0'))
+        if not is_metadata:
+            pieces.append(data[start:end])
+        pos = end
+        if marker == 0xDA:  # SOS: entropy-coded data runs until the next real marker
+            scan_start = pos
+            while True:
+                pos = data.find(b'\xff', pos)
+                if pos < 0:
+                    return None
+                following = pos + 1
+                while following < size and data[following] == 0xFF:
+                    following += 1
+                if following >= size:
+                    return None
+                if data[following] == 0x00 or 0xD0 <= data[following] <= 0xD7:
+                    # Stuffed 0xFF data byte or restart marker: still scan data
+                    pos = following + 1
+                    continue
+                break
+            pieces.append(data[scan_start:pos])
+    return None
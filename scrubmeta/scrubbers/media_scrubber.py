@@ -3,101 +3,341 @@
 from pathlib import Path
 import errno
 import os
+import re
 import shutil
+import struct
 import subprocess
-import tempfile
+import time
+from typing import BinaryIO, Dict, List, Optional, Set, Tuple
 
-from ..utils.result import ScrubResult, ResultType, ErrorCategory
+from ..constants import MEDIA_EXTENSIONS, MP4_EXTENSIONS
+from ..utils.result import ScrubResult, ResultType, ErrorCategory, input_error_result, output_permission_result
+from ..utils.tmpfile import AtomicOutputFile, make_tmpfile, publish_named
+
+# MP4/QuickTime boxes whose entire content is metadata (tags, GPS, XMP, stale
+# padding); retagged as 'free' with a zeroed payload so box sizes are unchanged
+_MP4_METADATA_BOXES = {b"udta", b"meta"}
+_MP4_PADDING_BOXES = {b"free", b"skip"}
+# uuid box type carrying XMP (Adobe XMP specification, part 3)
+_MP4_XMP_UUID = bytes.fromhex("be7acfcb97a942e89c71999491e3afac")
+# Boxes descended into when looking for metadata
+_MP4_CONTAINER_BOXES = {b"moov", b"trak", b"mdia"}
+# Full boxes starting with creation and modification times
+_MP4_TIMESTAMP_BOXES = {b"mvhd", b"tkhd", b"mdhd"}
+# Track handlers kept by an in-place edit; timed metadata (GPS, 'mebx',
+# 'camm'), text and other tracks need ffmpeg to drop them
+_MP4_MEDIA_HANDLERS = {b"vide", b"soun"}
+_ZEROS = memoryview(bytes(64 * 1024))
+
+# ffmpeg stderr phrases -> (category, fix hint), highest priority first
+_FFMPEG_ERRORS = (
+    (("No such file or directory", "does not exist"),
+     ErrorCategory.INPUT_ERROR, "Verify input file exists and path is correct"),
+    (("Permission denied",),
+     ErrorCategory.PERMISSION_ERROR, "Check file permissions or run with appropriate privileges"),
+    (("Invalid data", "moov atom not found"),
+     ErrorCategory.INPUT_ERROR, "File may be corrupted or not a valid media file"),
+    (("Codec", "not supported"),
+     ErrorCategory.PROCESSING_ERROR, "This media format may not be fully supported by ffmpeg"),
+)
+# One capture group per _FFMPEG_ERRORS entry, so a match's lastindex names its entry
+_FFMPEG_ERROR_RE = re.compile(
+    "|".join("(" + "|".join(re.escape(phrase) for phrase in phrases) + ")" for phrases, _, _ in _FFMPEG_ERRORS)
+)
+
+
+def _classify_ffmpeg_error(stderr: str) -> Tuple[ErrorCategory, str]:
+    """Pick an error category and fix hint for ffmpeg's stderr in a single scan."""
+    entry = min((match.lastindex for match in _FFMPEG_ERROR_RE.finditer(stderr)), default=None)
+    if entry is None:
+        return ErrorCategory.PROCESSING_ERROR, "Check ffmpeg output for details"
+    _, category, hint = _FFMPEG_ERRORS[entry - 1]
+    return category, hint
+
+
+def _mp4_metadata_edits(
+    f: BinaryIO, start: int, end: int, edits: List[Tuple[int, bytes]], containers: Set[bytes]
+) -> Optional[bool]:
+    """
+    Collect the writes that blank metadata in the boxes between start and end.
+
+    Only box headers and timestamp fields are read, so the cost depends on
+    the number of boxes rather than the file size. Tracks other than video
+    and audio, and track references (e.g. chapter tracks), can't be removed
+    this way, so files with them are left to ffmpeg.
+
+    Args:
+        f: MP4/QuickTime file open for reading
+        start: Offset of the first box
+        end: Offset just past the last box
+        edits: (offset, data) writes are appended here
+        containers: Types of the container boxes walked are added here
+
+    Returns:
+        Whether any metadata was found, or None if the boxes don't parse
+        or hold tracks that can't be edited in place
+    """
+    found = False
+    pos = start
+    while pos < end:
+        if end - pos < 8:
+            return None
+        f.seek(pos)
+        header = f.read(32)
+        size, box_type = struct.unpack(">I4s", header[:8])
+        header_size = 8
+        if size == 1:
+            if len(header) < 16:
+                return None
+            size = struct.unpack(">Q", header[8:16])[0]
+            header_size = 16
+        elif size == 0:
+            size = end - pos  # Box extends to the end of its parent
+        if size < header_size or pos + size > end:
+            return None
+
+        is_xmp = box_type == b"uuid" and header[header_size:header_size + 16] == _MP4_XMP_UUID
+        if box_type in _MP4_METADATA_BOXES or box_type in _MP4_PADDING_BOXES or is_xmp:
+            found = found or box_type not in _MP4_PADDING_BOXES
+            edits.append((pos + 4, b"free"))
+            for offset in range(pos + header_size, pos + size, len(_ZEROS)):
+                edits.append((offset, _ZEROS[:min(len(_ZEROS), pos + size - offset)]))
+        elif box_type in _MP4_TIMESTAMP_BOXES and size >= header_size + 4:
+            version = header[header_size]
+            width = 8 if version == 1 else 4
+            if size >= header_size + 4 + 2 * width:
+                f.seek(pos + header_size + 4)
+                if any(f.read(2 * width)):
+                    found = True
+                    edits.append((pos + header_size + 4, bytes(2 * width)))
+        elif box_type == b"tref":
+            return None
+        elif box_type == b"hdlr":
+            # Full box header, pre_defined, then the handler type
+            if header[header_size + 8:header_size + 12] not in _MP4_MEDIA_HANDLERS:
+                return None
+        elif box_type in _MP4_CONTAINER_BOXES:
+            containers.add(box_type)
+            inner = _mp4_metadata_edits(f, pos + header_size, pos + size, edits, containers)
+            if inner is None:
+                return None
+            found = found or inner
+        pos += size
+    return found
 
 
 class MediaScrubber:
     """Scrubs metadata from audio and video files using ffmpeg."""
 
-    SUPPORTED_FORMATS = {
-        # Video
-        ".mp4",
-        ".mov",
-        ".mkv",
-        ".avi",
-        ".m4v",
-        ".webm",
-        ".mpg",
-        ".mpeg",
-        # Audio
-        ".mp3",
-        ".wav",
-        ".flac",
-        ".m4a",
-        ".aac",
-        ".ogg",
-        ".opus",
-    }
+    SUPPORTED_FORMATS = MEDIA_EXTENSIONS
+
+    # Files handed to a single ffmpeg process by scrub_batch()
+    BATCH_SIZE = 32
+
+    # Containers edited in place by _scrub_mp4() instead of remuxed
+    MP4_FORMATS = MP4_EXTENSIONS
+
+    # Output options that drop global/stream metadata and chapters without re-encoding
+    _STRIP_ARGS = ("-map_metadata", "-1", "-map_chapters", "-1", "-c", "copy")
+
+    # Containers that accept any copied subtitle stream; for the others
+    # subtitles are left out rather than failing the remux
+    _SUBTITLE_FORMATS = frozenset({'.mkv'})
+
+    @classmethod
+    def _map_args(cls, n: int, output_path: Path) -> List[str]:
+        """
+        Stream maps feeding an output from input n only.
+
+        Shared by scrub() and scrub_batch(), so a file gets the same streams
+        whether or not it was batched: the first video and audio stream,
+        and the first subtitle stream where the container can hold it.
+        """
+        args = ["-map", f"{n}:v:0?", "-map", f"{n}:a:0?"]
+        if output_path.suffix.lower() in cls._SUBTITLE_FORMATS:
+            args += ["-map", f"{n}:s:0?"]
+        return args
 
     @classmethod
     def can_handle(cls, file_path: Path) -> bool:
         """Check if this scrubber can handle the file."""
-        return file_path.suffix.lower() in cls.SUPPORTED_FORMATS
+        return os.path.splitext(file_path.name)[1].lower() in cls.SUPPORTED_FORMATS
 
-    @staticmethod
-    def _ffmpeg_available(cmd: str) -> bool:
+    # ffmpeg commands already found on PATH
+    _found_commands: Set[str] = set()
+    # Command -> monotonic time it was last found missing. Misses are only
+    # trusted for MISSING_RECHECK_SECS, so a run of media files doesn't walk
+    # PATH once per file but an ffmpeg installed while the app is running
+    # is still picked up
+    _missing_commands: Dict[str, float] = {}
+    MISSING_RECHECK_SECS = 5.0
+
+    @classmethod
+    def _ffmpeg_available(cls, cmd: str) -> bool:
         """Check if ffmpeg binary is available via provided command."""
-        return shutil.which(cmd) is not None
+        if cmd in cls._found_commands:
+            return True
+        missed_at = cls._missing_commands.get(cmd)
+        now = time.monotonic()
+        if missed_at is not None and now - missed_at < cls.MISSING_RECHECK_SECS:
+            return False
+        if shutil.which(cmd) is None:
+            cls._missing_commands[cmd] = now
+            return False
+        cls._missing_commands.pop(cmd, None)
+        cls._found_commands.add(cmd)
+        return True
 
     @classmethod
-    def scrub(cls, input_path: Path, output_path: Path, ffmpeg_cmd: str = "ffmpeg") -> ScrubResult:
+    def _ffmpeg_cache_clear(cls) -> None:
+        """Forget cached ffmpeg lookups so the next check probes PATH again."""
+        cls._found_commands.clear()
+        cls._missing_commands.clear()
+
+    @staticmethod
+    def _validate_input(input_path: Path) -> Optional[ScrubResult]:
+        """Return an error result if the input can't be opened for reading, else None."""
+        # One open() reports both a missing file and a permission problem
+        try:
+            os.close(os.open(input_path, os.O_RDONLY))
+        except OSError as e:
+            return input_error_result(input_path, e)
+        return None
+
+    @staticmethod
+    def _ffmpeg_missing(input_path: Path, ffmpeg_cmd: str) -> ScrubResult:
+        return ScrubResult(
+            result_type=ResultType.SKIP,
+            input_path=input_path,
+            reason=f"ffmpeg not available at '{ffmpeg_cmd}' (required for audio/video scrubbing)",
+        )
+
+    @staticmethod
+    def _os_error_result(input_path: Path, e: OSError) -> ScrubResult:
+        if e.errno == errno.ENOSPC:
+            error_msg = "No space left on device"
+            hint = "Free up disk space on the output drive"
+        elif e.errno == errno.EROFS:
+            error_msg = "Output filesystem is read-only"
+            hint = "Choose a writable output location"
+        else:
+            error_msg = f"I/O error: {e}"
+            hint = "Check filesystem and disk health"
+
+        return ScrubResult(
+            result_type=ResultType.ERROR,
+            input_path=input_path,
+            error=error_msg,
+            error_category=ErrorCategory.OUTPUT_ERROR,
+            fix_hint=hint
+        )
+
+    @classmethod
+    def _scrub_mp4(
+        cls, input_path: Path, output_path: Path, allow_reflink: bool = False, exclusive: bool = False
+    ) -> Optional[ScrubResult]:
+        """
+        Strip metadata from an MP4/QuickTime file without remuxing it.
+
+        The file is copied in the kernel (or cloned), then metadata boxes
+        are overwritten with 'free' boxes of the same size and track
+        timestamps are zeroed. No box moves, so sample offsets in
+        stco/co64 stay valid and nothing else needs rewriting.
+
+        Args:
+            input_path: Source MP4-family file
+            output_path: Destination for cleaned media
+            allow_reflink: Clone the source instead of copying it when supported
+            exclusive: Never replace an existing file at output_path; publish
+                under the next free "_clean_N" name (reported in the result)
+
+        Returns:
+            ScrubResult, or None if the box layout isn't understood and
+            ffmpeg should handle the file
+        """
+        try:
+            src = open(input_path, "rb")
+        except OSError as e:
+            return input_error_result(input_path, e)
+
+        try:
+            with src:
+                size = os.fstat(src.fileno()).st_size
+                edits: List[Tuple[int, bytes]] = []
+                containers: Set[bytes] = set()
+                found = _mp4_metadata_edits(src, 0, size, edits, containers)
+                if found is None or b"moov" not in containers:
+                    # Let ffmpeg handle (and report on) files we can't parse
+                    # or whose extra tracks it has to drop
+                    return None
+
+                with AtomicOutputFile(str(output_path), suffix=output_path.suffix, exclusive=exclusive) as tmp:
+                    tmp.copy_from(src, allow_reflink)
+                    for offset, data in edits:
+                        tmp.file.seek(offset)
+                        tmp.file.write(data)
+                    output_path = Path(tmp.commit())
+        except PermissionError:
+            # The input is already open, so this is the output side
+            return output_permission_result(input_path, output_path)
+        except OSError as e:
+            return cls._os_error_result(input_path, e)
+
+        return ScrubResult(
+            result_type=ResultType.SUCCESS,
+            input_path=input_path,
+            output_path=output_path,
+            metadata_removed="Container metadata stripped in place" if found else "no metadata found",
+        )
+
+    @classmethod
+    def scrub(
+        cls,
+        input_path: Path,
+        output_path: Path,
+        ffmpeg_cmd: str = "ffmpeg",
+        allow_reflink: bool = False,
+        exclusive: bool = False,
+    ) -> ScrubResult:
         """
         Scrub metadata from an audio or video file using ffmpeg.
 
+        MP4/QuickTime files whose boxes parse are edited in place by
+        _scrub_mp4() and don't need ffmpeg; anything it can't read is
+        remuxed by ffmpeg as usual.
+
         Args:
             input_path: Source media file
             output_path: Destination for cleaned media
             ffmpeg_cmd: Path or command for ffmpeg binary
+            allow_reflink: Clone MP4-family sources before editing when supported
+            exclusive: Never replace an existing file at output_path; publish
+                under the next free "_clean_N" name (reported in the result)
 
         Returns:
             ScrubResult with operation outcome
         """
-        # Validate input
-        if not input_path.exists():
-            return ScrubResult(
-                result_type=ResultType.ERROR,
-                input_path=input_path,
-                error="File not found",
-                error_category=ErrorCategory.INPUT_ERROR,
-                fix_hint="Verify the file path is correct"
-            )
-
-        if not os.access(input_path, os.R_OK):
-            return ScrubResult(
-                result_type=ResultType.ERROR,
-                input_path=input_path,
-                error="Cannot read file (permission denied)",
-                error_category=ErrorCategory.PERMISSION_ERROR,
-                fix_hint="Check file permissions or run with appropriate privileges"
-            )
+        if os.path.splitext(input_path.name)[1].lower() in cls.MP4_FORMATS:
+            # Opens the input itself, reporting missing or unreadable files
+            result = cls._scrub_mp4(input_path, output_path, allow_reflink=allow_reflink, exclusive=exclusive)
+            if result is not None:
+                return result
+        else:
+            invalid = cls._validate_input(input_path)
+            if invalid is not None:
+                return invalid
 
         # Check ffmpeg availability
         if not cls._ffmpeg_available(ffmpeg_cmd):
-            return ScrubResult(
-                result_type=ResultType.SKIP,
-                input_path=input_path,
-                reason=f"ffmpeg not available at '{ffmpeg_cmd}' (required for audio/video scrubbing)",
-            )
-
-        # Validate output directory
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        if not os.access(output_path.parent, os.W_OK):
-            return ScrubResult(
-                result_type=ResultType.ERROR,
-                input_path=input_path,
-                error="Cannot write to output directory (permission denied)",
-                error_category=ErrorCategory.PERMISSION_ERROR,
-                fix_hint=f"Check write permissions for: {output_path.parent}"
-            )
+            return cls._ffmpeg_missing(input_path, ffmpeg_cmd)
 
         tmp_path = None
         try:
-            with tempfile.NamedTemporaryFile(delete=False, suffix=output_path.suffix, dir=output_path.parent) as tmp:
-                tmp_path = Path(tmp.name)
+            try:
+                with make_tmpfile(os.fspath(output_path.parent), output_path.suffix) as tmp:
+                    tmp_path = Path(tmp.name)
+            except PermissionError:
+                return output_permission_result(input_path, output_path)
 
             try:
                 cmd = [
@@ -108,36 +348,26 @@ class MediaScrubber:
                     "error",
                     "-i",
                     str(input_path),
-                    "-map_metadata",
-                    "-1",
-                    "-map_chapters",
-                    "-1",
-                    "-c",
-                    "copy",
+                    *cls._map_args(0, output_path),
+                    *cls._STRIP_ARGS,
                     str(tmp_path),
                 ]
 
-                proc = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+                # stdin closed so ffmpeg never waits on a terminal; stderr is
+                # kept as bytes and only decoded if it is reported
+                proc = subprocess.run(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    timeout=300,
+                )
 
                 if proc.returncode != 0:
-                    stderr = proc.stderr.strip()
+                    stderr = proc.stderr.decode("utf-8", "replace").strip()
 
                     # Parse ffmpeg error for better categorization
-                    if "No such file or directory" in stderr or "does not exist" in stderr:
-                        error_category = ErrorCategory.INPUT_ERROR
-                        fix_hint = "Verify input file exists and path is correct"
-                    elif "Permission denied" in stderr:
-                        error_category = ErrorCategory.PERMISSION_ERROR
-                        fix_hint = "Check file permissions or run with appropriate privileges"
-                    elif "Invalid data" in stderr or "moov atom not found" in stderr:
-                        error_category = ErrorCategory.INPUT_ERROR
-                        fix_hint = "File may be corrupted or not a valid media file"
-                    elif "Codec" in stderr or "not supported" in stderr:
-                        error_category = ErrorCategory.PROCESSING_ERROR
-                        fix_hint = "This media format may not be fully supported by ffmpeg"
-                    else:
-                        error_category = ErrorCategory.PROCESSING_ERROR
-                        fix_hint = "Check ffmpeg output for details"
+                    error_category, fix_hint = _classify_ffmpeg_error(stderr)
 
                     error_msg = stderr or "ffmpeg failed to scrub metadata"
                     return ScrubResult(
@@ -148,8 +378,8 @@ class MediaScrubber:
                         fix_hint=fix_hint
                     )
 
-                # Atomic move to final destination
-                shutil.move(str(tmp_path), str(output_path))
+                # Atomic rename (or link); the temp file is in the destination directory
+                output_path = Path(publish_named(os.fspath(tmp_path), os.fspath(output_path), exclusive))
                 tmp_path = None  # Successfully moved
 
                 return ScrubResult(
@@ -169,23 +399,7 @@ class MediaScrubber:
                 )
 
             except OSError as e:
-                if e.errno == errno.ENOSPC:
-                    error_msg = "No space left on device"
-                    hint = "Free up disk space on the output drive"
-                elif e.errno == errno.EROFS:
-                    error_msg = "Output filesystem is read-only"
-                    hint = "Choose a writable output location"
-                else:
-                    error_msg = f"I/O error: {e}"
-                    hint = "Check filesystem and disk health"
-
-                return ScrubResult(
-                    result_type=ResultType.ERROR,
-                    input_path=input_path,
-                    error=error_msg,
-                    error_category=ErrorCategory.OUTPUT_ERROR,
-                    fix_hint=hint
-                )
+                return cls._os_error_result(input_path, e)
 
         except Exception as e:
             return ScrubResult(
@@ -203,3 +417,124 @@ class MediaScrubber:
                     tmp_path.unlink()
                 except Exception:
                     pass  # Best effort cleanup
+
+    @classmethod
+    def scrub_batch(
+        cls,
+        pairs: List[Tuple[Path, Path]],
+        ffmpeg_cmd: str = "ffmpeg",
+        allow_reflink: bool = False,
+        exclusive: bool = False,
+    ) -> List[ScrubResult]:
+        """
+        Scrub several media files with a single ffmpeg process.
+
+        Each input is mapped to its own output in one multi-input,
+        multi-output invocation, so process start-up and codec
+        initialisation are paid once per batch instead of once per file.
+        If the batched command fails, it is split in half and each half
+        retried the same way, down to single files run through scrub(), so
+        one bad file can't fail its neighbours and errors are reported per
+        file. MP4-family files that can be edited in place never reach
+        ffmpeg.
+
+        Args:
+            pairs: (input_path, output_path) tuples
+            ffmpeg_cmd: Path or command for ffmpeg binary
+            allow_reflink: Clone MP4-family sources before editing when supported
+            exclusive: Never replace existing output files; see scrub()
+
+        Returns:
+            One ScrubResult per pair, in the same order
+        """
+        results: Dict[int, ScrubResult] = {}
+        for index, (src, dst) in enumerate(pairs):
+            if os.path.splitext(src.name)[1].lower() in cls.MP4_FORMATS:
+                result = cls._scrub_mp4(src, dst, allow_reflink=allow_reflink, exclusive=exclusive)
+                if result is not None:
+                    results[index] = result
+        remaining = [index for index in range(len(pairs)) if index not in results]
+
+        if len(remaining) < 2 or not cls._ffmpeg_available(ffmpeg_cmd):
+            for index in remaining:
+                src, dst = pairs[index]
+                results[index] = cls.scrub(src, dst, ffmpeg_cmd=ffmpeg_cmd, exclusive=exclusive)
+            return [results[index] for index in range(len(pairs))]
+
+        tmp_paths: Dict[int, Path] = {}
+        try:
+            for index in remaining:
+                src, dst = pairs[index]
+                invalid = cls._validate_input(src)
+                if invalid is not None:
+                    results[index] = invalid
+                    continue
+                try:
+                    with make_tmpfile(os.fspath(dst.parent), dst.suffix) as tmp:
+                        tmp_paths[index] = Path(tmp.name)
+                except PermissionError:
+                    results[index] = output_permission_result(src, dst)
+
+            if not tmp_paths:
+                return [results[index] for index in range(len(pairs))]
+
+            cmd = [ffmpeg_cmd, "-y", "-hide_banner", "-loglevel", "error"]
+            for index in tmp_paths:
+                cmd += ["-i", str(pairs[index][0])]
+            for n, (index, tmp_path) in enumerate(tmp_paths.items()):
+                # Explicit maps keep each output fed from its own input only
+                cmd += [*cls._map_args(n, pairs[index][1]), *cls._STRIP_ARGS, str(tmp_path)]
+
+            try:
+                # Failures are retried (and reported) per file, so no output is kept
+                proc = subprocess.run(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=300 * len(tmp_paths),
+                )
+                batch_ok = proc.returncode == 0
+            except (subprocess.TimeoutExpired, OSError):
+                batch_ok = False
+
+            if not batch_ok:
+                # Retry each half as its own batch: one bad file then costs a
+                # few extra ffmpeg starts rather than one per file in the batch
+                failed = list(tmp_paths)
+                half = len(failed) // 2
+                for part in (failed[:half], failed[half:]):
+                    retried = cls.scrub_batch(
+                        [pairs[index] for index in part], ffmpeg_cmd=ffmpeg_cmd, exclusive=exclusive
+                    )
+                    results.update(zip(part, retried))
+            else:
+                for index in list(tmp_paths):
+                    src, dst = pairs[index]
+                    try:
+                        dst = Path(publish_named(os.fspath(tmp_paths[index]), os.fspath(dst), exclusive))
+                    except OSError as e:
+                        results[index] = cls._os_error_result(src, e)
+                        continue
+                    del tmp_paths[index]  # Successfully moved
+                    results[index] = ScrubResult(
+                        result_type=ResultType.SUCCESS,
+                        input_path=src,
+                        output_path=dst,
+                        metadata_removed="Container metadata stripped via ffmpeg",
+                    )
+
+        except OSError as e:
+            for index, (src, _) in enumerate(pairs):
+                results.setdefault(index, cls._os_error_result(src, e))
+
+        finally:
+            # Ensure temp file cleanup
+            for tmp_path in tmp_paths.values():
+                try:
+                    if tmp_path.exists():
+                        tmp_path.unlink()
+                except Exception:
+                    pass  # Best effort cleanup
+
+        return [results[index] for index in range(len(pairs))]
@@ -1,19 +1,28 @@
 """OOXML (Office document) metadata scrubber for DOCX, XLSX, PPTX."""
 
 from pathlib import Path
-import tempfile
-import shutil
 import zipfile
 import os
 import errno
+import mmap
+import struct
 
-from ..utils.result import ScrubResult, ResultType, ErrorCategory
+from ..constants import OOXML_EXTENSIONS
+from ..utils.result import ScrubResult, ResultType, ErrorCategory, input_error_result, output_permission_result
+from ..utils.tmpfile import AtomicOutputFile
+
+# Fixed part of a ZIP local file header, before the name and extra field
+LOCAL_HEADER_SIZE = 30
+# General purpose flag bit 3: sizes and CRC follow the data instead
+DATA_DESCRIPTOR_FLAG = 0x08
+# Timestamp given to every output entry (the earliest a ZIP can hold)
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
 
 
 class OOXMLScrubber:
     """Scrubs metadata from Office Open XML documents."""
 
-    SUPPORTED_FORMATS = {'.docx', '.xlsx', '.pptx'}
+    SUPPORTED_FORMATS = OOXML_EXTENSIONS
 
     # Common metadata files in OOXML archives
     METADATA_FILES = {
@@ -25,126 +34,104 @@ class OOXMLScrubber:
     @classmethod
     def can_handle(cls, file_path: Path) -> bool:
         """Check if this scrubber can handle the file."""
-        return file_path.suffix.lower() in cls.SUPPORTED_FORMATS
+        return os.path.splitext(file_path.name)[1].lower() in cls.SUPPORTED_FORMATS
 
     @classmethod
-    def scrub(cls, input_path: Path, output_path: Path) -> ScrubResult:
+    def scrub(
+        cls, input_path: Path, output_path: Path, allow_reflink: bool = False, exclusive: bool = False
+    ) -> ScrubResult:
         """
         Scrub metadata from an OOXML document.
 
         Args:
             input_path: Source OOXML file
             output_path: Destination for cleaned document
+            allow_reflink: Clone instead of copying when there is nothing to strip
+            exclusive: Never replace an existing file at output_path; publish
+                under the next free "_clean_N" name (reported in the result)
 
         Returns:
             ScrubResult with operation outcome
         """
-        # Validate input
-        if not input_path.exists():
+        # Opening is the existence and permission check; the same handle
+        # serves zipfile's central directory read and maps the raw member data
+        try:
+            raw_in = open(input_path, 'rb')
+        except OSError as e:
+            return input_error_result(input_path, e)
+
+        try:
+            with raw_in, zipfile.ZipFile(raw_in, 'r') as zip_in:
+                members = zip_in.infolist()
+                # Track which metadata files are removed
+                removed_files = [info.filename for info in members if info.filename in cls.METADATA_FILES]
+                # Entry timestamps and comments are reset too
+                stale_entries = bool(zip_in.comment) or any(
+                    info.date_time != ZIP_EPOCH or info.comment for info in members
+                )
+
+                # Write to an unnamed (or temporary) file and publish it only once complete
+                with AtomicOutputFile(os.fspath(output_path), suffix=output_path.suffix, exclusive=exclusive) as tmp:
+                    if removed_files or stale_entries:
+                        # Create cleaned archive, writing every other member's
+                        # compressed bytes straight from the mapped input: pages
+                        # are faulted in as copied, with no read buffers between
+                        with mmap.mmap(raw_in.fileno(), 0, access=mmap.ACCESS_READ) as data, \
+                                memoryview(data) as view, \
+                                zipfile.ZipFile(tmp.file, 'w') as zip_out:
+                            for info in members:
+                                if info.filename not in cls.METADATA_FILES:
+                                    cls._copy_member(view, zip_in, zip_out, info)
+                    else:
+                        # Nothing to strip: copy (or clone) the original untouched
+                        tmp.copy_from(raw_in, allow_reflink)
+                    output_path = Path(tmp.commit())
+
+            if removed_files:
+                metadata_desc = f"Office metadata files ({', '.join(removed_files)})"
+            elif stale_entries:
+                metadata_desc = "ZIP entry timestamps and comments"
+            else:
+                metadata_desc = "no metadata files found"
+
             return ScrubResult(
-                result_type=ResultType.ERROR,
+                result_type=ResultType.SUCCESS,
                 input_path=input_path,
-                error="File not found",
-                error_category=ErrorCategory.INPUT_ERROR,
-                fix_hint="Verify the file path is correct"
+                output_path=output_path,
+                metadata_removed=metadata_desc
             )
 
-        if not os.access(input_path, os.R_OK):
+        except zipfile.BadZipFile:
             return ScrubResult(
                 result_type=ResultType.ERROR,
                 input_path=input_path,
-                error="Cannot read file (permission denied)",
-                error_category=ErrorCategory.PERMISSION_ERROR,
-                fix_hint="Check file permissions or run with appropriate privileges"
+                error="Not a valid Office document (corrupted or invalid ZIP)",
+                error_category=ErrorCategory.INPUT_ERROR,
+                fix_hint="Verify file is a valid DOCX/XLSX/PPTX or try opening it in Office first"
             )
 
-        tmp_output = None
-        try:
-            # Validate output directory
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            if not os.access(output_path.parent, os.W_OK):
-                return ScrubResult(
-                    result_type=ResultType.ERROR,
-                    input_path=input_path,
-                    error="Cannot write to output directory (permission denied)",
-                    error_category=ErrorCategory.PERMISSION_ERROR,
-                    fix_hint=f"Check write permissions for: {output_path.parent}"
-                )
+        except PermissionError:
+            # The input is already open, so this is the output side
+            return output_permission_result(input_path, output_path)
+
+        except OSError as e:
+            if e.errno == errno.ENOSPC:
+                error_msg = "No space left on device"
+                hint = "Free up disk space on the output drive"
+            elif e.errno == errno.EROFS:
+                error_msg = "Output filesystem is read-only"
+                hint = "Choose a writable output location"
+            else:
+                error_msg = f"I/O error: {e}"
+                hint = "Check filesystem and disk health"
 
-            # Use a temporary directory for extraction
-            with tempfile.TemporaryDirectory() as tmp_dir:
-                tmp_path = Path(tmp_dir)
-                extract_dir = tmp_path / "extracted"
-                extract_dir.mkdir()
-
-                try:
-                    # Extract the OOXML archive
-                    with zipfile.ZipFile(input_path, 'r') as zip_in:
-                        zip_in.extractall(extract_dir)
-
-                except zipfile.BadZipFile:
-                    return ScrubResult(
-                        result_type=ResultType.ERROR,
-                        input_path=input_path,
-                        error="Not a valid Office document (corrupted or invalid ZIP)",
-                        error_category=ErrorCategory.INPUT_ERROR,
-                        fix_hint="Verify file is a valid DOCX/XLSX/PPTX or try opening it in Office first"
-                    )
-
-                # Track which metadata files were removed
-                removed_files = []
-
-                # Remove metadata files
-                for metadata_file in cls.METADATA_FILES:
-                    metadata_path = extract_dir / metadata_file
-                    if metadata_path.exists():
-                        metadata_path.unlink()
-                        removed_files.append(metadata_file)
-
-                # Create cleaned archive
-                with tempfile.NamedTemporaryFile(delete=False, suffix=output_path.suffix, dir=output_path.parent) as tmp_out:
-                    tmp_output = Path(tmp_out.name)
-
-                try:
-                    with zipfile.ZipFile(tmp_output, 'w', zipfile.ZIP_DEFLATED) as zip_out:
-                        # Add all files except the removed metadata
-                        for root, dirs, files in os.walk(extract_dir):
-                            for file in files:
-                                file_path = Path(root) / file
-                                arcname = file_path.relative_to(extract_dir)
-                                zip_out.write(file_path, arcname)
-
-                    # Atomic move to final destination
-                    shutil.move(str(tmp_output), str(output_path))
-                    tmp_output = None  # Successfully moved
-
-                    metadata_desc = f"Office metadata files ({', '.join(removed_files)})" if removed_files else "no metadata files found"
-
-                    return ScrubResult(
-                        result_type=ResultType.SUCCESS,
-                        input_path=input_path,
-                        output_path=output_path,
-                        metadata_removed=metadata_desc
-                    )
-
-                except OSError as e:
-                    if e.errno == errno.ENOSPC:
-                        error_msg = "No space left on device"
-                        hint = "Free up disk space on the output drive"
-                    elif e.errno == errno.EROFS:
-                        error_msg = "Output filesystem is read-only"
-                        hint = "Choose a writable output location"
-                    else:
-                        error_msg = f"I/O error: {e}"
-                        hint = "Check filesystem and disk health"
-
-                    return ScrubResult(
-                        result_type=ResultType.ERROR,
-                        input_path=input_path,
-                        error=error_msg,
-                        error_category=ErrorCategory.OUTPUT_ERROR,
-                        fix_hint=hint
-                    )
+            return ScrubResult(
+                result_type=ResultType.ERROR,
+                input_path=input_path,
+                error=error_msg,
+                error_category=ErrorCategory.OUTPUT_ERROR,
+                fix_hint=hint
+            )
 
         except Exception as e:
             return ScrubResult(
@@ -155,10 +142,62 @@ class OOXMLScrubber:
                 fix_hint="Report this error if it persists"
             )
 
-        finally:
-            # Ensure temp file cleanup
-            if tmp_output and tmp_output.exists():
-                try:
-                    tmp_output.unlink()
-                except Exception:
-                    pass  # Best effort cleanup
+    @staticmethod
+    def _copy_member(
+        data: memoryview, zip_in: zipfile.ZipFile, zip_out: zipfile.ZipFile, info: zipfile.ZipInfo
+    ) -> None:
+        """
+        Copy one archive member's compressed bytes into zip_out unchanged.
+
+        Nothing is decompressed or recompressed: a new local header is
+        written for the member (same name, CRC and compression; fixed
+        timestamp, no comment or attributes) followed by its raw data, and the member is registered
+        for zip_out's central directory, as ZipFile.mkdir() does. That relies
+        on ZipFile internals; if they are missing, the member is decompressed
+        and rewritten through the public API instead.
+
+        Args:
+            data: The whole input archive, mapped
+            zip_in: Archive being read, for the fallback copy
+            zip_out: Archive being written
+            info: Member of the input archive to copy
+        """
+        header = data[info.header_offset:info.header_offset + LOCAL_HEADER_SIZE]
+        if len(header) != LOCAL_HEADER_SIZE or header[:4] != zipfile.stringFileHeader:
+            raise zipfile.BadZipFile(f"Bad local file header for {info.filename!r}")
+        name_len, extra_len = struct.unpack('<HH', header[26:30])
+        start = info.header_offset + LOCAL_HEADER_SIZE + name_len + extra_len
+        member = data[start:start + info.compress_size]
+        if len(member) != info.compress_size:
+            raise zipfile.BadZipFile(f"Truncated data for {info.filename!r}")
+
+        # Entry timestamps and comments reveal authoring history: use fixed
+        # values rather than the source's
+        out_info = zipfile.ZipInfo(info.filename, ZIP_EPOCH)
+        out_info.compress_type = info.compress_type
+        out_info.create_system = 0  # MS-DOS, with no host file attributes
+        out_info.external_attr = 0
+        # Sizes and CRC go in the local header, so no data descriptor follows
+        out_info.flag_bits = info.flag_bits & ~DATA_DESCRIPTOR_FLAG
+        out_info.CRC = info.CRC
+        out_info.compress_size = info.compress_size
+        out_info.file_size = info.file_size
+
+        try:
+            lock, writecheck = zip_out._lock, zip_out._writecheck
+            fp, start_dir = zip_out.fp, zip_out.start_dir
+        except AttributeError:
+            zip_out.writestr(out_info, zip_in.read(info))
+            return
+
+        with lock:
+            fp.seek(start_dir)
+            out_info.header_offset = fp.tell()
+            writecheck(out_info)
+            zip_out._didModify = True
+            fp.write(out_info.FileHeader())
+            fp.write(member)
+
+            zip_out.filelist.append(out_info)
+            zip_out.NameToInfo[out_info.filename] = out_info
+            zip_out.start_dir = fp.tell()
@@ -1,10 +1,11 @@
 """PDF metadata scrubber."""
 
 from pathlib import Path
-import tempfile
-import shutil
 import os
 import errno
+import mmap
+import re
+from typing import List, Optional, Tuple
 
 try:
     import pikepdf
@@ -12,27 +13,146 @@ try:
 except ImportError:
     PIKEPDF_AVAILABLE = False
 
-from ..utils.result import ScrubResult, ResultType, ErrorCategory
+from ..constants import PDF_EXTENSIONS
+from ..utils.result import ScrubResult, ResultType, ErrorCategory, input_error_result, output_permission_result
+from ..utils.tmpfile import AtomicOutputFile
+
+# Empty XMP packet written over the document's metadata stream in place. XMP
+# packets are padded with whitespace precisely so they can be edited this way.
+EMPTY_XMP_PACKET = (
+    b'<?xpacket begin="" id="W5M0MpCehiHzreSzNTczkc9d"?>'
+    b'<x:xmpmeta xmlns:x="adobe:ns:meta/"/>'
+    b'<?xpacket end="w"?>'
+)
+
+_OBJ_HEADER_RE = re.compile(rb"\s*(\d+)\s+(\d+)\s+obj")
+
+
+def _object_body(data: mmap.mmap, xref: dict, objgen: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+    """Return the byte range between 'N G obj' and 'endobj' of an uncompressed object."""
+    entry = xref.get(objgen)
+    if entry is None or entry.type != 1:
+        return None  # Free, or compressed inside an object stream
+    header = _OBJ_HEADER_RE.match(data, entry.offset)
+    if header is None or (int(header.group(1)), int(header.group(2))) != objgen:
+        return None
+    end = data.find(b"endobj", header.end())
+    if end < 0:
+        return None
+    return header.end(), end
+
+
+def _has_unreferenced_objects(pdf: "pikepdf.Pdf") -> bool:
+    """
+    Tell whether the file holds objects that nothing reaches from the trailer.
+
+    Such leftovers - say an /Info dictionary a later edit stopped pointing
+    to - survive a byte copy, while a qpdf rewrite only writes what is
+    reachable. Object streams and cross-reference streams don't count.
+    """
+    xref = pdf.get_xref_table()
+    containers = {(entry.obj_stream_number, 0) for entry in xref.values() if entry.type == 2}
+    unreached = {objgen for objgen, entry in xref.items() if entry.type != 0} - containers
+    stack = [pdf.trailer]
+    while stack and unreached:
+        obj = stack.pop()
+        if isinstance(obj, pikepdf.Array):
+            children = list(obj)
+        elif isinstance(obj, (pikepdf.Dictionary, pikepdf.Stream)):
+            children = list(obj.values())
+        else:
+            continue
+        for child in children:
+            if getattr(child, "is_indirect", False):
+                if child.objgen not in unreached:
+                    continue  # Already visited
+                unreached.discard(child.objgen)
+            stack.append(child)
+
+    for objgen in unreached:
+        obj = pdf.get_object(objgen)
+        if not (isinstance(obj, pikepdf.Stream) and obj.get("/Type") == "/XRef"):
+            return True
+    return False
+
+
+def _raw_metadata_edits(pdf: "pikepdf.Pdf", data: mmap.mmap) -> Optional[List[Tuple[int, bytes]]]:
+    """
+    Collect same-length writes that blank a PDF's document info and XMP.
+
+    The info dictionary becomes an empty one padded with spaces and the XMP
+    stream an empty packet padded the same way, so no object moves and the
+    cross-reference table stays valid. Only the objects involved are
+    touched, whatever the size of the file.
+
+    Args:
+        pdf: The file opened with pikepdf, for its trailer and xref table
+        data: The same file, mapped
+
+    Returns:
+        (offset, data) writes, or None if the file's layout doesn't allow it
+    """
+    trailer = pdf.trailer
+    if pdf.is_encrypted or "/Prev" in trailer:
+        # Earlier revisions keep their own copies of the metadata
+        return None
+    xref = pdf.get_xref_table()
+    edits = []
+
+    info = trailer.get("/Info")
+    if info is not None and len(info.keys()):
+        # Indirect values would leave their objects behind, unreferenced
+        if not info.is_indirect or any(getattr(value, "is_indirect", False) for value in info.values()):
+            return None
+        body = _object_body(data, xref, info.objgen)
+        if body is None or not data[body[0]:body[1]].strip().startswith(b"<<"):
+            return None
+        start, end = body
+        edits.append((start, b" <<>>".ljust(end - start)))
+
+    meta = pdf.Root.get("/Metadata")
+    if meta is not None:
+        if not isinstance(meta, pikepdf.Stream) or not meta.is_indirect or "/Filter" in meta:
+            return None
+        raw = meta.read_raw_bytes()
+        body = _object_body(data, xref, meta.objgen)
+        if body is None or len(raw) < len(EMPTY_XMP_PACKET):
+            return None
+        keyword = data.find(b"stream", body[0], body[1])
+        if keyword < 0:
+            return None
+        start = keyword + len(b"stream")
+        start += 2 if data[start:start + 2] == b"\r\n" else 1
+        if data[start:start + len(raw)] != raw:
+            return None
+        edits.append((start, EMPTY_XMP_PACKET.ljust(len(raw))))
+
+    return edits
 
 
 class PDFScrubber:
     """Scrubs metadata from PDF files."""
 
-    SUPPORTED_FORMATS = {'.pdf'}
+    SUPPORTED_FORMATS = PDF_EXTENSIONS
 
     @classmethod
     def can_handle(cls, file_path: Path) -> bool:
         """Check if this scrubber can handle the file."""
-        return file_path.suffix.lower() in cls.SUPPORTED_FORMATS
+        return os.path.splitext(file_path.name)[1].lower() in cls.SUPPORTED_FORMATS
 
     @classmethod
-    def scrub(cls, input_path: Path, output_path: Path) -> ScrubResult:
+    def scrub(
+        cls, input_path: Path, output_path: Path, allow_reflink: bool = False, exclusive: bool = False
+    ) -> ScrubResult:
         """
         Scrub metadata from a PDF file.
 
         Args:
             input_path: Source PDF file
             output_path: Destination for cleaned PDF
+            allow_reflink: Clone instead of copying when there is nothing to strip
+            exclusive: Never replace an existing file at output_path; publish
+                under the next free "_clean_N" name (reported in the result)
 
         Returns:
             ScrubResult with operation outcome
@@ -46,119 +166,162 @@ class PDFScrubber:
                 fix_hint="Install pikepdf: pip install pikepdf>=8.0.0"
             )
 
-        # Validate input
-        if not input_path.exists():
+        try:
+            try:
+                # Opening is the existence and permission check. qpdf reads
+                # through a memory map, paging in only what it touches (the
+                # trailer, xref and the objects the scrub inspects)
+                pdf = pikepdf.open(input_path, allow_overwriting_input=False, access_mode=pikepdf.AccessMode.mmap)
+            except (FileNotFoundError, PermissionError, IsADirectoryError) as e:
+                return input_error_result(input_path, e)
+
+            # Write to an unnamed (or temporary) file and publish it only once complete
+            with pdf, AtomicOutputFile(os.fspath(output_path), suffix='.pdf', exclusive=exclusive) as tmp:
+                has_info = "/Info" in pdf.trailer and len(pdf.docinfo.keys()) > 0
+                has_xmp = "/Metadata" in pdf.Root
+                # Earlier revisions or orphaned objects may still hold old
+                # metadata; only a full rewrite leaves them behind
+                stale = "/Prev" in pdf.trailer or _has_unreferenced_objects(pdf)
+
+                if not (has_info or has_xmp or stale):
+                    # Nothing to strip: copy (or clone) the original untouched
+                    with open(input_path, 'rb') as src:
+                        tmp.copy_from(src, allow_reflink)
+                elif stale or not cls._blank_in_place(pdf, input_path, tmp, allow_reflink):
+                    # Remove document info dictionary
+                    if has_info:
+                        metadata_fields = list(pdf.docinfo.keys())
+                        for key in metadata_fields:
+                            del pdf.docinfo[key]
+
+                    # Remove XMP metadata if present
+                    if has_xmp:
+                        with pdf.open_metadata() as meta:
+                            meta.clear()
+
+                    # Save cleaned PDF into the already-open output file. Only
+                    # /Info and XMP change, so every stream is written back as
+                    # stored: nothing decoded, nothing (re)compressed.
+                    pdf.save(
+                        tmp.file,
+                        compress_streams=False,
+                        stream_decode_level=pikepdf.StreamDecodeLevel.none,
+                        object_stream_mode=pikepdf.ObjectStreamMode.preserve,
+                        linearize=False,
+                    )
+
+                output_path = Path(tmp.commit())
+
+            if has_info or has_xmp:
+                metadata_desc = "PDF document info and XMP metadata"
+            elif stale:
+                metadata_desc = "earlier revisions and unreferenced objects"
+            else:
+                metadata_desc = "no metadata found"
+
+            return ScrubResult(
+                result_type=ResultType.SUCCESS,
+                input_path=input_path,
+                output_path=output_path,
+                metadata_removed=metadata_desc
+            )
+
+        except pikepdf.PasswordError:
             return ScrubResult(
                 result_type=ResultType.ERROR,
                 input_path=input_path,
-                error="File not found",
+                error="PDF is password-protected",
                 error_category=ErrorCategory.INPUT_ERROR,
-                fix_hint="Verify the file path is correct"
+                fix_hint="Decrypt the PDF first before scrubbing metadata"
             )
 
-        if not os.access(input_path, os.R_OK):
+        except pikepdf.PdfError as e:
             return ScrubResult(
                 result_type=ResultType.ERROR,
                 input_path=input_path,
-                error="Cannot read file (permission denied)",
-                error_category=ErrorCategory.PERMISSION_ERROR,
-                fix_hint="Check file permissions or run with appropriate privileges"
+                error=f"Invalid or corrupted PDF: {e}",
+                error_category=ErrorCategory.INPUT_ERROR,
+                fix_hint="Verify file is a valid PDF or try repairing it first"
             )
 
-        tmp_path = None
-        try:
-            # Validate output directory
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            if not os.access(output_path.parent, os.W_OK):
-                return ScrubResult(
-                    result_type=ResultType.ERROR,
-                    input_path=input_path,
-                    error="Cannot write to output directory (permission denied)",
-                    error_category=ErrorCategory.PERMISSION_ERROR,
-                    fix_hint=f"Check write permissions for: {output_path.parent}"
-                )
-
-            # Use a temporary file to ensure atomic writes
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf', dir=output_path.parent) as tmp:
-                tmp_path = Path(tmp.name)
+        except PermissionError:
+            # The input is already open, so this is the output side
+            return output_permission_result(input_path, output_path)
+
+        except OSError as e:
+            if e.errno == errno.ENOSPC:
+                error_msg = "No space left on device"
+                hint = "Free up disk space on the output drive"
+            elif e.errno == errno.EROFS:
+                error_msg = "Output filesystem is read-only"
+                hint = "Choose a writable output location"
+            else:
+                error_msg = f"I/O error: {e}"
+                hint = "Check filesystem and disk health"
+
+            return ScrubResult(
+                result_type=ResultType.ERROR,
+                input_path=input_path,
+                error=error_msg,
+                error_category=ErrorCategory.OUTPUT_ERROR,
+                fix_hint=hint
+            )
+
+        except Exception as e:
+            return ScrubResult(
+                result_type=ResultType.ERROR,
+                input_path=input_path,
+                error=f"Unexpected error: {type(e).__name__}: {e}",
+                error_category=ErrorCategory.PROCESSING_ERROR,
+                fix_hint="Report this error if it persists"
+            )
 
+    @staticmethod
+    def _blank_in_place(pdf: "pikepdf.Pdf", input_path: Path, tmp: AtomicOutputFile, allow_reflink: bool) -> bool:
+        """
+        Write a byte copy of the PDF into tmp with its metadata blanked in place.
+
+        Avoids rewriting every object through qpdf: the file is copied in
+        the kernel (or cloned) and only the info dictionary and XMP stream
+        are overwritten. The result is reopened to confirm nothing is left.
+
+        Args:
+            pdf: The input, already opened with pikepdf
+            input_path: Source PDF file
+            tmp: Output file, still empty
+            allow_reflink: Clone the input instead of copying it when supported
+
+        Returns:
+            True if tmp now holds the cleaned PDF, False (with tmp left
+            empty) if the file needs a full rewrite instead
+        """
+        with open(input_path, 'rb') as src:
             try:
-                # Open PDF and remove metadata
-                with pikepdf.open(input_path, allow_overwriting_input=False) as pdf:
-                    # Remove document info dictionary
-                    if pdf.docinfo:
-                        metadata_fields = list(pdf.docinfo.keys())
-                        for key in metadata_fields:
-                            del pdf.docinfo[key]
+                data = mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                return False  # Empty file
+            try:
+                edits = _raw_metadata_edits(pdf, data)
+            finally:
+                data.close()
+            if edits is None:
+                return False
 
-                    # Remove XMP metadata if present
-                    with pdf.open_metadata() as meta:
-                        meta.clear()
-
-                    # Save cleaned PDF
-                    pdf.save(tmp_path)
-
-                # Atomic move to final destination
-                shutil.move(str(tmp_path), str(output_path))
-                tmp_path = None  # Successfully moved
-
-                return ScrubResult(
-                    result_type=ResultType.SUCCESS,
-                    input_path=input_path,
-                    output_path=output_path,
-                    metadata_removed="PDF document info and XMP metadata"
-                )
-
-            except pikepdf.PasswordError:
-                return ScrubResult(
-                    result_type=ResultType.ERROR,
-                    input_path=input_path,
-                    error="PDF is password-protected",
-                    error_category=ErrorCategory.INPUT_ERROR,
-                    fix_hint="Decrypt the PDF first before scrubbing metadata"
-                )
-
-            except pikepdf.PdfError as e:
-                return ScrubResult(
-                    result_type=ResultType.ERROR,
-                    input_path=input_path,
-                    error=f"Invalid or corrupted PDF: {e}",
-                    error_category=ErrorCategory.INPUT_ERROR,
-                    fix_hint="Verify file is a valid PDF or try repairing it first"
-                )
-
-            except OSError as e:
-                if e.errno == errno.ENOSPC:
-                    error_msg = "No space left on device"
-                    hint = "Free up disk space on the output drive"
-                elif e.errno == errno.EROFS:
-                    error_msg = "Output filesystem is read-only"
-                    hint = "Choose a writable output location"
-                else:
-                    error_msg = f"I/O error: {e}"
-                    hint = "Check filesystem and disk health"
-
-                return ScrubResult(
-                    result_type=ResultType.ERROR,
-                    input_path=input_path,
-                    error=error_msg,
-                    error_category=ErrorCategory.OUTPUT_ERROR,
-                    fix_hint=hint
-                )
-
-            except Exception as e:
-                return ScrubResult(
-                    result_type=ResultType.ERROR,
-                    input_path=input_path,
-                    error=f"Unexpected error: {type(e).__name__}: {e}",
-                    error_category=ErrorCategory.PROCESSING_ERROR,
-                    fix_hint="Report this error if it persists"
-                )
-
-        finally:
-            # Ensure temp file cleanup
-            if tmp_path and tmp_path.exists():
-                try:
-                    tmp_path.unlink()
-                except Exception:
-                    pass  # Best effort cleanup
+            tmp.copy_from(src, allow_reflink)
+            out = tmp.file
+            for offset, chunk in edits:
+                out.seek(offset)
+                out.write(chunk)
+            out.flush()
+
+        out.seek(0)
+        with pikepdf.open(out) as check:
+            clean = (
+                not ("/Info" in check.trailer and len(check.docinfo.keys()))
+                and ("/Metadata" not in check.Root or check.Root.Metadata.read_bytes().strip() == EMPTY_XMP_PACKET)
+                and not check.get_warnings()
+            )
+        if not clean:
+            out.seek(0)
+            out.truncate()
+        return clean
@@ -1,56 +1,123 @@
 """File discovery and output management utilities."""
 
+from functools import lru_cache
+import os
+import re
 from pathlib import Path
-from typing import List
+from typing import Callable, Dict, FrozenSet, Iterator, List, Optional, Set, Union
+
+from ..constants import SUPPORTED_EXTENSIONS
+
+
+@lru_cache(maxsize=None)
+def _name_matcher(extensions: FrozenSet[str]) -> Callable[[str], Optional[re.Match]]:
+    """
+    Compile one case-insensitive regex matching file names with a suffix in extensions.
+
+    Equivalent to ``os.path.splitext(name)[1].lower() in extensions`` (leading
+    dots don't start a suffix, so ".jpg" has none) but runs in C, which
+    matters when it's called for every entry of a large tree.
+    """
+    alternatives = "|".join(re.escape(ext) for ext in sorted(extensions))
+    return re.compile(rf"\.*[^.].*(?:{alternatives})\Z", re.IGNORECASE | re.DOTALL).match
 
 
 class FileDiscovery:
     """Handles file discovery for single file or batch processing."""
 
-    SUPPORTED_EXTENSIONS = {
-        # Images
-        '.jpg', '.jpeg', '.png', '.webp',
-        # PDFs
-        '.pdf',
-        # Office documents
-        '.docx', '.xlsx', '.pptx',
-        # Video
-        '.mp4', '.mov', '.mkv', '.avi', '.m4v', '.webm', '.mpg', '.mpeg',
-        # Audio
-        '.mp3', '.wav', '.flac', '.m4a', '.aac', '.ogg', '.opus'
-    }
+    SUPPORTED_EXTENSIONS = SUPPORTED_EXTENSIONS
 
     @classmethod
-    def discover_files(cls, input_path: Path, recursive: bool = False) -> List[Path]:
+    def discover_files(
+        cls, input_path: Path, recursive: bool = False, is_dir: Optional[bool] = None
+    ) -> List[Path]:
         """
         Discover files to process.
 
         Args:
             input_path: Single file or directory path
             recursive: Whether to recurse into subdirectories
+            is_dir: Already-known result of input_path.is_dir(), saving a stat;
+                None to check here
 
         Returns:
             List of file paths to process
         """
-        if input_path.is_file():
-            return [input_path]
+        return list(cls.iter_files(input_path, recursive, is_dir=is_dir))
+
+    @classmethod
+    def iter_files(
+        cls, input_path: Path, recursive: bool = False, is_dir: Optional[bool] = None
+    ) -> Iterator[Path]:
+        """
+        Lazily discover files to process, in sorted path order.
+
+        The top-level directory is listed (and validated) immediately so
+        errors surface to the caller; subdirectories are walked with
+        os.scandir as the iterator is consumed.
+
+        Args:
+            input_path: Single file or directory path
+            recursive: Whether to recurse into subdirectories
+            is_dir: Already-known result of input_path.is_dir(), saving a stat;
+                None to check here
 
-        if not input_path.is_dir():
-            raise ValueError(f"Input path does not exist: {input_path}")
+        Returns:
+            Iterator of file paths to process
+        """
+        if is_dir is None:
+            if input_path.is_file():
+                return iter([input_path])
 
-        files = []
-        pattern = "**/*" if recursive else "*"
+            if not input_path.is_dir():
+                raise ValueError(f"Input path does not exist: {input_path}")
+        elif not is_dir:
+            return iter([input_path])
 
-        for item in input_path.glob(pattern):
-            if item.is_file() and cls.is_supported(item):
-                files.append(item)
+        with os.scandir(input_path) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        return cls._walk_entries(entries, recursive)
 
-        return sorted(files)
+    @classmethod
+    def _walk_entries(cls, entries: List[os.DirEntry], recursive: bool) -> Iterator[Path]:
+        # Entries are name-sorted per directory and subdirectories are expanded
+        # in place, which reproduces a global sort over the full paths. An
+        # explicit stack of directory iterators keeps deep trees from
+        # building a chain of nested generators.
+        # The name is checked before is_file(): on filesystems that don't
+        # report entry types, is_file() costs a stat, so unsupported files
+        # (the majority in most trees) should never reach it
+        supported_name = _name_matcher(frozenset(cls.SUPPORTED_EXTENSIONS))
+        stack = [iter(entries)]
+        while stack:
+            for entry in stack[-1]:
+                try:
+                    if supported_name(entry.name) and entry.is_file():
+                        yield Path(entry.path)
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        # Symlinked directories aren't descended into, as
+                        # with Path.glob("**/*"); this also needs no stat
+                        # for symlinks and can't loop on a link cycle
+                        with os.scandir(entry.path) as it:
+                            children = sorted(it, key=lambda e: e.name)
+                        stack.append(iter(children))
+                        break
+                except OSError:
+                    # Unreadable entries are skipped, as Path.glob did
+                    continue
+            else:
+                stack.pop()
 
     @classmethod
-    def is_supported(cls, file_path: Path) -> bool:
-        """Check if file type is supported."""
-        return file_path.suffix.lower() in cls.SUPPORTED_EXTENSIONS
+    def is_supported(cls, file_path: Union[str, "os.PathLike[str]"]) -> bool:
+        """
+        Check if file type is supported.
+
+        Accepts a plain string (e.g. a DirEntry name) as well as a Path, so
+        callers iterating names don't need to build a Path per entry.
+        """
+        name = os.path.basename(file_path if isinstance(file_path, str) else os.fspath(file_path))
+        return _name_matcher(frozenset(cls.SUPPORTED_EXTENSIONS))(name) is not None
 
 
 class OutputManager:
@@ -69,6 +136,14 @@ class OutputManager:
         self.overwrite = overwrite
         self.keep_structure = keep_structure
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._output_str = os.fspath(output_dir)
+        # Paths handed out this run; files scrubbed in parallel may not exist yet
+        self._claimed: Set[str] = set()
+        # Last directory created for keep_structure outputs
+        self._last_parent: Optional[str] = None
+        # Colliding path -> first _clean_N number not yet tried for it, so
+        # many files sharing a name don't re-probe every earlier suffix
+        self._next_suffix: Dict[str, int] = {}
 
     def get_output_path(self, input_path: Path, base_input_dir: Path = None) -> Path:
         """
@@ -81,55 +156,128 @@ class OutputManager:
         Returns:
             Output file path
         """
-        if self.keep_structure and base_input_dir:
-            # Preserve directory structure relative to base input dir
-            relative_path = input_path.relative_to(base_input_dir)
-            output_path = self.output_dir / relative_path
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-        else:
-            # Flat output - just use filename
-            output_path = self.output_dir / input_path.name
+        base = os.fspath(base_input_dir) if base_input_dir else None
+        return Path(self.get_output_path_str(os.fspath(input_path), base))
+
+    def get_output_path_str(self, file_path: str, base: Optional[str] = None) -> str:
+        """
+        String-based variant of get_output_path for hot loops.
+
+        Uses os.path primitives so no intermediate Path objects are built.
+
+        Args:
+            file_path: Original file path
+            base: Base directory for preserving structure (used with keep_structure)
+
+        Returns:
+            Output file path
+        """
+        output_path = self._build_output_path(file_path, base)
 
         # Handle collisions (protect against permission errors when checking)
         try:
-            if not self.overwrite and output_path.exists():
+            if not self.overwrite and self._is_taken(output_path):
                 output_path = self._get_unique_path(output_path)
         except OSError:
             # If we can't check existence due to permissions, proceed anyway
             # The scrubber will handle the permission error during write
             pass
 
+        self._claimed.add(output_path)
         return output_path
 
-    def _get_unique_path(self, path: Path) -> Path:
+    def reserve_output(self, file_path: str, base: Optional[str] = None) -> str:
+        """
+        Determine an output path for a file the scrubber will publish exclusively.
+
+        Only names already handed out this run are skipped; nothing is
+        checked or created on disk. Without overwrite, the scrubbers publish
+        with ``exclusive`` set, which claims the name atomically when the
+        file is linked into place and moves on to the next free "_clean_N"
+        name if it's taken. So a free name costs no syscall here, and an
+        interrupted run leaves no empty placeholder behind.
+
+        Args:
+            file_path: Original file path
+            base: Base directory for preserving structure (used with keep_structure)
+
+        Returns:
+            Output file path (the published name is reported in the result)
+        """
+        output_path = self._build_output_path(file_path, base)
+        if self.overwrite:
+            return output_path
+
+        if output_path in self._claimed:
+            parent, name = os.path.split(output_path)
+            stem, suffix = os.path.splitext(name)
+            n = self._next_suffix.get(output_path, 1)
+            candidate = self._suffixed(parent, stem, n, suffix)
+            while candidate in self._claimed:
+                n += 1
+                candidate = self._suffixed(parent, stem, n, suffix)
+            self._next_suffix[output_path] = n + 1
+            output_path = candidate
+
+        self._claimed.add(output_path)
+        return output_path
+
+    @staticmethod
+    def _suffixed(parent: str, stem: str, n: int, suffix: str) -> str:
+        return os.path.join(parent, f"{stem}_clean_{n}{suffix}")
+
+    def _build_output_path(self, file_path: str, base: Optional[str]) -> str:
+        """Map an input path into the output directory, before collision handling."""
+        if self.keep_structure and base:
+            # Preserve directory structure relative to base input dir.
+            # Discovered files sit under base, so slicing the prefix off is
+            # enough; relpath is only needed for paths from elsewhere.
+            prefix = base if base.endswith(os.sep) else base + os.sep
+            if file_path.startswith(prefix):
+                rel = file_path[len(prefix):]
+            else:
+                rel = os.path.relpath(file_path, base)
+            output_path = os.path.join(self._output_str, rel)
+            parent = os.path.dirname(output_path)
+            # Files arrive grouped by directory, so skip repeat makedirs calls
+            if parent != self._last_parent:
+                os.makedirs(parent, exist_ok=True)
+                self._last_parent = parent
+            return output_path
+        # Flat output - just use filename
+        return os.path.join(self._output_str, os.path.basename(file_path))
+
+    def _is_taken(self, path: str) -> bool:
+        """Check whether a path exists or was already assigned this run."""
+        return path in self._claimed or os.path.exists(path)
+
+    def _get_unique_path(self, path: str) -> str:
         """
         Generate a unique path by appending suffix.
 
+        Only called once ``path`` itself is known to be taken, so it isn't
+        checked again. Dry runs publish nothing, so unlike reserve_output()
+        the names are checked on disk, one stat per candidate.
+
         Args:
-            path: Desired path
+            path: Desired path, already found to be taken
 
         Returns:
             Unique path that doesn't exist
         """
-        try:
-            if not path.exists():
-                return path
-        except OSError:
-            # Can't check, return original path and let scrubber handle error
-            return path
-
-        stem = path.stem
-        suffix = path.suffix
-        parent = path.parent
+        parent, name = os.path.split(path)
+        stem, suffix = os.path.splitext(name)
 
-        counter = 1
+        # Suffixes below the remembered one were already found taken
+        counter = self._next_suffix.get(path, 1)
         while True:
-            new_name = f"{stem}_clean_{counter}{suffix}"
-            new_path = parent / new_name
+            new_path = self._suffixed(parent, stem, counter, suffix)
+            counter += 1
             try:
-                if not new_path.exists():
-                    return new_path
+                if not self._is_taken(new_path):
+                    break
             except OSError:
                 # Can't check, return this path and let scrubber handle error
-                return new_path
-            counter += 1
+                break
+        self._next_suffix[path] = counter
+        return new_path
@@ -0,0 +1,139 @@
+"""Copy-on-write file cloning with a plain-copy fallback."""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import sys
+from functools import lru_cache
+
+# ioctl request number for FICLONE (Btrfs, XFS, and other reflink-capable filesystems)
+FICLONE = 0x40049409
+
+
+def reflink(src: str, dst: str) -> bool:
+    """
+    Clone src to dst so both share the same data blocks.
+
+    Uses clonefile(2) on macOS (APFS) and the FICLONE ioctl on Linux. An
+    existing dst is replaced. Nothing is copied when cloning is not supported.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+
+    Returns:
+        True if dst is now a clone of src, False if the caller should copy
+    """
+    try:
+        if sys.platform == "darwin":
+            return _clonefile(os.fsencode(src), os.fsencode(dst))
+        if sys.platform.startswith("linux"):
+            return _ficlone(src, dst)
+    except OSError:
+        # EXDEV, ENOTSUP, EINVAL, ... - the filesystem can't clone here
+        return False
+    return False
+
+
+def reflink_fd(src_fd: int, dst_fd: int) -> bool:
+    """
+    Clone the open file src_fd into dst_fd (Linux FICLONE only).
+
+    Works on unnamed files too, e.g. ones opened with O_TMPFILE.
+
+    Args:
+        src_fd: Descriptor open for reading
+        dst_fd: Descriptor open for writing; its contents are replaced
+
+    Returns:
+        True if dst_fd is now a clone of src_fd, False if the caller should copy
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+    import fcntl
+
+    try:
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+    except OSError:
+        return False
+    return True
+
+
+def copy_fd(src_fd: int, dst_fd: int, length: int) -> None:
+    """
+    Copy length bytes from the current offset of src_fd to dst_fd.
+
+    Uses copy_file_range(2) so the kernel moves the data (or shares the
+    blocks, on filesystems that support it) without a round trip through
+    user space, then sendfile(2), then a buffered read/write loop for
+    whatever the kernel calls couldn't copy.
+
+    Args:
+        src_fd: Descriptor open for reading
+        dst_fd: Descriptor open for writing
+        length: Number of bytes to copy
+    """
+    # Each kernel call advances both fds' offsets, so a fallback resumes
+    # exactly where the previous method stopped
+    for kernel_copy in (getattr(os, "copy_file_range", None), _sendfile):
+        if kernel_copy is None:
+            continue
+        try:
+            while length > 0:
+                copied = kernel_copy(src_fd, dst_fd, length)
+                if copied == 0:
+                    return  # Source ended early
+                length -= copied
+            return
+        except OSError:
+            # EXDEV on older kernels, EINVAL/ENOSYS where unsupported
+            continue
+    while length > 0:
+        chunk = os.read(src_fd, min(length, 1024 * 1024))
+        if not chunk:
+            return
+        view = memoryview(chunk)
+        while view:
+            view = view[os.write(dst_fd, view):]
+        length -= len(chunk)
+
+
+def _sendfile(src_fd: int, dst_fd: int, length: int) -> int:
+    if not sys.platform.startswith("linux"):
+        # Elsewhere sendfile(2) only writes to sockets
+        raise OSError(errno.ENOTSUP, "sendfile to files is Linux-only")
+    return os.sendfile(dst_fd, src_fd, None, min(length, 0x7FFFF000))
+
+
+@lru_cache(maxsize=None)
+def _libsystem():
+    """Load libSystem once; returns None if clonefile is unavailable."""
+    path = ctypes.util.find_library("System")
+    if not path:
+        return None
+    lib = ctypes.CDLL(path, use_errno=True)
+    clonefile = getattr(lib, "clonefile", None)
+    if clonefile is None:
+        return None
+    clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+    clonefile.restype = ctypes.c_int
+    return clonefile
+
+
+def _clonefile(src: bytes, dst: bytes) -> bool:
+    clonefile = _libsystem()
+    if clonefile is None:
+        return False
+    # clonefile(2) refuses to replace an existing destination
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    return clonefile(src, dst, 0) == 0
+
+
+def _ficlone(src: str, dst: str) -> bool:
+    import fcntl
+
+    with open(src, "rb") as src_f, open(dst, "wb") as dst_f:
+        fcntl.ioctl(dst_f.fileno(), FICLONE, src_f.fileno())
+    return True
@@ -1,10 +1,14 @@
 """Result tracking for scrubbing operations."""
 
+import sys
 from enum import Enum
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+# One ScrubResult is kept per file; slots drop the per-instance __dict__ (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class ResultType(Enum):
     """Type of scrubbing result."""
@@ -23,9 +27,13 @@ class ErrorCategory(Enum):
     CANCELLED = "cancelled"  # User-initiated stop
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ScrubResult:
-    """Result of a single file scrubbing operation."""
+    """Result of a single file scrubbing operation.
+
+    Immutable (and so hashable) once created; results cross process
+    boundaries and are shared between the reporter and the GUI model.
+    """
     result_type: ResultType
     input_path: Path
     output_path: Optional[Path] = None
@@ -47,3 +55,49 @@ class ScrubResult:
             if self.fix_hint:
                 error_msg += f"\n  Fix: {self.fix_hint}"
             return error_msg
+
+
+def input_error_result(input_path: Path, e: OSError) -> ScrubResult:
+    """Result for an input file that couldn't be opened for reading."""
+    if isinstance(e, FileNotFoundError):
+        return ScrubResult(
+            result_type=ResultType.ERROR,
+            input_path=input_path,
+            error="File not found",
+            error_category=ErrorCategory.INPUT_ERROR,
+            fix_hint="Verify the file path is correct"
+        )
+    if isinstance(e, PermissionError):
+        return ScrubResult(
+            result_type=ResultType.ERROR,
+            input_path=input_path,
+            error="Cannot read file (permission denied)",
+            error_category=ErrorCategory.PERMISSION_ERROR,
+            fix_hint="Check file permissions or run with appropriate privileges"
+        )
+    if isinstance(e, IsADirectoryError):
+        return ScrubResult(
+            result_type=ResultType.ERROR,
+            input_path=input_path,
+            error="Not a file (is a directory)",
+            error_category=ErrorCategory.INPUT_ERROR,
+            fix_hint="Verify the file path is correct"
+        )
+    return ScrubResult(
+        result_type=ResultType.ERROR,
+        input_path=input_path,
+        error=f"Cannot open file: {e}",
+        error_category=ErrorCategory.INPUT_ERROR,
+        fix_hint="Check filesystem and disk health"
+    )
+
+
+def output_permission_result(input_path: Path, output_path: Path) -> ScrubResult:
+    """Result for an output directory the cleaned file can't be written to."""
+    return ScrubResult(
+        result_type=ResultType.ERROR,
+        input_path=input_path,
+        error="Cannot write to output directory (permission denied)",
+        error_category=ErrorCategory.PERMISSION_ERROR,
+        fix_hint=f"Check write permissions for: {output_path.parent}"
+    )
@@ -0,0 +1,280 @@
+"""Temporary output files that only appear at their destination once complete."""
+
+import os
+import secrets
+import tempfile
+from typing import BinaryIO, Callable, Optional, Tuple
+
+from .reflink import copy_fd, reflink, reflink_fd
+
+# (pid, descriptor) of this process's /proc/self/fd, opened on first publish
+_proc_fd_dir: Optional[Tuple[int, int]] = None
+
+
+def open_tmpfile(directory: str) -> Optional[int]:
+    """
+    Open an unnamed file in directory for reading and writing.
+
+    Uses O_TMPFILE on Linux: the file has no name until published, so
+    nothing is left behind if writing fails or the process dies.
+
+    Args:
+        directory: Directory the file will later be published into
+
+    Returns:
+        Read/write file descriptor, or None if unnamed files aren't supported
+
+    Raises:
+        FileNotFoundError: directory doesn't exist
+        PermissionError: directory isn't writable
+    """
+    flag = getattr(os, "O_TMPFILE", None)
+    if flag is None or os.link not in os.supports_dir_fd:
+        return None
+    try:
+        return os.open(directory, flag | os.O_RDWR, 0o600)
+    except (FileNotFoundError, PermissionError):
+        raise
+    except OSError:
+        # EOPNOTSUPP/EISDIR - kernel or filesystem without O_TMPFILE
+        return None
+
+
+def make_tmpfile(directory: str, suffix: str = "") -> BinaryIO:
+    """
+    Create a named temporary file in directory, creating the directory if needed.
+
+    The directory is only created when the first attempt finds it missing,
+    so the common case costs no extra stat or mkdir.
+
+    Args:
+        directory: Directory to create the file in
+        suffix: File name suffix
+
+    Returns:
+        Open NamedTemporaryFile that is not deleted on close
+
+    Raises:
+        PermissionError: directory isn't writable
+    """
+    try:
+        return tempfile.NamedTemporaryFile(delete=False, suffix=suffix, dir=directory)
+    except FileNotFoundError:
+        os.makedirs(directory, exist_ok=True)
+        return tempfile.NamedTemporaryFile(delete=False, suffix=suffix, dir=directory)
+
+
+def _link_exclusive(link: Callable[[str], None], dst: str) -> str:
+    """
+    Call link(name) for dst, then dst's "_clean_N" variants, until one is free.
+
+    Each attempt must fail with FileExistsError when the name is taken, so
+    the name is claimed atomically and an existing file is never replaced.
+
+    Returns:
+        The name the file was published under
+    """
+    parent, name = os.path.split(dst)
+    stem, suffix = os.path.splitext(name)
+    candidate = dst
+    n = 0
+    while True:
+        try:
+            link(candidate)
+            return candidate
+        except FileExistsError:
+            n += 1
+            candidate = os.path.join(parent, f"{stem}_clean_{n}{suffix}")
+
+
+def publish_tmpfile(fd: int, dst: str, exclusive: bool = False) -> str:
+    """
+    Give a file opened by open_tmpfile the name dst.
+
+    Without exclusive, any file at dst is replaced. With it, an existing
+    file is kept and the next free "_clean_N" name is used instead; either
+    way a free name costs a single linkat().
+
+    Args:
+        fd: Descriptor returned by open_tmpfile
+        dst: Destination path, in the directory the file was opened in
+        exclusive: Never replace an existing file
+
+    Returns:
+        The path the file was published under
+    """
+    # linkat(AT_SYMLINK_FOLLOW) on /proc/self/fd/N names the open inode;
+    # os.link only passes that flag when given a directory fd
+    proc_fd = _open_proc_fd_dir()
+    src = str(fd)
+
+    def link(name: str) -> None:
+        os.link(src, name, src_dir_fd=proc_fd)
+
+    if exclusive:
+        return _link_exclusive(link, dst)
+    try:
+        link(dst)
+        return dst
+    except FileExistsError:
+        pass
+    # linkat can't replace dst: link under a spare name, then rename over it
+    while True:
+        spare = os.path.join(os.path.dirname(dst), f".{os.path.basename(dst)}.{secrets.token_hex(4)}.tmp")
+        try:
+            link(spare)
+            break
+        except FileExistsError:
+            continue
+    try:
+        os.replace(spare, dst)
+    except OSError:
+        os.unlink(spare)
+        raise
+    return dst
+
+
+def publish_named(tmp_path: str, dst: str, exclusive: bool = False) -> str:
+    """
+    Move a named temporary file in dst's directory to dst.
+
+    Without exclusive this is a rename over any file at dst. With it, the
+    file is hard-linked under dst (or the next free "_clean_N" name) and
+    the temporary name removed; where hard links aren't supported, each
+    name is checked just before renaming onto it.
+
+    Args:
+        tmp_path: Temporary file, in the destination directory
+        dst: Destination path
+        exclusive: Never replace an existing file
+
+    Returns:
+        The path the file was published under
+    """
+    if not exclusive:
+        os.replace(tmp_path, dst)
+        return dst
+
+    def link(name: str) -> None:
+        os.link(tmp_path, name)
+
+    def rename_if_free(name: str) -> None:
+        if os.path.lexists(name):
+            raise FileExistsError(name)
+        os.replace(tmp_path, name)
+
+    try:
+        published = _link_exclusive(link, dst)
+    except OSError:
+        # No hard links on this filesystem (e.g. FAT)
+        return _link_exclusive(rename_if_free, dst)
+    os.unlink(tmp_path)
+    return published
+
+
+def _open_proc_fd_dir() -> int:
+    """
+    Return a descriptor for /proc/self/fd, kept open for the life of the process.
+
+    Publishing is a single linkat() instead of open + linkat + close per
+    file. /proc/self is resolved when opened, so a forked child (whose
+    inherited descriptor names the parent's table) opens its own.
+    """
+    global _proc_fd_dir
+    pid = os.getpid()
+    cached = _proc_fd_dir
+    if cached is None or cached[0] != pid:
+        cached = (pid, os.open("/proc/self/fd", os.O_RDONLY | os.O_DIRECTORY))
+        _proc_fd_dir = cached
+    return cached[1]
+
+
+class AtomicOutputFile:
+    """
+    Binary file written in place of dst and moved there by commit().
+
+    With exclusive, commit() never replaces an existing file: it publishes
+    under the next free "_clean_N" name instead and updates dst to match.
+
+    Prefers an unnamed O_TMPFILE file; elsewhere falls back to a named
+    temporary file in the destination directory that is removed unless
+    committed. A missing destination directory is created; one that isn't
+    writable raises PermissionError on entry. The file is open for reading
+    too, so a writer can check what it wrote before committing.
+
+    Usage:
+        with AtomicOutputFile(dst, suffix=".jpg") as tmp:
+            tmp.file.write(data)
+            tmp.commit()
+    """
+
+    def __init__(self, dst: str, suffix: str = "", exclusive: bool = False) -> None:
+        self.dst = dst
+        self.suffix = suffix
+        self.exclusive = exclusive
+        self.file: Optional[BinaryIO] = None
+        self._tmp_path: Optional[str] = None
+        self._committed = False
+
+    def __enter__(self) -> "AtomicOutputFile":
+        directory = os.path.dirname(self.dst) or os.curdir
+        try:
+            fd = self._open(directory)
+        except FileNotFoundError:
+            os.makedirs(directory, exist_ok=True)
+            fd = self._open(directory)
+        # A plain buffered file either way: callers like qpdf write a few
+        # bytes per call, and a tempfile wrapper's lookups would double that cost
+        self.file = os.fdopen(fd, "w+b")
+        return self
+
+    def _open(self, directory: str) -> int:
+        fd = open_tmpfile(directory)
+        if fd is None:
+            fd, self._tmp_path = tempfile.mkstemp(suffix=self.suffix, dir=directory)
+        return fd
+
+    def copy_from(self, src: BinaryIO, allow_reflink: bool = False) -> None:
+        """
+        Fill the still-empty file with the whole of src.
+
+        Copies in the kernel (see copy_fd), or clones when allowed and
+        supported: FICLONE on the open file, or clonefile(2) onto the
+        temporary name where there is no unnamed file. Seek before
+        writing anything more.
+
+        Args:
+            src: Input file opened in binary mode by path; its position is ignored
+            allow_reflink: Try a copy-on-write clone before a byte copy
+        """
+        src_fd = src.fileno()
+        if allow_reflink:
+            if reflink_fd(src_fd, self.file.fileno()):
+                return
+            if self._tmp_path is not None and reflink(src.name, self._tmp_path):
+                # clonefile(2) put a new file under the temporary name
+                self.file.close()
+                self.file = open(self._tmp_path, "r+b")
+                return
+        # The buffered reader's seek() may not move the fd itself
+        os.lseek(src_fd, 0, os.SEEK_SET)
+        copy_fd(src_fd, self.file.fileno(), os.fstat(src_fd).st_size)
+
+    def commit(self) -> str:
+        """Flush the file and publish it at dst; returns the path used."""
+        if self._tmp_path is None:
+            self.file.flush()
+            self.dst = publish_tmpfile(self.file.fileno(), self.dst, self.exclusive)
+        else:
+            self.file.close()
+            self.dst = publish_named(self._tmp_path, self.dst, self.exclusive)
+        self._committed = True
+        return self.dst
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.file.close()
+        if self._tmp_path is not None and not self._committed:
+            try:
+                os.unlink(self._tmp_path)
+            except OSError:
+                pass  # Best effort cleanup
@@ -9,6 +9,7 @@ setup(
         "piexif>=1.1.3",
         "pikepdf>=8.0.0",
         "PySide6>=6.6",
+        "numpy>=1.22",
     ],
     entry_points={
         "console_scripts": [
@@ -0,0 +1,42 @@
+"""Helpers shared by the test modules."""
+
+import json
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+
+def write_fake_ffmpeg(directory: Path, log: Optional[Path] = None, fail_on: Optional[str] = None) -> Path:
+    """
+    Write a stand-in ffmpeg script into directory and return its path.
+
+    The script writes b"clean" to every output (the argument after "copy").
+    With log, each call appends its arguments to that file as one JSON line
+    (read them back with ffmpeg_calls()). With fail_on, a call naming a file
+    ending in it exits 1 with an "Invalid data" error and writes nothing.
+    """
+    fake_ffmpeg = directory / "ffmpeg"
+    lines = [f"#!{sys.executable}", "import json, sys", "args = sys.argv[1:]"]
+    if log is not None:
+        lines.append(f"open({str(log)!r}, 'a').write(json.dumps(args) + '\\n')")
+    if fail_on is not None:
+        lines += [
+            f"if any(arg.endswith({fail_on!r}) for arg in args):",
+            f"    sys.stderr.write({fail_on!r} + ': Invalid data found when processing input')",
+            "    sys.exit(1)",
+        ]
+    lines += [
+        "for i, arg in enumerate(args[:-1]):",
+        "    if arg == 'copy':",
+        "        open(args[i + 1], 'wb').write(b'clean')",
+    ]
+    fake_ffmpeg.write_text("\n".join(lines) + "\n")
+    fake_ffmpeg.chmod(0o755)
+    return fake_ffmpeg
+
+
+def ffmpeg_calls(log: Path) -> List[List[str]]:
+    """Return the argument lists logged by a write_fake_ffmpeg() script, one per call."""
+    if not log.exists():
+        return []
+    return [json.loads(line) for line in log.read_text().splitlines()]
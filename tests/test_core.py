@@ -1,18 +1,51 @@
 """Tests for core scrubbing API."""
 
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
+import multiprocessing
+import os
+import re
 import tempfile
-import shutil
+import sys
+import zipfile
 
-from PIL import Image
+import pytest
 
-from scrubmeta.core import scrub_path, ScrubCallbacks, CancelToken
-from scrubmeta.utils.result import ResultType
+from scrubmeta.core import CoreScrubber, scrub_path, ScrubCallbacks, CancelToken
+from scrubmeta.utils.result import ResultType, ScrubResult
+from tests.helpers import ffmpeg_calls, write_fake_ffmpeg
+
+
+@lru_cache(maxsize=None)
+def _encode_once(color: str) -> bytes:
+    # Pillow is imported on first use, so tests without images never load it.
+    # Stored, unfiltered PNG: the tests never look at the pixels
+    from PIL import Image
+
+    buf = BytesIO()
+    Image.new("RGB", (32, 32), color=color).save(buf, "PNG", compress_level=0, optimize=False)
+    return buf.getvalue()
 
 
 def _make_image(path: Path, color: str = "red") -> None:
-    img = Image.new("RGB", (32, 32), color=color)
-    img.save(path, "PNG")
+    path.write_bytes(_encode_once(color))
+
+
+def _fast_rmtree(root: Path) -> None:
+    """Remove a test directory bottom-up; it only holds files the test made."""
+    for dirpath, dirnames, filenames in os.walk(root, topdown=False):
+        for name in filenames:
+            os.unlink(os.path.join(dirpath, name))
+        for name in dirnames:
+            os.rmdir(os.path.join(dirpath, name))
+    os.rmdir(root)
+
+
+def _stub_scrub(input_path: Path, output_path: Path) -> ScrubResult:
+    """Stand-in scrubber that just writes the output."""
+    output_path.write_bytes(b"clean")
+    return ScrubResult(result_type=ResultType.SUCCESS, input_path=input_path, output_path=output_path)
 
 
 def test_scrub_path_invokes_callbacks():
@@ -21,7 +54,7 @@ def test_scrub_path_invokes_callbacks():
         input_file = temp_dir / "input.png"
         output_dir = temp_dir / "out"
         output_dir.mkdir()
-        _make_image(input_file)
+        input_file.touch()
 
         events = {"scan": 0, "file_start": 0, "file_result": 0, "progress": 0, "done": 0}
 
@@ -37,6 +70,7 @@ def test_scrub_path_invokes_callbacks():
             input_path=input_file,
             output_dir=output_dir,
             callbacks=callbacks,
+            scrubber_override=_stub_scrub,
         )
 
         assert summary.total == 1
@@ -49,7 +83,7 @@ def test_scrub_path_invokes_callbacks():
         assert events["progress"] == 1
         assert events["done"] == 1
     finally:
-        shutil.rmtree(temp_dir)
+        _fast_rmtree(temp_dir)
 
 
 def test_cancel_stops_processing():
@@ -60,8 +94,8 @@ def test_cancel_stops_processing():
         output_dir = temp_dir / "out"
         output_dir.mkdir()
 
-        _make_image(input_dir / "a.png", color="red")
-        _make_image(input_dir / "b.png", color="blue")
+        (input_dir / "a.png").touch()
+        (input_dir / "b.png").touch()
 
         token = CancelToken()
 
@@ -76,6 +110,7 @@ def test_cancel_stops_processing():
             output_dir=output_dir,
             callbacks=callbacks,
             cancel_token=token,
+            scrubber_override=_stub_scrub,
         )
 
         assert summary.cancelled is True
@@ -84,4 +119,439 @@ def test_cancel_stops_processing():
         assert summary.total == 2
         assert len(results) == 1
     finally:
-        shutil.rmtree(temp_dir)
+        _fast_rmtree(temp_dir)
+
+
+def _make_docx(path: Path) -> None:
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("[Content_Types].xml", "<Types/>")
+        zf.writestr("docProps/core.xml", "<creator>Someone</creator>")
+        zf.writestr("word/document.xml", "<body>hello</body>")
+
+
+def test_dotfile_names_are_not_dispatched():
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        # ".jpg" has no suffix, as FileDiscovery also sees it
+        input_file = temp_dir / ".jpg"
+        input_file.touch()
+
+        result = CoreScrubber().scrub_file(input_file, temp_dir / "out.jpg")
+
+        assert result.result_type == ResultType.SKIP
+        assert not (temp_dir / "out.jpg").exists()
+    finally:
+        _fast_rmtree(temp_dir)
+
+
+def test_existing_output_is_kept_without_overwrite():
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        input_dir = temp_dir / "inputs"
+        input_dir.mkdir()
+        output_dir = temp_dir / "out"
+        output_dir.mkdir()
+        _make_docx(input_dir / "report.docx")
+        (output_dir / "report.docx").write_bytes(b"keep me")
+
+        results, summary = scrub_path(input_path=input_dir, output_dir=output_dir)
+
+        assert summary.success == 1
+        assert results[0].output_path == output_dir / "report_clean_1.docx"
+        assert (output_dir / "report.docx").read_bytes() == b"keep me"
+        with zipfile.ZipFile(results[0].output_path) as clean:
+            assert "docProps/core.xml" not in clean.namelist()
+
+        results, summary = scrub_path(input_path=input_dir, output_dir=output_dir, overwrite=True)
+
+        assert results[0].output_path == output_dir / "report.docx"
+        assert sorted(p.name for p in output_dir.iterdir()) == ["report.docx", "report_clean_1.docx"]
+    finally:
+        _fast_rmtree(temp_dir)
+
+
+def test_override_keeps_existing_output_without_overwrite():
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        input_dir = temp_dir / "inputs"
+        input_dir.mkdir()
+        output_dir = temp_dir / "out"
+        output_dir.mkdir()
+        (input_dir / "a.jpg").touch()
+        (output_dir / "a.jpg").write_bytes(b"KEEP")
+
+        for workers in (1, 2):
+            results, summary = scrub_path(
+                input_path=input_dir, output_dir=output_dir, workers=workers, scrubber_override=_stub_scrub
+            )
+
+            assert summary.success == 1
+            assert results[0].output_path == output_dir / f"a_clean_{workers}.jpg"
+            assert results[0].output_path.read_bytes() == b"clean"
+        assert (output_dir / "a.jpg").read_bytes() == b"KEEP"
+    finally:
+        _fast_rmtree(temp_dir)
+
+
+def test_interrupted_run_leaves_no_output():
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        input_dir = temp_dir / "inputs"
+        input_dir.mkdir()
+        (input_dir / "a.pdf").touch()
+
+        def interrupted(input_path, output_path):
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            scrub_path(input_path=input_dir, output_dir=temp_dir / "out", scrubber_override=interrupted)
+
+        assert list((temp_dir / "out").iterdir()) == []
+    finally:
+        _fast_rmtree(temp_dir)
+
+
+def test_parallel_cancel_stops_submitting():
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        input_dir = temp_dir / "inputs"
+        input_dir.mkdir()
+        for n in range(40):
+            (input_dir / f"{n:02d}.png").touch()
+
+        token = CancelToken()
+        started = []
+        callbacks = ScrubCallbacks(
+            on_file_start=lambda i, t, p: started.append(i),
+            on_file_result=lambda res: token.cancel(),
+        )
+
+        results, summary = scrub_path(
+            input_path=input_dir,
+            output_dir=temp_dir / "out",
+            callbacks=callbacks,
+            cancel_token=token,
+            scrubber_override=_stub_scrub,
+            workers=4,
+        )
+
+        # Chunks already handed to workers finish; nothing new is queued
+        assert summary.cancelled is True
+        assert summary.total == 40
+        assert summary.success == len(results) < 40
+        assert summary.skipped == 40 - len(results)
+        assert started == list(range(1, len(started) + 1))
+        assert len(started) < 40
+    finally:
+        _fast_rmtree(temp_dir)
+
+
+def test_parallel_workers_scrub_all_files():
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        input_dir = temp_dir / "inputs"
+        (input_dir / "nested").mkdir(parents=True)
+        output_dir = temp_dir / "out"
+
+        _make_image(input_dir / "a.png", color="red")
+        _make_image(input_dir / "b.png", color="blue")
+        # Same name as a top-level file: flat output must not collide
+        _make_image(input_dir / "nested" / "a.png", color="blue")
+
+        results, summary = scrub_path(
+            input_path=input_dir,
+            output_dir=output_dir,
+            recursive=True,
+            workers=2,
+        )
+
+        assert summary.total == 3
+        assert summary.success == 3
+        assert summary.cancelled is False
+        output_names = sorted(p.name for p in output_dir.iterdir())
+        assert output_names == ["a.png", "a_clean_1.png", "b.png"]
+        assert len({r.output_path for r in results}) == 3
+    finally:
+        _fast_rmtree(temp_dir)
+
+
+def test_parallel_workers_accept_spawn_context():
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        input_dir = temp_dir / "inputs"
+        input_dir.mkdir()
+        for name in ("a.jpg", "b.pdf", "c.docx"):
+            (input_dir / name).touch()
+
+        results, summary = scrub_path(
+            input_path=input_dir,
+            output_dir=temp_dir / "out",
+            workers=2,
+            scrubber_override=_stub_scrub,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+        assert summary.success == 3
+        assert all(r.output_path.read_bytes() == b"clean" for r in results)
+    finally:
+        _fast_rmtree(temp_dir)
+
+
+def test_collect_results_false_streams_only():
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        input_dir = temp_dir / "inputs"
+        input_dir.mkdir()
+        _make_image(input_dir / "a.png", color="red")
+        _make_image(input_dir / "b.png", color="blue")
+
+        seen = []
+        results, summary = scrub_path(
+            input_path=input_dir,
+            output_dir=temp_dir / "out",
+            callbacks=ScrubCallbacks(on_file_result=seen.append),
+            collect_results=False,
+        )
+
+        assert results == []
+        assert len(seen) == 2
+        assert summary.total == 2
+        assert summary.success == 2
+    finally:
+        _fast_rmtree(temp_dir)
+
+
+def test_clean_pdf_is_copied_unchanged():
+    pikepdf = pytest.importorskip("pikepdf")
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        input_file = temp_dir / "blank.pdf"
+        pdf = pikepdf.new()
+        pdf.add_blank_page()
+        pdf.save(input_file)
+
+        results, summary = scrub_path(
+            input_path=input_file,
+            output_dir=temp_dir / "out",
+            allow_reflink=True,
+        )
+
+        assert summary.success == 1
+        assert results[0].metadata_removed == "no metadata found"
+        assert results[0].output_path.read_bytes() == input_file.read_bytes()
+    finally:
+        _fast_rmtree(temp_dir)
+
+
+def test_pdf_streams_are_kept_as_stored():
+    pikepdf = pytest.importorskip("pikepdf")
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        input_file = temp_dir / "tagged.pdf"
+        content = b"BT /F1 12 Tf 72 712 Td (Hello) Tj ET\n" * 50
+        pdf = pikepdf.new()
+        pdf.add_blank_page()
+        pdf.pages[0].Contents = pdf.make_stream(content)
+        pdf.docinfo["/Author"] = "Someone"
+        pdf.save(input_file, compress_streams=False)
+
+        results, summary = scrub_path(input_path=input_file, output_dir=temp_dir / "out")
+
+        assert summary.success == 1
+        with pikepdf.open(results[0].output_path) as clean:
+            assert "/Author" not in clean.docinfo
+            stream = clean.pages[0].Contents
+            # Still uncompressed: the scrub neither decoded nor recompressed it
+            assert "/Filter" not in stream
+            assert stream.read_raw_bytes() == content
+    finally:
+        _fast_rmtree(temp_dir)
+
+
+def test_pdf_metadata_blanked_in_place():
+    pikepdf = pytest.importorskip("pikepdf")
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        input_file = temp_dir / "tagged.pdf"
+        pdf = pikepdf.new()
+        pdf.add_blank_page()
+        pdf.docinfo["/Author"] = "Someone Private"
+        with pdf.open_metadata() as meta:
+            meta["dc:creator"] = ["Someone Private"]
+        pdf.save(input_file, compress_streams=False, object_stream_mode=pikepdf.ObjectStreamMode.disable)
+
+        results, summary = scrub_path(input_path=input_file, output_dir=temp_dir / "out")
+
+        assert summary.success == 1
+        output = results[0].output_path
+        # Same length: the metadata was overwritten, nothing was re-serialized
+        assert output.stat().st_size == input_file.stat().st_size
+        assert b"Someone Private" not in output.read_bytes()
+        with pikepdf.open(output) as clean:
+            assert len(clean.docinfo.keys()) == 0
+            assert not clean.get_warnings()
+    finally:
+        _fast_rmtree(temp_dir)
+
+
+def test_pdf_earlier_revision_metadata_is_dropped():
+    pikepdf = pytest.importorskip("pikepdf")
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        base = temp_dir / "base.pdf"
+        pdf = pikepdf.new()
+        pdf.add_blank_page()
+        pdf.docinfo["/Author"] = "SECRET"
+        pdf.save(base, object_stream_mode=pikepdf.ObjectStreamMode.disable)
+        original = base.read_bytes()
+        with pikepdf.open(base) as pdf:
+            root = pdf.Root.objgen
+            size = int(pdf.trailer.Size)
+        prev = int(original.rsplit(b"startxref", 1)[1].split()[0])
+
+        # An incremental update whose trailer no longer points to the old /Info
+        update = (
+            b"xref\n0 1\n0000000000 65535 f \n"
+            b"trailer\n<< /Size %d /Root %d %d R /Prev %d >>\n" % (size, root[0], root[1], prev)
+        )
+        incremental = temp_dir / "incremental.pdf"
+        incremental.write_bytes(
+            original + update + b"startxref\n%d\n%%%%EOF\n" % len(original)
+        )
+        # The same leftover without an update: the trailer's /Info blanked out
+        info_ref = re.search(rb"/Info \d+ \d+ R", original).group()
+        orphaned = temp_dir / "orphaned.pdf"
+        orphaned.write_bytes(original.replace(info_ref, b" " * len(info_ref)))
+
+        for input_file in (incremental, orphaned):
+            with pikepdf.open(input_file) as pdf:
+                assert "/Info" not in pdf.trailer
+
+            results, summary = scrub_path(input_path=input_file, output_dir=temp_dir / "out")
+
+            assert summary.success == 1
+            assert results[0].metadata_removed != "no metadata found"
+            assert b"SECRET" not in results[0].output_path.read_bytes()
+            with pikepdf.open(results[0].output_path) as clean:
+                assert "/Prev" not in clean.trailer
+    finally:
+        _fast_rmtree(temp_dir)
+
+
+def test_lazy_discovery_reports_unknown_total():
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        input_dir = temp_dir / "inputs"
+        (input_dir / "nested").mkdir(parents=True)
+        _make_image(input_dir / "b.png", color="red")
+        _make_image(input_dir / "nested" / "a.png", color="blue")
+
+        scan_totals = []
+        started = []
+        results, summary = scrub_path(
+            input_path=input_dir,
+            output_dir=temp_dir / "out",
+            recursive=True,
+            dry_run=True,
+            callbacks=ScrubCallbacks(
+                on_scan_start=scan_totals.append,
+                on_file_start=lambda i, t, p: started.append((i, t, p.name)),
+            ),
+            progress_total_required=False,
+        )
+
+        assert scan_totals == [-1]
+        assert started == [(1, -1, "b.png"), (2, -1, "a.png")]
+        assert summary.total == 2
+        assert not summary.cancelled
+    finally:
+        _fast_rmtree(temp_dir)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fake ffmpeg is a shell script")
+def test_media_files_share_one_ffmpeg_process():
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        input_dir = temp_dir / "inputs"
+        input_dir.mkdir()
+        for name in ("a.mp3", "b.mp3", "c.wav"):
+            (input_dir / name).write_bytes(b"audio")
+
+        log = temp_dir / "calls.log"
+        fake_ffmpeg = write_fake_ffmpeg(temp_dir, log=log)
+
+        results, summary = scrub_path(
+            input_path=input_dir,
+            output_dir=temp_dir / "out",
+            ffmpeg_cmd=str(fake_ffmpeg),
+        )
+
+        assert summary.success == 3
+        assert len(ffmpeg_calls(log)) == 1
+        assert [r.input_path.name for r in results] == ["a.mp3", "b.mp3", "c.wav"]
+        assert (temp_dir / "out" / "a.mp3").read_bytes() == b"clean"
+    finally:
+        _fast_rmtree(temp_dir)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fake ffmpeg is a shell script")
+def test_batched_media_keeps_discovery_order():
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        input_dir = temp_dir / "inputs"
+        input_dir.mkdir()
+        (input_dir / "a.mp3").write_bytes(b"audio")
+        _make_docx(input_dir / "b.docx")
+        (input_dir / "c.mp3").write_bytes(b"audio")
+        (input_dir / "d.wav").write_bytes(b"audio")
+
+        fake_ffmpeg = write_fake_ffmpeg(temp_dir)
+
+        events = []
+        results, summary = scrub_path(
+            input_path=input_dir,
+            output_dir=temp_dir / "out",
+            ffmpeg_cmd=str(fake_ffmpeg),
+            callbacks=ScrubCallbacks(
+                on_file_start=lambda i, t, p: events.append(("start", p.name)),
+                on_file_result=lambda r: events.append(("result", r.input_path.name)),
+            ),
+        )
+
+        assert summary.success == 4
+        assert [r.input_path.name for r in results] == ["a.mp3", "b.docx", "c.mp3", "d.wav"]
+        # Queued media files are only started when their batch runs
+        assert events == [
+            ("start", "a.mp3"), ("result", "a.mp3"),
+            ("start", "b.docx"), ("result", "b.docx"),
+            ("start", "c.mp3"), ("start", "d.wav"), ("result", "c.mp3"), ("result", "d.wav"),
+        ]
+    finally:
+        _fast_rmtree(temp_dir)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fake ffmpeg is a shell script")
+def test_parallel_workers_batch_media_files():
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        input_dir = temp_dir / "inputs"
+        input_dir.mkdir()
+        for n in range(16):
+            (input_dir / f"track{n:02d}.mp3").write_bytes(b"audio")
+
+        log = temp_dir / "calls.log"
+        fake_ffmpeg = write_fake_ffmpeg(temp_dir, log=log)
+
+        results, summary = scrub_path(
+            input_path=input_dir,
+            output_dir=temp_dir / "out",
+            ffmpeg_cmd=str(fake_ffmpeg),
+            workers=2,
+        )
+
+        assert summary.success == 16
+        # Files travel to workers in chunks, each chunk a single ffmpeg run
+        assert len(ffmpeg_calls(log)) < 16
+        assert sorted(r.input_path.name for r in results) == [f"track{n:02d}.mp3" for n in range(16)]
+    finally:
+        _fast_rmtree(temp_dir)
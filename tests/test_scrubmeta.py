@@ -1,30 +1,107 @@
 """Tests for MetaScrub."""
 
+import functools
+import itertools
+import os
+import struct
+import sys
 import unittest
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Optional, Tuple
 import tempfile
-import shutil
 from io import BytesIO
 
-from PIL import Image
-
 from scrubmeta.utils.file_utils import FileDiscovery, OutputManager
 from scrubmeta.utils.result import ResultType
+from scrubmeta.utils.tmpfile import AtomicOutputFile
 from scrubmeta.scrubbers.image_scrubber import ImageScrubber
 from scrubmeta.scrubbers.media_scrubber import MediaScrubber
+from scrubmeta.scrubbers.ooxml_scrubber import OOXMLScrubber
+from tests.helpers import ffmpeg_calls, write_fake_ffmpeg
 
 
-class TestFileDiscovery(unittest.TestCase):
-    """Test file discovery functionality."""
-    
+# Scratch buffer for encoding test images; getvalue() copies, so it's reused
+_ENC_BUF = BytesIO()
+
+
+@functools.lru_cache(maxsize=None)
+def _test_image():
+    """The red test image, allocated once and shared by every format."""
+    from PIL import Image
+
+    return Image.new('RGB', (100, 100), color='red')
+
+
+@functools.lru_cache(maxsize=None)
+def _encoded_test_image(format: str) -> bytes:
+    """Encode the red test image once per format; tests only write the bytes out."""
+    _ENC_BUF.seek(0)
+    _ENC_BUF.truncate()
+    _test_image().save(_ENC_BUF, format)
+    return _ENC_BUF.getvalue()
+
+
+def _tmp_base(needs_exec: bool) -> Optional[str]:
+    """Pick /dev/shm for test files when usable, else the default temp dir."""
+    shm = "/dev/shm"
+    if os.path.isdir(shm) and os.access(shm, os.W_OK | os.X_OK):
+        # tmpfs is often mounted noexec, which breaks tests running scripts
+        if not needs_exec or not os.statvfs(shm).f_flag & getattr(os, "ST_NOEXEC", 0):
+            return shm
+    return None
+
+
+def _remove_tree(path: str) -> None:
+    """Delete a test directory; the trees are small, so no rmtree machinery."""
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                _remove_tree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
+def _mkfiles(root: str, names) -> None:
+    """Create empty files with raw os.open/os.close (no Path objects, no utime)."""
+    fd_open = os.open
+    fd_close = os.close
+    flags = os.O_CREAT | os.O_WRONLY
+    join = os.path.join
+    for name in names:
+        fd_close(fd_open(join(root, name), flags, 0o600))
+
+
+class _TmpRoot(unittest.TestCase):
+    """Gives each test a fresh subdirectory of one temp root per class."""
+
+    # Set when tests execute files from their directory
+    needs_exec = False
+
+    @classmethod
+    def setUpClass(cls):
+        cls._root = Path(tempfile.mkdtemp(prefix=f"{cls.__name__}-", dir=_tmp_base(cls.needs_exec)))
+        cls._ctr = itertools.count()
+
+    @classmethod
+    def tearDownClass(cls):
+        _remove_tree(str(cls._root))
+
     def setUp(self):
         """Set up test fixtures."""
-        self.test_dir = tempfile.mkdtemp()
-        self.test_path = Path(self.test_dir)
-    
+        self.test_path = self._root / f"t{next(self._ctr)}"
+        os.mkdir(self.test_path)
+        self.test_dir = str(self.test_path)
+
     def tearDown(self):
         """Clean up test fixtures."""
-        shutil.rmtree(self.test_dir)
+        _remove_tree(self.test_dir)
+
+
+class TestFileDiscovery(_TmpRoot):
+    """Test file discovery functionality."""
     
     def test_single_file_discovery(self):
         """Test discovering a single file."""
@@ -38,68 +115,91 @@ class TestFileDiscovery(unittest.TestCase):
     def test_directory_discovery_non_recursive(self):
         """Test discovering files in a directory without recursion."""
         # Create test files
-        (self.test_path / "image1.jpg").touch()
-        (self.test_path / "image2.png").touch()
-        (self.test_path / "document.pdf").touch()
-        (self.test_path / "ignored.txt").touch()
+        _mkfiles(self.test_dir, ["image1.jpg", "image2.png", "document.pdf", "ignored.txt"])
         
         # Create subdirectory with files
-        sub_dir = self.test_path / "subdir"
-        sub_dir.mkdir()
-        (sub_dir / "nested.jpg").touch()
+        sub_dir = os.path.join(self.test_dir, "subdir")
+        os.mkdir(sub_dir)
+        _mkfiles(sub_dir, ["nested.jpg"])
         
         files = FileDiscovery.discover_files(self.test_path, recursive=False)
         
         # Should find 3 supported files in root, not in subdirectory
         self.assertEqual(len(files), 3)
-        file_names = {f.name for f in files}
-        self.assertEqual(file_names, {"image1.jpg", "image2.png", "document.pdf"})
+        self.assertEqual(sorted(f.name for f in files), ["document.pdf", "image1.jpg", "image2.png"])
     
     def test_directory_discovery_recursive(self):
         """Test discovering files recursively."""
         # Create test files
-        (self.test_path / "root.jpg").touch()
+        _mkfiles(self.test_dir, ["root.jpg"])
         
         # Create nested structure
-        sub_dir = self.test_path / "subdir"
-        sub_dir.mkdir()
-        (sub_dir / "nested.png").touch()
+        sub_dir = os.path.join(self.test_dir, "subdir")
+        os.mkdir(sub_dir)
+        _mkfiles(sub_dir, ["nested.png"])
         
-        deep_dir = sub_dir / "deep"
-        deep_dir.mkdir()
-        (deep_dir / "deep.pdf").touch()
+        deep_dir = os.path.join(sub_dir, "deep")
+        os.mkdir(deep_dir)
+        _mkfiles(deep_dir, ["deep.pdf"])
         
         files = FileDiscovery.discover_files(self.test_path, recursive=True)
         
         # Should find all 3 files
         self.assertEqual(len(files), 3)
-        file_names = {f.name for f in files}
-        self.assertEqual(file_names, {"root.jpg", "nested.png", "deep.pdf"})
+        self.assertEqual(sorted(f.name for f in files), ["deep.pdf", "nested.png", "root.jpg"])
     
+    def test_discovery_matches_suffix_like_splitext(self):
+        """Test discovery agrees with is_supported on case and leading dots."""
+        names = ["A.JPG", ".jpg", "..png", ".hidden.pdf", "archive.jpg.zip", "b.Mp4"]
+        _mkfiles(self.test_dir, names)
+
+        files = FileDiscovery.discover_files(self.test_path)
+
+        self.assertEqual(
+            [f.name for f in files],
+            sorted(n for n in names if FileDiscovery.is_supported(Path(n))),
+        )
+        self.assertEqual([f.name for f in files], [".hidden.pdf", "A.JPG", "b.Mp4"])
+
+    @unittest.skipUnless(hasattr(os, "symlink") and sys.platform != "win32", "needs symlinks")
+    def test_recursive_discovery_skips_symlinked_dirs(self):
+        """Test symlinked directories aren't followed (no loops, no duplicates)."""
+        sub_dir = os.path.join(self.test_dir, "subdir")
+        os.mkdir(sub_dir)
+        _mkfiles(sub_dir, ["nested.png"])
+        os.symlink(self.test_dir, os.path.join(sub_dir, "loop"))
+
+        files = FileDiscovery.discover_files(self.test_path, recursive=True)
+
+        self.assertEqual([f.name for f in files], ["nested.png"])
+
     def test_is_supported(self):
         """Test file type support detection."""
-        self.assertTrue(FileDiscovery.is_supported(Path("test.jpg")))
-        self.assertTrue(FileDiscovery.is_supported(Path("test.JPG")))
-        self.assertTrue(FileDiscovery.is_supported(Path("test.png")))
-        self.assertTrue(FileDiscovery.is_supported(Path("test.pdf")))
-        self.assertTrue(FileDiscovery.is_supported(Path("test.docx")))
-        self.assertTrue(FileDiscovery.is_supported(Path("movie.mp4")))
-        self.assertTrue(FileDiscovery.is_supported(Path("audio.mp3")))
-        self.assertFalse(FileDiscovery.is_supported(Path("test.txt")))
-        self.assertFalse(FileDiscovery.is_supported(Path("test.zip")))
-
-
-class TestOutputManager(unittest.TestCase):
+        cases = [
+            ("test.jpg", True),
+            ("test.JPG", True),
+            ("test.png", True),
+            ("test.pdf", True),
+            ("test.docx", True),
+            ("movie.mp4", True),
+            ("audio.mp3", True),
+            ("test.txt", False),
+            ("test.zip", False),
+        ]
+        for name, expected in cases:
+            self.assertEqual(FileDiscovery.is_supported(Path(name)), expected, name)
+            self.assertEqual(FileDiscovery.is_supported(name), expected, name)
+        self.assertTrue(FileDiscovery.is_supported(os.path.join("some.dir", "photo.jpg")))
+        self.assertFalse(FileDiscovery.is_supported(os.path.join("photos.jpg", "notes")))
+
+
+class TestOutputManager(_TmpRoot):
     """Test output file management."""
     
     def setUp(self):
         """Set up test fixtures."""
-        self.test_dir = tempfile.mkdtemp()
-        self.output_dir = Path(self.test_dir) / "output"
-    
-    def tearDown(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.test_dir)
+        super().setUp()
+        self.output_dir = self.test_path / "output"
     
     def test_output_directory_creation(self):
         """Test that output directory is created."""
@@ -155,55 +255,290 @@ class TestOutputManager(unittest.TestCase):
         
         # Should return same path (allows overwrite)
         self.assertEqual(output_path, existing)
+    
+    def test_reserve_output_claims_path(self):
+        """Test that reserve_output hands out unique paths without touching disk."""
+        manager = OutputManager(self.output_dir, overwrite=False)
+        
+        first = manager.reserve_output("/some/path/test.jpg")
+        second = manager.reserve_output("/other/path/test.jpg")
+        
+        self.assertEqual(first, str(self.output_dir / "test.jpg"))
+        self.assertEqual(second, str(self.output_dir / "test_clean_1.jpg"))
+        # Names are claimed on disk when the scrubber publishes
+        self.assertEqual(os.listdir(self.output_dir), [])
+    
+    def test_reserve_output_continues_numbering(self):
+        """Test that repeated collisions don't re-try suffixes already handed out."""
+        manager = OutputManager(self.output_dir, overwrite=False)
+        
+        paths = [manager.reserve_output(f"/src/{n}/test.jpg") for n in range(4)]
+        paths.append(manager.reserve_output("/src/test_clean_1.jpg"))
+        
+        self.assertEqual(
+            [Path(p).name for p in paths],
+            ["test.jpg", "test_clean_1.jpg", "test_clean_2.jpg", "test_clean_3.jpg", "test_clean_1_clean_1.jpg"],
+        )
+
+
+class TestAtomicOutputFile(_TmpRoot):
+    """Test publishing of temporary output files."""
+
+    def _publish(self, dst: Path, data: bytes, exclusive: bool) -> str:
+        with AtomicOutputFile(str(dst), suffix=dst.suffix, exclusive=exclusive) as tmp:
+            tmp.file.write(data)
+            return tmp.commit()
 
+    def test_commit_replaces_existing_file(self):
+        """Test a plain commit replaces whatever is at the destination."""
+        dst = self.test_path / "out.jpg"
+        dst.write_bytes(b"old")
 
-class TestImageScrubber(unittest.TestCase):
+        self.assertEqual(self._publish(dst, b"new", exclusive=False), str(dst))
+        self.assertEqual(dst.read_bytes(), b"new")
+        self.assertEqual(os.listdir(self.test_dir), ["out.jpg"])
+
+    def test_exclusive_commit_keeps_existing_files(self):
+        """Test an exclusive commit moves on to the next free _clean_N name."""
+        dst = self.test_path / "out.jpg"
+        dst.write_bytes(b"old")
+        (self.test_path / "out_clean_1.jpg").write_bytes(b"older")
+
+        published = self._publish(dst, b"new", exclusive=True)
+
+        self.assertEqual(published, str(self.test_path / "out_clean_2.jpg"))
+        self.assertEqual(Path(published).read_bytes(), b"new")
+        self.assertEqual(dst.read_bytes(), b"old")
+        self.assertEqual(self._publish(self.test_path / "free.jpg", b"x", exclusive=True),
+                         str(self.test_path / "free.jpg"))
+        self.assertEqual(
+            sorted(os.listdir(self.test_dir)),
+            ["free.jpg", "out.jpg", "out_clean_1.jpg", "out_clean_2.jpg"],
+        )
+
+
+class TestImageScrubber(_TmpRoot):
     """Test image scrubbing functionality."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        self.test_dir = tempfile.mkdtemp()
-        self.test_path = Path(self.test_dir)
-    
-    def tearDown(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.test_dir)
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Load Pillow's common codec plugins once, before the first test,
+        # rather than in setUpModule: the other classes never need Pillow
+        from PIL import Image
+
+        Image.preinit()
     
     def create_test_image(self, path: Path, format: str = "JPEG"):
         """Create a test image file."""
-        img = Image.new('RGB', (100, 100), color='red')
-        img.save(path, format)
+        path.write_bytes(_encoded_test_image(format))
     
     def test_can_handle(self):
         """Test file type detection."""
-        self.assertTrue(ImageScrubber.can_handle(Path("test.jpg")))
-        self.assertTrue(ImageScrubber.can_handle(Path("test.jpeg")))
-        self.assertTrue(ImageScrubber.can_handle(Path("test.png")))
-        self.assertTrue(ImageScrubber.can_handle(Path("test.webp")))
-        self.assertFalse(ImageScrubber.can_handle(Path("test.pdf")))
-        self.assertFalse(ImageScrubber.can_handle(Path("test.txt")))
+        cases = [
+            ("test.jpg", True),
+            ("test.jpeg", True),
+            ("test.png", True),
+            ("test.webp", True),
+            ("test.pdf", False),
+            ("test.txt", False),
+        ]
+        for name, expected in cases:
+            self.assertEqual(ImageScrubber.can_handle(Path(name)), expected, name)
 
+    def test_scrub_strips_metadata(self):
+        """Test EXIF and ICC are removed while pixels are kept."""
+        from PIL import Image
 
-class TestMediaScrubber(unittest.TestCase):
-    """Test media scrubbing functionality."""
+        input_file = self.test_path / "photo.jpg"
+        output_file = self.test_path / "photo_clean.jpg"
+        img = Image.new('RGB', (64, 48), color='blue')
+        exif = Image.Exif()
+        exif[0x010F] = "CameraMaker"  # Make
+        img.save(input_file, "JPEG", exif=exif.tobytes(), icc_profile=b"fake-icc")
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.test_dir = tempfile.mkdtemp()
-        self.test_path = Path(self.test_dir)
+        result = ImageScrubber.scrub(input_file, output_file)
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.test_dir)
+        self.assertEqual(result.result_type, ResultType.SUCCESS)
+        with Image.open(output_file) as clean:
+            self.assertEqual(clean.size, (64, 48))
+            self.assertNotIn("exif", clean.info)
+            self.assertNotIn("icc_profile", clean.info)
+            self.assertEqual(len(clean.getexif()), 0)
+
+    def test_jpeg_scrub_keeps_image_data(self):
+        """Test JPEG metadata segments are dropped without re-encoding."""
+        from PIL import Image
+
+        input_file = self.test_path / "photo.jpg"
+        output_file = self.test_path / "photo_clean.jpg"
+        img = Image.linear_gradient('L').convert('RGB')
+        img.save(input_file, "JPEG", quality=80, comment=b"secret note")
+
+        result = ImageScrubber.scrub(input_file, output_file)
+
+        self.assertEqual(result.result_type, ResultType.SUCCESS)
+        self.assertNotIn(b"secret note", output_file.read_bytes())
+        with Image.open(input_file) as original, Image.open(output_file) as clean:
+            self.assertEqual(clean.tobytes(), original.tobytes())
+
+    def test_jfif_only_jpeg_is_copied_unchanged(self):
+        """Test a bare JFIF header alone doesn't count as metadata."""
+        input_file = self.test_path / "plain.jpg"
+        output_file = self.test_path / "plain_out.jpg"
+        self.create_test_image(input_file, "JPEG")
+        self.assertIn(b"JFIF\0", input_file.read_bytes()[:32])
+
+        result = ImageScrubber.scrub(input_file, output_file)
+
+        self.assertEqual(result.result_type, ResultType.SUCCESS)
+        self.assertEqual(result.metadata_removed, "no metadata found")
+        self.assertEqual(output_file.read_bytes(), input_file.read_bytes())
+
+    def test_png_scrub_drops_text_chunks(self):
+        """Test PNG text chunks are dropped and pixel chunks kept."""
+        from PIL import Image, PngImagePlugin
+
+        input_file = self.test_path / "image.png"
+        output_file = self.test_path / "image_clean.png"
+        info = PngImagePlugin.PngInfo()
+        info.add_text("Author", "Jane Doe")
+        Image.new('RGBA', (32, 32), color=(10, 20, 30, 40)).save(input_file, "PNG", pnginfo=info)
+
+        result = ImageScrubber.scrub(input_file, output_file)
+
+        self.assertEqual(result.result_type, ResultType.SUCCESS)
+        self.assertNotIn(b"Jane Doe", output_file.read_bytes())
+        with Image.open(output_file) as clean:
+            self.assertNotIn("Author", clean.info)
+            self.assertEqual(clean.getpixel((0, 0)), (10, 20, 30, 40))
+
+    def test_clean_webp_is_copied_unchanged(self):
+        """Test a WebP without metadata chunks is copied, not re-encoded."""
+        input_file = self.test_path / "clean.webp"
+        output_file = self.test_path / "clean_out.webp"
+        self.create_test_image(input_file, "WEBP")
+
+        result = ImageScrubber.scrub(input_file, output_file)
+
+        self.assertEqual(result.result_type, ResultType.SUCCESS)
+        self.assertEqual(result.metadata_removed, "no metadata found")
+        self.assertEqual(output_file.read_bytes(), input_file.read_bytes())
+
+    def test_scrub_replaces_existing_output(self):
+        """Test an existing output is replaced and no temp files are left."""
+        from PIL import Image
+
+        input_file = self.test_path / "photo.webp"
+        output_file = self.test_path / "out" / "photo.webp"
+        self.create_test_image(input_file, "WEBP")
+        output_file.parent.mkdir()
+        output_file.write_bytes(b"stale")
+
+        result = ImageScrubber.scrub(input_file, output_file)
+
+        self.assertEqual(result.result_type, ResultType.SUCCESS)
+        self.assertEqual(os.listdir(output_file.parent), ["photo.webp"])
+        with Image.open(output_file) as clean:
+            self.assertEqual(clean.format, "WEBP")
+
+
+class TestOOXMLScrubber(_TmpRoot):
+    """Test Office document scrubbing functionality."""
+
+    def test_scrub_drops_doc_props_and_keeps_parts(self):
+        """Test metadata parts are removed and other parts copied as-is."""
+        input_file = self.test_path / "report.docx"
+        output_file = self.test_path / "report_clean.docx"
+        with zipfile.ZipFile(input_file, 'w') as zf:
+            zf.writestr("[Content_Types].xml", "<Types/>", zipfile.ZIP_DEFLATED)
+            zf.writestr("docProps/core.xml", "<creator>Jane Doe</creator>", zipfile.ZIP_DEFLATED)
+            zf.writestr("word/document.xml", "<body>hello</body>" * 100, zipfile.ZIP_DEFLATED)
+            image = zipfile.ZipInfo("word/media/image1.png", (2024, 5, 6, 7, 8, 10))
+            image.comment = b"edited by Jane"
+            image.external_attr = 0o644 << 16
+            zf.writestr(image, b"\x89PNG fake", zipfile.ZIP_STORED)
+            zf.comment = b"Jane's laptop"
+
+        result = OOXMLScrubber.scrub(input_file, output_file)
+
+        self.assertEqual(result.result_type, ResultType.SUCCESS)
+        with zipfile.ZipFile(input_file) as original, zipfile.ZipFile(output_file) as clean:
+            self.assertIsNone(clean.testzip())
+            self.assertEqual(
+                clean.namelist(),
+                ["[Content_Types].xml", "word/document.xml", "word/media/image1.png"],
+            )
+            self.assertEqual(clean.comment, b"")
+            for info in clean.infolist():
+                source = original.getinfo(info.filename)
+                self.assertEqual(info.compress_type, source.compress_type)
+                self.assertNotEqual(info.date_time, source.date_time)
+                self.assertEqual(info.date_time, (1980, 1, 1, 0, 0, 0))
+                self.assertEqual((info.comment, info.external_attr), (b"", 0))
+                self.assertEqual(clean.read(info), original.read(source))
+        self.assertNotIn(b"Jane", output_file.read_bytes())
+
+    def test_normalized_archive_is_copied_unchanged(self):
+        """Test a document with no metadata parts and fixed entry times is copied as-is."""
+        input_file = self.test_path / "plain.xlsx"
+        output_file = self.test_path / "plain_clean.xlsx"
+        with zipfile.ZipFile(input_file, 'w') as zf:
+            for name in ("[Content_Types].xml", "xl/workbook.xml"):
+                info = zipfile.ZipInfo(name, (1980, 1, 1, 0, 0, 0))
+                zf.writestr(info, "<x/>", zipfile.ZIP_DEFLATED)
+
+        result = OOXMLScrubber.scrub(input_file, output_file)
+
+        self.assertEqual(result.result_type, ResultType.SUCCESS)
+        self.assertEqual(result.metadata_removed, "no metadata files found")
+        self.assertEqual(output_file.read_bytes(), input_file.read_bytes())
+
+    def test_copy_member_falls_back_without_zipfile_internals(self):
+        """Test members are rewritten through writestr() when ZipFile internals are missing."""
+
+        class PublicOnly:
+            # Exposes only the public writer API of a real ZipFile
+            def __init__(self, zf):
+                self.writestr = zf.writestr
+
+        input_file = self.test_path / "report.docx"
+        output_file = self.test_path / "report_clean.docx"
+        with zipfile.ZipFile(input_file, 'w') as zf:
+            zf.writestr("word/document.xml", "<body>hello</body>" * 100, zipfile.ZIP_DEFLATED)
+            zf.writestr("word/media/image1.png", b"\x89PNG fake", zipfile.ZIP_STORED)
+
+        data = input_file.read_bytes()
+        with zipfile.ZipFile(input_file) as zip_in, zipfile.ZipFile(output_file, 'w') as zip_out:
+            for info in zip_in.infolist():
+                OOXMLScrubber._copy_member(memoryview(data), zip_in, PublicOnly(zip_out), info)
+
+        with zipfile.ZipFile(input_file) as original, zipfile.ZipFile(output_file) as clean:
+            self.assertIsNone(clean.testzip())
+            for info in clean.infolist():
+                source = original.getinfo(info.filename)
+                self.assertEqual(info.compress_type, source.compress_type)
+                self.assertEqual(clean.read(info), original.read(source))
+
+
+class TestMediaScrubber(_TmpRoot):
+    """Test media scrubbing functionality."""
+
+    # Runs a stand-in ffmpeg script from the test directory
+    needs_exec = True
 
     def test_can_handle(self):
         """Test media type detection."""
-        self.assertTrue(MediaScrubber.can_handle(Path("video.mp4")))
-        self.assertTrue(MediaScrubber.can_handle(Path("video.MOV")))
-        self.assertTrue(MediaScrubber.can_handle(Path("audio.mp3")))
-        self.assertTrue(MediaScrubber.can_handle(Path("audio.flac")))
-        self.assertFalse(MediaScrubber.can_handle(Path("image.jpg")))
-        self.assertFalse(MediaScrubber.can_handle(Path("document.pdf")))
+        cases = [
+            ("video.mp4", True),
+            ("video.MOV", True),
+            ("audio.mp3", True),
+            ("audio.flac", True),
+            ("image.jpg", False),
+            ("document.pdf", False),
+        ]
+        for name, expected in cases:
+            self.assertEqual(MediaScrubber.can_handle(Path(name)), expected, name)
 
     def test_scrub_without_ffmpeg(self):
         """If ffmpeg is missing, scrubbing should skip gracefully."""
@@ -211,7 +546,7 @@ class TestMediaScrubber(unittest.TestCase):
             self.skipTest("ffmpeg available; skip missing ffmpeg test")
 
         input_path = self.test_path / "input.mp3"
-        input_path.touch()
+        open(input_path, 'wb').close()
         output_path = self.test_path / "output.mp3"
 
         result = MediaScrubber.scrub(input_path, output_path, ffmpeg_cmd="/nonexistent/ffmpeg")
@@ -219,10 +554,134 @@ class TestMediaScrubber(unittest.TestCase):
         self.assertEqual(result.result_type, ResultType.SKIP)
         self.assertFalse(output_path.exists())
 
+    def test_missing_ffmpeg_probe_is_cached(self):
+        """A missing ffmpeg isn't re-probed until the lookup cache is cleared."""
+        fake_ffmpeg = self.test_path / "ffmpeg"
+        MediaScrubber._ffmpeg_cache_clear()
+        self.assertFalse(MediaScrubber._ffmpeg_available(str(fake_ffmpeg)))
 
-if __name__ == '__main__':
-    unittest.main()
+        fake_ffmpeg.write_text("#!/bin/sh\n")
+        fake_ffmpeg.chmod(0o755)
+        self.assertFalse(MediaScrubber._ffmpeg_available(str(fake_ffmpeg)))
+
+        MediaScrubber._ffmpeg_cache_clear()
+        self.assertTrue(MediaScrubber._ffmpeg_available(str(fake_ffmpeg)))
+
+    def test_batch_and_single_scrub_map_the_same_streams(self):
+        """A file gets the same stream maps whether or not it was batched."""
+        log = self.test_path / "args.log"
+        fake_ffmpeg = write_fake_ffmpeg(self.test_path, log=log)
+        for name in ("a.mp3", "b.mkv"):
+            (self.test_path / name).write_bytes(b"media")
+        out = self.test_path / "out"
+
+        def maps(index):
+            args = ffmpeg_calls(log)[index]
+            return [args[i + 1] for i, arg in enumerate(args) if arg == "-map"]
+
+        for name in ("a.mp3", "b.mkv"):
+            MediaScrubber.scrub(self.test_path / name, out / name, ffmpeg_cmd=str(fake_ffmpeg))
+        MediaScrubber.scrub_batch(
+            [(self.test_path / n, out / "batch" / n) for n in ("a.mp3", "b.mkv")],
+            ffmpeg_cmd=str(fake_ffmpeg),
+        )
+
+        self.assertEqual(maps(0), ["0:v:0?", "0:a:0?"])
+        self.assertEqual(maps(1), ["0:v:0?", "0:a:0?", "0:s:0?"])
+        self.assertEqual(maps(2), ["0:v:0?", "0:a:0?", "1:v:0?", "1:a:0?", "1:s:0?"])
+
+    def test_batch_failure_is_retried_in_halves(self):
+        """A bad file in a batch is isolated without one ffmpeg run per file."""
+        log = self.test_path / "calls.log"
+        fake_ffmpeg = write_fake_ffmpeg(self.test_path, log=log, fail_on="bad.mp3")
+
+        names = [f"track{n}.mp3" for n in range(15)] + ["bad.mp3"]
+        pairs = []
+        for name in names:
+            (self.test_path / name).write_bytes(b"audio")
+            pairs.append((self.test_path / name, self.test_path / "out" / name))
+
+        results = MediaScrubber.scrub_batch(pairs, ffmpeg_cmd=str(fake_ffmpeg))
+
+        self.assertEqual([r.result_type for r in results], [ResultType.SUCCESS] * 15 + [ResultType.ERROR])
+        self.assertIn("Invalid data", results[-1].error)
+        # 1 + 2 per halving level (16 -> 8 -> 4 -> 2 -> 1), not 1 + 16
+        self.assertEqual(len(ffmpeg_calls(log)), 9)
+        self.assertEqual(sorted(os.listdir(self.test_path / "out")), sorted(names[:15]))
+
+    def test_mp4_metadata_blanked_in_place(self):
+        """MP4 tags and timestamps are blanked without ffmpeg or moving any box."""
+        def box(box_type, payload):
+            return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+        # version 0 full boxes: flags, creation time, modification time, rest
+        mvhd = box(b"mvhd", bytes(4) + struct.pack(">II", 3600000000, 3600000001) + bytes(88))
+        tkhd = box(b"tkhd", bytes(4) + struct.pack(">II", 3600000002, 3600000003) + bytes(72))
+        udta = box(b"udta", box(b"\xa9nam", b"Secret title") + box(b"\xa9xyz", b"+51.5-000.1/"))
+        moov = box(b"moov", mvhd + box(b"trak", tkhd + udta) + udta)
+        data = box(b"ftyp", b"isom\x00\x00\x02\x00isom") + moov + box(b"mdat", b"sample data" * 10)
+
+        input_path = self.test_path / "input.mp4"
+        input_path.write_bytes(data)
+        output_path = self.test_path / "output.mp4"
+
+        result = MediaScrubber.scrub(input_path, output_path, ffmpeg_cmd="/nonexistent/ffmpeg")
+
+        self.assertEqual(result.result_type, ResultType.SUCCESS)
+        cleaned = output_path.read_bytes()
+        self.assertEqual(len(cleaned), len(data))
+        self.assertNotIn(b"Secret title", cleaned)
+        self.assertNotIn(b"udta", cleaned)
+        self.assertNotIn(struct.pack(">I", 3600000000), cleaned)
+        self.assertTrue(cleaned.endswith(box(b"mdat", b"sample data" * 10)))
+        self.assertEqual(cleaned[:8], data[:8])
+
+    def test_mp4_with_non_media_tracks_goes_to_ffmpeg(self):
+        """Timed-metadata tracks and track references aren't edited in place."""
+        def box(box_type, payload):
+            return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+        def trak(handler, extra=b""):
+            hdlr = box(b"hdlr", bytes(8) + handler + bytes(12) + b"\x00")
+            return box(b"trak", extra + box(b"mdia", hdlr))
+
+        mvhd = box(b"mvhd", bytes(100))
+        ftyp = box(b"ftyp", b"isom\x00\x00\x02\x00isom")
+        mdat = box(b"mdat", b"GPS5 +51.5-000.1" * 10)
+        cases = {
+            "video.mp4": (trak(b"vide") + trak(b"soun"), ResultType.SUCCESS),
+            "gopro.mp4": (trak(b"vide") + trak(b"meta"), ResultType.SKIP),
+            "chapters.mp4": (trak(b"vide", box(b"tref", box(b"chap", bytes(4)))), ResultType.SKIP),
+        }
+        for name, (tracks, expected) in cases.items():
+            input_path = self.test_path / name
+            input_path.write_bytes(ftyp + box(b"moov", mvhd + tracks) + mdat)
+
+            # A missing ffmpeg shows which files were handed to it
+            result = MediaScrubber.scrub(input_path, self.test_path / "out" / name, ffmpeg_cmd="/nonexistent/ffmpeg")
+
+            self.assertEqual(result.result_type, expected, name)
+
+
+def _run_test_case(name: str) -> Tuple[int, int]:
+    """Run one TestCase class in a pool worker; returns (errors, failures)."""
+    suite = unittest.TestLoader().loadTestsFromTestCase(globals()[name])
+    result = unittest.TextTestRunner().run(suite)
+    return len(result.errors), len(result.failures)
+
+
+def _main() -> int:
+    """Run the test classes in parallel, one process per class."""
+    names = [
+        name for name, obj in globals().items()
+        if name.startswith("Test") and isinstance(obj, type) and issubclass(obj, unittest.TestCase)
+    ]
+    # Processes rather than threads: each class has its own temp root and
+    # the scrubbers hold module-level state
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        outcomes = list(pool.map(_run_test_case, names))
+    return 1 if any(errors or failures for errors, failures in outcomes) else 0
 
 
 if __name__ == '__main__':
-    unittest.main()
+    sys.exit(_main())